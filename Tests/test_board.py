@@ -152,6 +152,21 @@ class TestBoard(TestCase):
                     f"Сущность {entity} не является экземпляром {entity_class.__name__}"
                 )
         
+    def test_count_entities_by_type(self):
+        """Тест подсчета сущностей по типам при размещении, перемещении и удалении."""
+        self.board.place_entity(Coordinates(1, 1), Herbivore(Coordinates(1, 1)))
+        self.board.place_entity(Coordinates(2, 2), Predator(Coordinates(2, 2)))
+        self.board.place_entity(Coordinates(3, 3), Grass(Coordinates(3, 3)))
+        self.board.move_entity(Coordinates(1, 1), Coordinates(1, 2))
+        self.board.remove_entity(Coordinates(3, 3))
+
+        self.assertEqual(self.board.count_entities_by_type(Herbivore), 1)
+        self.assertEqual(self.board.count_entities_by_type(Grass), 0)
+        self.assertEqual(self.board.count_entities_by_type(Entity), 2)
+
+        self.board.clear()
+        self.assertEqual(self.board.count_entities_by_type(Entity), 0)
+
     def test_clear_board(self):
         """Тест очистки доски."""
         # Размещаем несколько сущностей
@@ -0,0 +1,91 @@
+import unittest
+
+from src.simulation_from_chess import Board, Coordinates, Grass, Herbivore
+from src.simulation_from_chess.core.board_state import BoardState
+from src.simulation_from_chess.core.game_state import EntityState
+
+
+class TestBoardState(unittest.TestCase):
+    def setUp(self):
+        """Подготовка тестового окружения."""
+        self.board = Board(5, 5, history_retention=4, keyframe_interval=3)
+        self.herbivore = Herbivore(Coordinates(1, 1))
+        self.grass = Grass(Coordinates(5, 5))
+        self.board.place_entity(self.herbivore.coordinates, self.herbivore)
+        self.board.place_entity(self.grass.coordinates, self.grass)
+
+    def _play_turns(self, turns: int) -> dict:
+        """Ходы, в которых травоядное смещается вправо; возвращает состояния по ходам."""
+        expected = {}
+        for turn in range(turns):
+            old = self.herbivore.coordinates
+            new = Coordinates(old.x % 5 + 1, old.y)
+            self.board.move_entity(old, new)
+            expected[turn] = {
+                entity.entity_id: entity.get_state() for entity in self.board.entities.values()
+            }
+            self.board.next_turn()
+        return expected
+
+    def test_ids_assigned_at_placement(self):
+        """Сущности получают разные постоянные идентификаторы при размещении."""
+        self.assertEqual((self.herbivore.entity_id, self.grass.entity_id), (1, 2))
+        self.board.remove_entity(self.herbivore.coordinates)
+        self.board.place_entity(Coordinates(3, 3), self.herbivore)
+        self.assertEqual(self.herbivore.entity_id, 1)
+
+    def test_states_restored_from_keyframe_and_deltas(self):
+        """Состояние любого хода в окне восстанавливается из ключевого кадра и дельт."""
+        expected = self._play_turns(8)
+        history = self.board.game_state
+
+        self.assertLessEqual(history.first_turn, 8 - 4)
+        self.assertEqual(history.last_turn, 7)
+        for turn in range(history.first_turn, 8):
+            self.assertEqual(history.states_at(turn), expected[turn])
+            self.assertEqual(
+                history.get_entity_state(turn, self.herbivore.entity_id),
+                expected[turn][self.herbivore.entity_id]
+            )
+        self.assertIsNone(history.states_at(0))
+
+    def test_deltas_contain_only_changed_entities(self):
+        """Дельта хода содержит только изменившиеся и исчезнувшие сущности."""
+        self._play_turns(2)
+        self.board.remove_entity(self.grass.coordinates)
+        self.board.next_turn()
+
+        deltas = self.board.game_state._groups[-1].deltas
+        self.assertEqual(list(deltas[0].changed), [self.herbivore.entity_id])
+        self.assertEqual(deltas[1].changed, {})
+        self.assertEqual(deltas[1].removed, (self.grass.entity_id,))
+
+    def test_memory_bounded_by_retention(self):
+        """Количество хранимых ходов не превышает окно хранения плюс интервал кадров."""
+        self._play_turns(50)
+        history = self.board.game_state
+        self.assertLessEqual(history.last_turn - history.first_turn + 1, 4 + 3)
+
+    def test_current_turn_states(self):
+        """Состояния текущего хода сохраняются в буфер, записанная история не изменяется."""
+        history = BoardState(retention=2)
+        state = EntityState(coordinates=Coordinates(1, 1), hp=10)
+        history.save_entity_state(0, 1, state)
+        self.assertEqual(history.get_entity_state(0, 1), state)
+        history.record_turn({1: state})
+        with self.assertRaises(ValueError):
+            history.save_entity_state(0, 1, state)
+        self.assertIsNone(history.get_entity_state(1, 1))
+        self.assertEqual(history.get_entity_state(0, 1), state)
+
+    def test_disabled_history(self):
+        """При нулевом окне хранения история не записывается."""
+        board = Board(5, 5)
+        board.place_entity(Coordinates(1, 1), Grass(Coordinates(1, 1)))
+        board.next_turn()
+        self.assertEqual(board.game_state.current_turn, 1)
+        self.assertIsNone(board.game_state.states_at(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
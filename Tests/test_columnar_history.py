@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+from src.simulation_from_chess import Board, Coordinates, Grass, Herbivore, Predator
+from src.simulation_from_chess.core.columnar_history import (
+    ColumnarHistoryReader, ColumnarHistoryWriter, build_trajectory_index
+)
+
+
+class TestColumnarHistory(unittest.TestCase):
+    def setUp(self):
+        """Доска с травоядным, хищником и травой; каталог для файлов истории."""
+        self.board = Board(6, 6)
+        self.herbivore = Herbivore(Coordinates(1, 1))
+        self.predator = Predator(Coordinates(6, 6))
+        self.grass = Grass(Coordinates(3, 3))
+        for entity in [self.herbivore, self.predator, self.grass]:
+            self.board.place_entity(entity.coordinates, entity)
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _write_turns(self, turns: int, buffer_records: int = 4, keyframe_interval=None) -> None:
+        """Ходы, в которых травоядное идет вправо и теряет здоровье."""
+        with ColumnarHistoryWriter(self.directory, buffer_records=buffer_records,
+                                   keyframe_interval=keyframe_interval) as writer:
+            for turn in range(turns):
+                self.herbivore.planned_action = ("Планирует движение", "к траве")
+                writer.append_turn(turn, self.board)
+                old = self.herbivore.coordinates
+                self.board.move_entity(old, Coordinates(old.x + 1, old.y))
+                self.herbivore.take_damage(5)
+
+    def test_turn_range(self):
+        """Записи диапазона ходов читаются срезами столбцов."""
+        self._write_turns(4)
+        with ColumnarHistoryReader(self.directory) as reader:
+            self.assertEqual(reader.record_count, 12)
+            self.assertEqual(list(reader.turns), [0, 1, 2, 3])
+            records = reader.turn_range(1, 2)
+            self.assertEqual(list(records['turn']), [1, 1, 1, 2, 2, 2])
+
+            rows = [
+                index for index, entity_id in enumerate(records['entity_id'])
+                if entity_id == self.herbivore.entity_id
+            ]
+            self.assertEqual([records['x'][row] for row in rows], [2, 3])
+            self.assertEqual([records['hp'][row] for row in rows], [65, 60])
+            self.assertEqual(reader.actions[records['action'][rows[0]] - 1], "Планирует движение")
+            self.assertEqual(records['action'][rows[0] + 2], 0)
+            self.assertEqual(records['type_code'][rows[0]], Herbivore.type_code)
+            del records
+
+    def test_entity_records(self):
+        """Записи одной сущности находятся по идентификатору во всех ходах."""
+        self._write_turns(5)
+        with ColumnarHistoryReader(self.directory) as reader:
+            positions = reader.entity_records(self.herbivore.entity_id)
+            self.assertEqual([reader.column('turn')[p] for p in positions], [0, 1, 2, 3, 4])
+            self.assertEqual([reader.column('x')[p] for p in positions], [1, 2, 3, 4, 5])
+            self.assertEqual(len(reader.entity_records(999)), 0)
+
+    def test_trajectory(self):
+        """Траектория сущности за диапазон ходов читается из индекса непрерывным срезом."""
+        self._write_turns(5)
+        with ColumnarHistoryReader(self.directory) as reader:
+            with self.assertRaises(ValueError):
+                reader.trajectory(self.herbivore.entity_id)
+        # Пакеты по 4 записи: перестановка столбцов пересекает границы пакетов
+        build_trajectory_index(self.directory, chunk_records=4)
+
+        with ColumnarHistoryReader(self.directory) as reader:
+            trajectory = reader.trajectory(self.herbivore.entity_id, 1, 3)
+            self.assertEqual(list(trajectory['turn']), [1, 2, 3])
+            self.assertEqual(list(trajectory['x']), [2, 3, 4])
+            self.assertEqual(list(trajectory['hp']), [65, 60, 55])
+            self.assertEqual(list(reader.trajectory(self.grass.entity_id)['turn']), [0, 1, 2, 3, 4])
+            self.assertEqual(len(reader.trajectory(999)['turn']), 0)
+            del trajectory
+
+    def test_trajectory_with_keyframes_starts_from_state_at_first_turn(self):
+        """В режиме ключевых кадров траектория начинается с состояния на первом ходу диапазона."""
+        self._write_turns(5, keyframe_interval=3)
+        build_trajectory_index(self.directory)
+        with ColumnarHistoryReader(self.directory) as reader:
+            # Трава не меняется: записи только в ключевых кадрах 0 и 3
+            trajectory = reader.trajectory(self.grass.entity_id, 1, 4)
+            self.assertEqual(list(trajectory['turn']), [0, 3])
+            del trajectory
+
+    def test_reader_ignores_unflushed_records(self):
+        """Во время записи читаются только сброшенные на диск ходы."""
+        writer = ColumnarHistoryWriter(self.directory, buffer_records=6)
+        for turn in range(3):
+            writer.append_turn(turn, self.board)
+        with ColumnarHistoryReader(self.directory) as reader:
+            self.assertEqual(list(reader.turns), [0, 1])
+            self.assertEqual(reader.record_count, 6)
+        writer.close()
+        with ColumnarHistoryReader(self.directory) as reader:
+            self.assertEqual(reader.record_count, 9)
+
+    def test_turns_must_increase(self):
+        """Ход не может быть записан повторно."""
+        with ColumnarHistoryWriter(self.directory) as writer:
+            writer.append_turn(3, self.board)
+            with self.assertRaises(ValueError):
+                writer.append_turn(3, self.board)
+        self.assertTrue(os.path.exists(os.path.join(self.directory, 'meta.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
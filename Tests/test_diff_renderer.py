@@ -0,0 +1,84 @@
+import os
+import unittest
+from io import StringIO
+
+from src.simulation_from_chess.core.board import Board
+from src.simulation_from_chess.core.coordinates import Coordinates
+from src.simulation_from_chess.entities.grass import Grass
+from src.simulation_from_chess.entities.herbivore import Herbivore
+from src.simulation_from_chess.renderers.diff_console_renderer import DiffConsoleRenderer
+
+
+class TestDiffConsoleRenderer(unittest.TestCase):
+    def setUp(self) -> None:
+        """Доска 4x3 с травоядным и травой, рендерер с выводом в буфер."""
+        self.board = Board(4, 3)
+        self.board.place_entity(Coordinates(1, 1), Herbivore(Coordinates(1, 1)))
+        self.board.place_entity(Coordinates(3, 2), Grass(Coordinates(3, 2)))
+        self.stream = StringIO()
+        # Экран 40x10: поле 4x3 занимает 5 строк, курсор под ним - шестую
+        self.renderer = DiffConsoleRenderer(self.stream, terminal_size=os.terminal_size((40, 10)))
+
+    def test_first_frame_is_full(self):
+        """Первый кадр очищает экран и выводит все клетки."""
+        output = self.renderer.render(self.board)
+        self.assertTrue(output.startswith(DiffConsoleRenderer.CLEAR_SCREEN))
+        self.assertEqual(output.count(DiffConsoleRenderer.ANSI_RESET), 12)
+        self.assertIn("🐇", output)
+        self.assertIn("🌾", output)
+        self.assertEqual(self.stream.getvalue(), output)
+
+    def test_only_changed_cells_redrawn(self):
+        """Следующие кадры выводят только клетки с новым содержимым."""
+        self.renderer.render(self.board)
+        quiet = self.renderer.render(self.board)
+        self.assertEqual(quiet.count(DiffConsoleRenderer.ANSI_RESET), 0)
+
+        self.board.move_entity(Coordinates(1, 1), Coordinates(2, 1))
+        output = self.renderer.render(self.board)
+        self.assertEqual(output.count(DiffConsoleRenderer.ANSI_RESET), 2)
+        # Клетка (1, 1) - нижняя строка экрана (3), первая колонка клеток после номера строки
+        self.assertIn("\u001B[3;3H", output)
+        self.assertIn("\u001B[3;7H", output)
+        self.assertNotIn(DiffConsoleRenderer.CLEAR_SCREEN, output)
+
+    def test_cell_restored_within_frame_not_redrawn(self):
+        """Клетка, вернувшаяся к прежнему содержимому, не перерисовывается."""
+        self.renderer.render(self.board)
+        self.board.move_entity(Coordinates(1, 1), Coordinates(2, 1))
+        self.board.move_entity(Coordinates(2, 1), Coordinates(1, 1))
+        output = self.renderer.render(self.board)
+        self.assertEqual(output.count(DiffConsoleRenderer.ANSI_RESET), 0)
+
+    def test_bulk_change_redraws_full_frame(self):
+        """После массового изменения доски кадр выводится целиком."""
+        self.renderer.render(self.board)
+        self.board.clear()
+        output = self.renderer.render(self.board)
+        self.assertTrue(output.startswith(DiffConsoleRenderer.CLEAR_SCREEN))
+        self.assertNotIn("🐇", output)
+
+
+    def test_scrolled_screen_redraws_full_frame(self):
+        """После вывода, прокрутившего экран, кадр выводится целиком."""
+        self.renderer.render(self.board)
+        self.renderer.report_output_below("лог\n" * 4)  # Помещается: курсор в строке 10
+        self.board.move_entity(Coordinates(1, 1), Coordinates(2, 1))
+        self.assertNotIn(DiffConsoleRenderer.CLEAR_SCREEN, self.renderer.render(self.board))
+
+        # Длинная строка переносится: 3 + 2 строки экрана сдвигают поле вверх
+        self.renderer.report_output_below("лог\n" * 3 + "x" * 50 + "\n")
+        self.board.move_entity(Coordinates(2, 1), Coordinates(1, 1))
+        output = self.renderer.render(self.board)
+        self.assertTrue(output.startswith(DiffConsoleRenderer.CLEAR_SCREEN))
+        self.assertIn("🐇", output)
+
+    def test_board_taller_than_screen_always_full(self):
+        """Поле выше экрана выводится целиком в каждом кадре."""
+        renderer = DiffConsoleRenderer(StringIO(), terminal_size=os.terminal_size((40, 5)))
+        renderer.render(self.board)
+        self.assertTrue(renderer.render(self.board).startswith(DiffConsoleRenderer.CLEAR_SCREEN))
+
+
+if __name__ == '__main__':
+    unittest.main()
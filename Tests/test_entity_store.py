@@ -0,0 +1,99 @@
+import unittest
+
+from src.simulation_from_chess import Board, Coordinates, Grass, Herbivore, Predator, Stone
+from src.simulation_from_chess.core.entity_store import EntityStore
+
+
+class TestEntityStore(unittest.TestCase):
+    def setUp(self):
+        """Подготовка тестового окружения."""
+        self.board = Board(5, 5)
+        self.store = self.board.store
+
+    def test_columns_follow_entity(self):
+        """Поля размещенного существа хранятся в столбцах и меняются через объект."""
+        herbivore = Herbivore(Coordinates(1, 1))
+        self.board.place_entity(herbivore.coordinates, herbivore)
+        row = herbivore._row
+
+        self.assertEqual(self.store.type_codes[row], Herbivore.type_code)
+        self.assertEqual(self.store.hp[row], herbivore.hp)
+        self.assertEqual(self.store.food_value[row], herbivore.food_value)
+
+        herbivore.take_damage(3)
+        self.assertEqual(self.store.hp[row], herbivore.max_hp - 3)
+
+        # Массовое изменение столбца видно через объект
+        self.store.hp[row] = 1
+        self.assertEqual(herbivore.hp, 1)
+
+        self.board.move_entity(Coordinates(1, 1), Coordinates(2, 3))
+        self.assertEqual((self.store.xs[row], self.store.ys[row]), (2, 3))
+
+    def test_detach_keeps_values(self):
+        """После удаления с доски сущность сохраняет значения, а строка переиспользуется."""
+        predator = Predator(Coordinates(2, 2))
+        self.board.place_entity(predator.coordinates, predator)
+        predator.hp = 7
+        row = predator._row
+
+        self.board.remove_entity(predator.coordinates)
+        self.assertEqual(predator.hp, 7)
+        self.assertEqual(self.store.type_codes[row], EntityStore.FREE_ROW)
+        self.assertEqual(len(self.store), 0)
+
+        grass = Grass(Coordinates(3, 3))
+        self.board.place_entity(grass.coordinates, grass)
+        self.assertEqual(grass._row, row)
+        self.assertEqual(self.store.food_value[row], EntityStore.NO_FOOD_VALUE)
+
+    def test_clear(self):
+        """Освобождение всех строк при очистке доски."""
+        stone = Stone(Coordinates(1, 2))
+        herbivore = Herbivore(Coordinates(4, 4))
+        self.board.place_entity(stone.coordinates, stone)
+        self.board.place_entity(herbivore.coordinates, herbivore)
+        herbivore.hp = 5
+
+        self.board.clear()
+        self.assertEqual(len(self.store), 0)
+        self.assertIsNone(herbivore._store)
+        self.assertEqual(herbivore.hp, 5)
+
+    def test_lazy_hunger(self):
+        """Голод уменьшает здоровье без обхода существ, гибель извлекается из очереди."""
+        weak = Herbivore(Coordinates(1, 1))
+        strong = Predator(Coordinates(2, 2))
+        grass = Grass(Coordinates(3, 3))
+        for entity in (weak, strong, grass):
+            self.board.place_entity(entity.coordinates, entity)
+        weak.hp = 3
+        strong_hp = strong.hp
+
+        self.assertEqual(self.store.drain_hunger(2), [])
+        self.assertEqual(weak.hp, 1)
+        self.assertEqual(strong.hp, strong_hp - 2)
+
+        # Лечение переносит момент гибели
+        weak.heal(2)
+        self.assertEqual(self.store.drain_hunger(2), [])
+        self.assertEqual(self.store.drain_hunger(2), [weak._row])
+        self.assertEqual(weak.hp, -1)
+        self.assertEqual(self.store.hp[grass._row], 0)
+
+        # После удаления с доски здоровье фиксируется в объекте
+        self.board.remove_entity(weak.coordinates)
+        self.store.drain_hunger(2)
+        self.assertEqual(weak.hp, -1)
+
+    def test_entities_without_dict(self):
+        """Сущности и записи состояния хранят атрибуты в слотах, без __dict__."""
+        coordinates = Coordinates(1, 1)
+        for entity in (Grass(coordinates), Stone(coordinates), Herbivore(coordinates), Predator(coordinates)):
+            self.assertFalse(hasattr(entity, '__dict__'), type(entity).__name__)
+        self.assertFalse(hasattr(coordinates, '__dict__'))
+        self.assertFalse(hasattr(Herbivore(coordinates).get_state(), '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
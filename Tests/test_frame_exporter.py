@@ -0,0 +1,88 @@
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+from src.simulation_from_chess.core.board import Board
+from src.simulation_from_chess.core.coordinates import Coordinates
+from src.simulation_from_chess.entities.grass import Grass
+from src.simulation_from_chess.entities.herbivore import Herbivore
+from src.simulation_from_chess.entities.predator import Predator
+from src.simulation_from_chess.renderers.frame_exporter import FrameExporter
+
+
+class TestFrameExporter(unittest.TestCase):
+    def setUp(self) -> None:
+        """Доска 4x3: травоядное в (1, 1), хищник в (4, 3), трава в (2, 2)."""
+        self.board = Board(4, 3)
+        for entity in [Herbivore(Coordinates(1, 1)), Predator(Coordinates(4, 3)), Grass(Coordinates(2, 2))]:
+            self.board.place_entity(entity.coordinates, entity)
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._directory.name, 'frames')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    @staticmethod
+    def _pixel(rgb: bytes, width: int, column: int, row: int) -> tuple:
+        """Цвет пикселя (column, row) от левого верхнего угла."""
+        start = (row * width + column) * 3
+        return tuple(rgb[start:start + 3])
+
+    def test_ppm_frames_every_k_turns(self):
+        """В поток PPM записывается каждый every-й ход; верхняя строка кадра - y = height."""
+        with FrameExporter(self.path, every=2) as exporter:
+            captured = [exporter.capture(self.board, turn) for turn in range(5)]
+        self.assertEqual(captured, [True, False, True, False, True])
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        header = b'P6\n4 3\n255\n'
+        frame = len(header) + 4 * 3 * 3
+        self.assertEqual(len(data), 3 * frame)
+        self.assertTrue(data.startswith(header))
+
+        rgb = data[len(header):frame]
+        colors = FrameExporter.ENTITY_COLORS
+        self.assertEqual(self._pixel(rgb, 4, 0, 2), colors[Herbivore])
+        self.assertEqual(self._pixel(rgb, 4, 3, 0), colors[Predator])
+        self.assertEqual(self._pixel(rgb, 4, 1, 1), colors[Grass])
+        # Пустые клетки в шахматном порядке: (2, 1) светлая, (3, 1) темная
+        self.assertEqual(self._pixel(rgb, 4, 1, 2), FrameExporter.EMPTY_COLORS[0])
+        self.assertEqual(self._pixel(rgb, 4, 2, 2), FrameExporter.EMPTY_COLORS[1])
+
+    def test_scaled_raw_frame(self):
+        """Масштаб увеличивает каждую клетку до квадрата scale x scale пикселей."""
+        with FrameExporter(self.path, frame_format=FrameExporter.FORMAT_RAW, scale=2) as exporter:
+            exporter.capture(self.board, 0)
+        with open(self.path, 'rb') as file:
+            rgb = file.read()
+        self.assertEqual(len(rgb), 8 * 6 * 3)
+        self.assertEqual(exporter.frame_size, (8, 6))
+        for column, row in [(0, 4), (1, 4), (0, 5), (1, 5)]:
+            self.assertEqual(self._pixel(rgb, 8, column, row), FrameExporter.ENTITY_COLORS[Herbivore])
+        self.assertEqual(self._pixel(rgb, 8, 2, 5), FrameExporter.EMPTY_COLORS[0])
+
+    def test_png_frame(self):
+        """PNG-кадр содержит те же пиксели, что и RAW."""
+        with FrameExporter(self.path, frame_format=FrameExporter.FORMAT_PNG) as exporter:
+            exporter.capture(self.board, 0)
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        self.assertTrue(data.startswith(b'\x89PNG\r\n\x1a\n'))
+        (length,) = struct.unpack('>I', data[33:37])
+        self.assertEqual(data[37:41], b'IDAT')
+        rows = zlib.decompress(data[41:41 + length])
+        rgb = b''.join(rows[start + 1:start + 13] for start in range(0, len(rows), 13))
+        self.assertEqual(self._pixel(rgb, 4, 3, 0), FrameExporter.ENTITY_COLORS[Predator])
+
+    def test_closed_exporter(self):
+        """После закрытия кадры не принимаются."""
+        exporter = FrameExporter(self.path)
+        exporter.close()
+        with self.assertRaises(ValueError):
+            exporter.capture(self.board, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
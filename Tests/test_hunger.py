@@ -9,6 +9,7 @@ from src.simulation_from_chess.entities.grass import Grass
 from src.simulation_from_chess.entities.herbivore import Herbivore
 from src.simulation_from_chess.entities.predator import Predator
 from src.simulation_from_chess.config import CREATURE_CONFIG
+from src.simulation_from_chess.utils.events import EventCode
 
 class TestHunger(unittest.TestCase):
     def setUp(self) -> None:
@@ -138,8 +139,24 @@ class TestHunger(unittest.TestCase):
         self.hunger_action.execute(self.board, self.logger)
         
         # Проверяем логирование смерти
-        self.logger.log_action.assert_called_with(
+        self.logger.emit.assert_called_with(
+            EventCode.STARVED,
             herbivore,
-            "Погиб",
-            f"от голода на координатах ({herbivore.coordinates.x}, {herbivore.coordinates.y})"
-        )
\ No newline at end of file
+            herbivore.coordinates.x,
+            herbivore.coordinates.y
+        )
+
+    def test_death_from_other_cause_not_logged_as_starvation(self) -> None:
+        """Существо, погибшее до урона от голода (например, в атаке), не записывается умершим от голода."""
+        herbivore = Herbivore(Coordinates(1, 1))
+        self._setup_entities([(herbivore, herbivore.coordinates)])
+        herbivore.take_damage(herbivore.hp)
+
+        self.hunger_action.execute(self.board, self.logger)
+
+        self.logger.emit.assert_called_once_with(
+            EventCode.DIED,
+            herbivore,
+            herbivore.coordinates.x,
+            herbivore.coordinates.y
+        )
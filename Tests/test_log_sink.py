@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from src.simulation_from_chess import Board, Coordinates, Herbivore, Predator
+from src.simulation_from_chess.utils.events import EventCode
+from src.simulation_from_chess.utils.log_sink import LogSink, read_binary_log
+from src.simulation_from_chess.utils.logger import Logger
+
+
+class TestLogSink(unittest.TestCase):
+    def setUp(self):
+        """Размещенные травоядное и хищник (с идентификаторами) и каталог для журналов."""
+        board = Board(5, 5)
+        self.herbivore = Herbivore(Coordinates(1, 1))
+        self.predator = Predator(Coordinates(2, 2))
+        board.place_entity(self.herbivore.coordinates, self.herbivore)
+        board.place_entity(self.predator.coordinates, self.predator)
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _log_turns(self, sink: LogSink) -> None:
+        """Два хода событий через логгер: перемещение, смерть от хищника и системное сообщение."""
+        logger = Logger()
+        logger.keep_text = False
+        logger.add_sink(sink)
+        logger.emit(EventCode.MOVED, self.herbivore, 1, 1, 1, 2)
+        logger.log_action(None, "Система", "ход 0")
+        logger.end_turn(0)
+        logger.log_action(self.herbivore, "Погиб", "", killer=self.predator)
+        logger.end_turn(1)
+        sink.close()
+
+    def test_jsonl(self):
+        """События записываются строками JSON с идентификаторами сущностей."""
+        path = os.path.join(self.directory, 'log.jsonl')
+        sink = LogSink(path)
+        self._log_turns(sink)
+        with open(path, encoding='utf-8') as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual(sink.written, 3)
+        self.assertEqual(lines[0], {
+            'turn': 0, 'event': 'MOVED', 'entity': self.herbivore.entity_id,
+            'type': 'Herbivore', 'payload': [1, 1, 1, 2]
+        })
+        self.assertEqual(lines[1]['event'], 'SYSTEM')
+        self.assertIsNone(lines[1]['entity'])
+        self.assertEqual(lines[2]['payload'], ["Погиб", "", self.predator.entity_id])
+
+    def test_binary(self):
+        """Двоичный журнал читается обратно теми же событиями."""
+        path = os.path.join(self.directory, 'log.bin')
+        self._log_turns(LogSink(path, log_format=LogSink.FORMAT_BINARY))
+        self.assertEqual(list(read_binary_log(path)), [
+            (0, EventCode.MOVED, self.herbivore.entity_id, Herbivore.type_code, (1, 1, 1, 2)),
+            (0, EventCode.SYSTEM, -1, None, ("Система", "ход 0")),
+            (1, EventCode.KILLED, self.herbivore.entity_id, Herbivore.type_code,
+             ("Погиб", "", self.predator.entity_id)),
+        ])
+
+    def test_drop_policy(self):
+        """При заполненной очереди политика 'drop' отбрасывает пакеты, не останавливая ход."""
+        path = os.path.join(self.directory, 'log.jsonl')
+        sink = LogSink(path, policy=LogSink.POLICY_DROP, queue_size=1)
+        release = threading.Event()
+        encode = sink._encode
+
+        def slow_encode(turn, events):
+            release.wait()
+            return encode(turn, events)
+
+        sink._encode = slow_encode
+        event = (EventCode.DIED, self.herbivore, (1, 1))
+        for turn in range(5):
+            sink.submit(turn, [event])
+        release.set()
+        sink.close()
+        # Поток держит один пакет, еще один ждет в очереди, остальные отброшены
+        self.assertGreaterEqual(sink.dropped, 3)
+        self.assertEqual(sink.dropped + sink.written, 5)
+        with self.assertRaises(ValueError):
+            sink.submit(5, [event])
+
+    def test_invalid_format(self):
+        """Неизвестный формат журнала отклоняется."""
+        with self.assertRaises(ValueError):
+            LogSink(os.path.join(self.directory, 'log'), log_format='xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
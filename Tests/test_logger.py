@@ -4,6 +4,8 @@ from src.simulation_from_chess.entities.herbivore import Herbivore
 from src.simulation_from_chess.entities.predator import Predator
 from src.simulation_from_chess.core.coordinates import Coordinates
 from src.simulation_from_chess.entities.grass import Grass
+from src.simulation_from_chess.utils.events import EventCode
+from src.simulation_from_chess.core.board import Board
 
 class TestLogger(TestCase):
     def setUp(self):
@@ -120,4 +122,68 @@ class TestLogger(TestCase):
         self.assertEqual(
             self.logger.creatures_state[str(herbivore)]['action'],
             "Планирует движение к Grass на (2, 2)"
-        )
\ No newline at end of file
+        )
+
+    def test_event_formatted_on_read(self):
+        """Тест отложенного форматирования структурированного события."""
+        self.logger.emit(EventCode.MOVED, self.herbivore, 1, 1, 1, 2)
+        # До чтения журнала событие хранится без текста
+        self.assertEqual(len(self.logger._events), 1)
+        self.assertEqual(
+            self.logger.creatures_state[str(self.herbivore)]['action'],
+            "Переместился с (1, 1) на (1, 2)"
+        )
+        self.assertEqual(self.logger._events, [])
+
+    def test_killed_event_mentions_killer(self):
+        """Тест текста смерти от другого существа."""
+        self.logger.log_action(self.herbivore, "Погиб", "", killer=self.predator)
+        self.assertEqual(
+            self.logger.creatures_state[str(self.herbivore)]['action'],
+            f"Погиб  (убит существом {self.predator})"
+        )
+
+    def test_disabled_logger_records_nothing(self):
+        """Тест отключенного журнала: события и состояния не записываются."""
+        self.logger.enabled = False
+        self.logger.log_action(self.herbivore, "Действие", "детали")
+        self.logger.log_action(None, "Система", "сообщение")
+        self.logger.emit(EventCode.DIED, self.predator, 2, 2)
+        self.logger.log_creatures_state({self.herbivore.coordinates: self.herbivore})
+        self.assertEqual(self.logger._events, [])
+        self.assertEqual(self.logger.creatures_state, {})
+        self.assertEqual(self.logger.system_logs, [])
+
+    def test_sync_board_tracks_changes(self):
+        """Тест синхронизации с доской: появление, перемещение и удаление существ."""
+        board = Board(5, 5)
+        board.place_entity(self.herbivore.coordinates, self.herbivore)
+        board.place_entity(Coordinates(4, 4), Grass(Coordinates(4, 4)))
+        self.logger.sync_board(board)
+        self.assertEqual(list(self.logger.creatures_state), [str(self.herbivore)])
+
+        self.logger.log_action(self.herbivore, "Действие", "детали")
+        board.place_entity(self.predator.coordinates, self.predator)
+        board.move_entity(Coordinates(1, 1), Coordinates(1, 2))
+        self.logger.sync_board(board)
+        state = self.logger.creatures_state
+        self.assertEqual(set(state), {str(self.herbivore), str(self.predator)})
+        self.assertEqual(state[str(self.herbivore)]['coordinates'], Coordinates(1, 2))
+        self.assertEqual(state[str(self.herbivore)]['action'], "Действие детали")
+
+        # Строка погибшего существа удаляется при следующей синхронизации
+        self.logger.log_action(self.herbivore, "Погиб", "", killer=self.predator)
+        board.remove_entity(Coordinates(1, 2))
+        self.assertIn(str(self.herbivore), self.logger.creatures_state)
+        self.logger.sync_board(board)
+        self.assertEqual(list(self.logger.creatures_state), [str(self.predator)])
+
+    def test_sync_board_after_clear(self):
+        """Тест полной перестройки после массового изменения доски."""
+        board = Board(5, 5)
+        board.place_entity(self.herbivore.coordinates, self.herbivore)
+        self.logger.sync_board(board)
+        board.clear()
+        board.place_entity(self.predator.coordinates, self.predator)
+        self.logger.sync_board(board)
+        self.assertEqual(list(self.logger.creatures_state), [str(self.predator)])
@@ -0,0 +1,73 @@
+import random
+import unittest
+
+from src.simulation_from_chess import Board, Coordinates, Herbivore, Stone
+from src.simulation_from_chess.core.move_resolver import MoveRequest, MoveResolver
+
+
+class TestMoveResolver(unittest.TestCase):
+    def setUp(self):
+        """Подготовка тестового окружения."""
+        self.board = Board(5, 5)
+        self.resolver = MoveResolver(random.Random(0))
+
+    def _place(self, x, y):
+        creature = Herbivore(Coordinates(x, y))
+        self.board.place_entity(creature.coordinates, creature)
+        return creature
+
+    def _request(self, creature, x, y, priority=0):
+        return MoveRequest(creature, creature.coordinates, Coordinates(x, y), priority)
+
+    def test_conflict_resolved_by_priority(self):
+        """За одну клетку побеждает заявка с более высоким приоритетом."""
+        first = self._place(1, 2)
+        second = self._place(3, 2)
+
+        moved = self.resolver.resolve(self.board, [
+            self._request(first, 2, 2, priority=50),
+            self._request(second, 2, 2, priority=10),
+        ])
+
+        self.assertEqual(moved, {first: False, second: True})
+        self.assertIs(self.board.get_entity(Coordinates(2, 2)), second)
+        self.assertIs(self.board.get_entity(Coordinates(1, 2)), first)
+        self.assertEqual(self.resolver.stats['conflicts'], 1)
+
+    def test_random_tiebreak_is_reproducible(self):
+        """При равном приоритете победитель определяется генератором и повторяется при том же зерне."""
+        winners = []
+        for _ in range(2):
+            board = Board(5, 5)
+            creatures = []
+            for x in (1, 3):
+                creature = Herbivore(Coordinates(x, 2))
+                board.place_entity(creature.coordinates, creature)
+                creatures.append(creature)
+            moved = MoveResolver(random.Random(7)).resolve(board, [
+                MoveRequest(creature, creature.coordinates, Coordinates(2, 2), 0) for creature in creatures
+            ])
+            self.assertEqual(sum(moved.values()), 1)
+            winners.append([moved[creature] for creature in creatures])
+        self.assertEqual(winners[0], winners[1])
+
+    def test_occupied_target_blocked(self):
+        """Заявка в занятую клетку отклоняется, даже если занявшее ее существо уходит."""
+        self.board.place_entity(Coordinates(3, 3), Stone(Coordinates(3, 3)))
+        blocked = self._place(2, 3)
+        leader = self._place(2, 1)
+        follower = self._place(1, 1)
+
+        moved = self.resolver.resolve(self.board, [
+            self._request(blocked, 3, 3),
+            self._request(leader, 3, 1),
+            self._request(follower, 2, 1),
+        ])
+
+        self.assertEqual(moved, {blocked: False, follower: False, leader: True})
+        self.assertIs(self.board.get_entity(Coordinates(1, 1)), follower)
+        self.assertIs(self.board.get_entity(Coordinates(3, 1)), leader)
+        self.assertEqual(self.resolver.stats['blocked'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
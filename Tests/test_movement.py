@@ -1,5 +1,7 @@
 import unittest
 from typing import List
+from src.simulation_from_chess.actions.hunger_action import HungerAction
+from src.simulation_from_chess.actions.move_action import MoveAction
 from src.simulation_from_chess.core.board import Board
 from src.simulation_from_chess.core.coordinates import Coordinates
 from src.simulation_from_chess.entities.herbivore import Herbivore
@@ -222,5 +224,110 @@ class TestMovement(unittest.TestCase):
         )
         self.assertLessEqual(manhattan_distance, herbivore.speed)
 
+    def test_make_move_reports_successful_move(self) -> None:
+        """Успешное перемещение не должно логироваться как заблокированный путь."""
+        herbivore = Herbivore(Coordinates(1, 1))
+        herbivore.take_damage(30)
+        self._setup_entities([
+            (herbivore, herbivore.coordinates),
+            (Grass(Coordinates(1, 5)), Coordinates(1, 5))
+        ])
+
+        result = herbivore.make_move(self.board)
+
+        self.assertEqual(result, [("Переместился", Coordinates(1, 2))])
+        self.assertEqual(herbivore.coordinates, Coordinates(1, 2))
+
+    def test_resting_creature_sleeps_until_hungry(self) -> None:
+        """Сытое существо пропускает фазы движения, пока голод не сделает его голодным."""
+        herbivore = Herbivore(Coordinates(1, 1))
+        grass = Grass(Coordinates(5, 5))
+        self._setup_entities([
+            (herbivore, herbivore.coordinates),
+            (grass, grass.coordinates)
+        ])
+        move_action = MoveAction()
+        hunger_action = HungerAction(hunger_damage=5)
+        resting = self.board.store.resting
+
+        # Планирование: существо сыто и засыпает
+        move_action.execute(self.board, self.logger)
+        self.assertIn(herbivore._row, resting)
+        self.assertEqual(move_action.planned_entities, [])
+
+        # Пока голод не наступил, существо спит и не двигается
+        move_action.execute(self.board, self.logger)
+        self.assertEqual(herbivore.coordinates, Coordinates(1, 1))
+        self.assertIn(herbivore._row, resting)
+
+        # Травоядному нужна еда при любом недостатке здоровья (needs_food):
+        # первый же урон от голода будит его, и оно идет к траве
+        hunger_action.execute(self.board, self.logger)
+        self.assertTrue(herbivore.needs_food())
+        move_action.execute(self.board, self.logger)
+        self.assertNotIn(herbivore._row, resting)
+        self.assertEqual(move_action.planned_entities, [herbivore])
+        move_action.execute(self.board, self.logger)
+        self.assertNotEqual(herbivore.coordinates, Coordinates(1, 1))
+
+    def test_plan_reused_until_neighborhood_changes(self) -> None:
+        """План фазы планирования переиспользуется, пока не появилась более близкая цель."""
+        herbivore = Herbivore(Coordinates(1, 1))
+        herbivore.take_damage(30)  # Голодное травоядное
+        self._setup_entities([
+            (herbivore, herbivore.coordinates),
+            (Grass(Coordinates(5, 5)), Coordinates(5, 5))
+        ])
+        move_action = MoveAction()
+
+        # Доска не менялась между фазами: план используется без пересчета
+        move_action.execute(self.board, self.logger)
+        move_action.execute(self.board, self.logger)
+        self.assertEqual(move_action.plan_stats, {'reused': 1, 'replanned': 0})
+        moved_to = herbivore.coordinates
+        self.assertEqual(
+            abs(moved_to.x - 5) + abs(moved_to.y - 5), 7,
+            "Травоядное должно сделать шаг к траве"
+        )
+
+        # Появилась трава ближе цели из плана: план пересчитывается и существо идет к ней
+        move_action.execute(self.board, self.logger)
+        near_grass = Coordinates(moved_to.x, moved_to.y + 2)
+        self.board.place_entity(near_grass, Grass(near_grass))
+        move_action.execute(self.board, self.logger)
+        self.assertEqual(move_action.plan_stats, {'reused': 1, 'replanned': 1})
+        self.assertEqual(herbivore.coordinates, Coordinates(moved_to.x, moved_to.y + 1))
+
+    def test_parallel_planning_matches_sequential(self) -> None:
+        """Планы, рассчитанные несколькими потоками по снимку доски, совпадают с последовательными."""
+        creatures = []
+        for x in range(1, 6):
+            herbivore = Herbivore(Coordinates(x, 1))
+            herbivore.take_damage(10)
+            predator = Predator(Coordinates(x, 5))
+            predator.take_damage(10)
+            creatures += [herbivore, predator]
+        self._setup_entities([(creature, creature.coordinates) for creature in creatures])
+        self._setup_entities([
+            (Grass(Coordinates(2, 3)), Coordinates(2, 3)),
+            (Grass(Coordinates(4, 3)), Coordinates(4, 3)),
+            (Stone(Coordinates(3, 3)), Coordinates(3, 3))
+        ])
+
+        path_finder = self.board.path_finder
+        calls_before = path_finder.call_count
+        sequential = MoveAction().plan_creatures(self.board, creatures)
+        sequential_calls = path_finder.call_count - calls_before
+        parallel_action = MoveAction(planning_workers=3)
+        try:
+            parallel = parallel_action.plan_creatures(self.board, creatures)
+        finally:
+            parallel_action.shutdown()
+        self.assertEqual(parallel, sequential)
+        # Запросы к поиску пути снимка учтены в счетчике доски
+        self.assertEqual(path_finder.call_count - calls_before, 2 * sequential_calls)
+        with self.assertRaises(ValueError):
+            MoveAction(planning_workers=0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from src.simulation_from_chess import (
+    Simulation,
+    Coordinates,
+    Herbivore,
+    Grass,
+    MoveAction,
+    HungerAction,
+    TurnProfiler
+)
+from src.simulation_from_chess.utils.profiler import LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles(self):
+        """Тест оценки перцентилей с ограниченной относительной погрешностью."""
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(value)
+
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.max, 1000)
+        for percent, expected in [(50, 500), (95, 950), (99, 990)]:
+            estimate = histogram.percentile(percent)
+            self.assertGreaterEqual(estimate, expected)
+            self.assertLessEqual(estimate, expected * 17 / 16)
+
+    def test_small_values_are_exact(self):
+        """Тест точного хранения малых значений."""
+        histogram = LatencyHistogram()
+        for value in [0, 3, 3, 7]:
+            histogram.record(value)
+        self.assertEqual(histogram.percentile(50), 3)
+        self.assertEqual(histogram.percentile(100), 7)
+
+    def test_empty_histogram(self):
+        """Тест пустой гистограммы."""
+        self.assertEqual(LatencyHistogram().percentile(99), 0)
+
+
+class TestTurnProfiler(unittest.TestCase):
+    def test_simulation_stages_profiled(self):
+        """Тест замера всех стадий хода симуляции."""
+        profiler = TurnProfiler(summary_interval=2)
+        simulation = Simulation(size=5, profiler=profiler)
+        herbivore = Herbivore(Coordinates(1, 1))
+        herbivore.take_damage(10)
+        simulation.place_entity(herbivore, herbivore.coordinates)
+        simulation.board.place_entity(Coordinates(4, 4), Grass(Coordinates(4, 4)))
+        simulation.turn_actions = [MoveAction(), HungerAction(hunger_damage=1)]
+
+        with patch('sys.stdout', new=StringIO()) as output:
+            for _ in range(4):
+                simulation.next_turn()
+
+        stats = profiler.get_stats()
+        self.assertEqual(
+            set(stats['timings']),
+            {'MoveAction', 'HungerAction', 'render', 'logger'}
+        )
+        for summary in stats['timings'].values():
+            self.assertEqual(summary['count'], 4)
+            self.assertLessEqual(summary['p50'], summary['max'])
+
+        self.assertEqual(stats['counters'][TurnProfiler.PATHFINDER_STAGE]['count'], 4)
+        self.assertGreater(stats['counters'][TurnProfiler.PATHFINDER_STAGE]['total'], 0)
+        self.assertGreater(stats['counters'][TurnProfiler.MUTATIONS_STAGE]['total'], 0)
+        self.assertEqual(output.getvalue().count("Профиль за"), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from benchmarks.regression_gate import compare_metric, mann_whitney_greater, min_samples
+
+
+class TestMannWhitney(unittest.TestCase):
+    def test_exact_p_values(self):
+        """Точные p-value для малых выборок по распределению U."""
+        # Все значения sample больше: U = 9 - одна перестановка из C(6, 3) = 20
+        self.assertAlmostEqual(mann_whitney_greater([4, 5, 6], [1, 2, 3]), 1 / 20)
+        self.assertAlmostEqual(mann_whitney_greater([1, 2, 3], [4, 5, 6]), 1.0)
+        # U = 6: значения U от 6 до 9 встречаются 3 + 2 + 1 + 1 раз
+        self.assertAlmostEqual(mann_whitney_greater([2, 4, 6], [1, 3, 5]), 7 / 20)
+        # Совпадения - половина победы: U = 2, P(U >= 2) для выборок 2 и 2 равно 4 / 6
+        self.assertAlmostEqual(mann_whitney_greater([1, 2], [1, 2]), 4 / 6)
+
+    def test_empty_and_large_samples(self):
+        """Пустая выборка не значима; большие выборки считаются нормальным приближением."""
+        self.assertEqual(mann_whitney_greater([], [1, 2, 3]), 1.0)
+        reference = list(range(25))
+        self.assertLess(mann_whitney_greater([value + 100 for value in reference], reference), 1e-6)
+        self.assertGreater(mann_whitney_greater(reference, reference), 0.4)
+
+
+class TestCompareMetric(unittest.TestCase):
+    def test_regressed_duration(self):
+        """Рост времени больше допуска на значимой разнице - регрессия."""
+        result = compare_metric('move.mean_us', [100, 101, 99, 100, 102], [130, 131, 129, 132, 128],
+                                higher_is_better=False, tolerance=0.10, alpha=0.05)
+        self.assertTrue(result['regression'])
+        self.assertAlmostEqual(result['change'], 0.30)
+        self.assertAlmostEqual(result['p_value'], 1 / 252)
+        self.assertTrue(result['samples_checked'])
+
+    def test_regressed_throughput(self):
+        """Падение ходов в секунду больше допуска - регрессия."""
+        result = compare_metric('turns_per_sec', [50, 51, 52, 53], [40, 41, 42, 43],
+                                higher_is_better=True, tolerance=0.10, alpha=0.05)
+        self.assertTrue(result['regression'])
+        self.assertAlmostEqual(result['p_value'], 1 / 70)
+
+    def test_unchanged_metric(self):
+        """Неизменная метрика не считается регрессией."""
+        result = compare_metric('turns_per_sec', [50, 51, 52, 53], [51, 50, 53, 52],
+                                higher_is_better=True, tolerance=0.10, alpha=0.05)
+        self.assertFalse(result['regression'])
+        self.assertEqual(result['change'], 0.0)
+
+    def test_insignificant_or_within_tolerance(self):
+        """Регрессии нет, если разница незначима или не превышает допуск."""
+        # Медиана упала больше допуска, но выборки перекрываются
+        result = compare_metric('turns_per_sec', [50, 51, 52, 53], [38, 55, 39, 56],
+                                higher_is_better=True, tolerance=0.10, alpha=0.05)
+        self.assertTrue(result['samples_checked'])
+        self.assertGreater(result['p_value'], 0.05)
+        self.assertFalse(result['regression'])
+        # Значимое, но малое ухудшение
+        result = compare_metric('move.mean_us', [100, 100, 100, 100], [105, 105, 105, 105],
+                                higher_is_better=False, tolerance=0.10, alpha=0.05)
+        self.assertFalse(result['regression'])
+
+    def test_unreachable_significance_uses_tolerance(self):
+        """При трех повторах p < 0.05 недостижимо: падение на 20% определяется по допуску."""
+        self.assertEqual(min_samples(0.05), 4)
+        self.assertEqual(min_samples(0.01), 5)
+        result = compare_metric('turns_per_sec', [50, 51, 52], [40, 41, 42],
+                                higher_is_better=True, tolerance=0.10, alpha=0.05)
+        self.assertFalse(result['samples_checked'])
+        self.assertTrue(result['regression'])
+
+    def test_few_samples_use_tolerance_only(self):
+        """При малом числе повторов решение принимается только по допуску."""
+        result = compare_metric('turns_per_sec', [50, 52], [40, 42],
+                                higher_is_better=True, tolerance=0.10, alpha=0.05)
+        self.assertFalse(result['samples_checked'])
+        self.assertTrue(result['regression'])
+
+
+if __name__ == '__main__':
+    unittest.main()
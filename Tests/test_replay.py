@@ -0,0 +1,83 @@
+import tempfile
+import unittest
+
+from src.simulation_from_chess import Board, Coordinates, Creature, Grass, Herbivore, Predator
+from src.simulation_from_chess.core.columnar_history import ColumnarHistoryReader, ColumnarHistoryWriter
+from src.simulation_from_chess.core.replay import ReplayEngine
+
+
+class TestReplayEngine(unittest.TestCase):
+    def setUp(self):
+        """Запись 10 ходов с перемещением, уроном, поеданием и появлением травы."""
+        Creature.reset_counters()
+        self.board = Board(8, 8)
+        self.herbivore = Herbivore(Coordinates(1, 1))
+        self.predator = Predator(Coordinates(8, 8))
+        self.grass = Grass(Coordinates(5, 3))
+        for entity in [self.herbivore, self.predator, self.grass]:
+            self.board.place_entity(entity.coordinates, entity)
+
+        self._directory = tempfile.TemporaryDirectory()
+        self.expected = {}
+        with ColumnarHistoryWriter(self._directory.name, buffer_records=5, keyframe_interval=4) as writer:
+            for turn in range(10):
+                if turn < 4:
+                    old = self.herbivore.coordinates
+                    self.board.move_entity(old, Coordinates(old.x + 1, old.y))
+                if turn == 4:
+                    self.board.remove_entity(self.grass.coordinates)
+                if turn == 6:
+                    self.board.place_entity(Coordinates(2, 7), Grass(Coordinates(2, 7)))
+                self.predator.take_damage(3)
+                writer.append_turn(turn, self.board)
+                self.expected[turn] = {
+                    entity.entity_id: (type(entity), entity.coordinates, getattr(entity, 'hp', None))
+                    for entity in self.board.entities.values()
+                }
+        self.reader = ColumnarHistoryReader(self._directory.name)
+        self.engine = ReplayEngine(self.reader)
+
+    def tearDown(self):
+        del self.engine
+        self.reader.close()
+        self._directory.cleanup()
+
+    def _summary(self, frame) -> dict:
+        return {entity_id: (record.x, record.y) for entity_id, record in frame.items()}
+
+    def test_frame_at_any_turn(self):
+        """Кадр любого хода совпадает с состоянием доски на этом ходу."""
+        self.assertEqual(list(self.reader.keyframes), [1, 0, 0, 0, 1, 0, 0, 0, 1, 0])
+        for turn, expected in self.expected.items():
+            self.assertEqual(
+                self._summary(self.engine.frame_at(turn)),
+                {entity_id: (c.x, c.y) for entity_id, (_, c, _) in expected.items()},
+                f"Ход {turn}"
+            )
+        with self.assertRaises(ValueError):
+            self.engine.frame_at(10)
+
+    def test_iter_frames_matches_seek(self):
+        """Последовательное проигрывание дает те же кадры, что и поиск каждого хода."""
+        turns = []
+        for turn, frame in self.engine.iter_frames(2, 7):
+            turns.append(turn)
+            self.assertEqual(dict(frame), self.engine.frame_at(turn))
+        self.assertEqual(turns, [2, 3, 4, 5, 6, 7])
+
+    def test_board_at(self):
+        """Восстановленная доска содержит сущности тех же типов, позиций, здоровья и идентификаторов."""
+        counters = dict(Creature._creature_counters)
+        board = self.engine.board_at(7)
+        self.assertEqual(Creature._creature_counters, counters)
+        self.assertEqual((board.width, board.height), (8, 8))
+        self.assertEqual(
+            {entity.entity_id: (type(entity), entity.coordinates, getattr(entity, 'hp', None))
+             for entity in board.entities.values()},
+            self.expected[7]
+        )
+        self.assertEqual(board.count_entities_by_type(Grass), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from src.simulation_from_chess import (
+    Action,
+    Board,
+    Coordinates,
+    Grass,
+    Herbivore,
+    HealthCheckAction,
+    SpawnGrassAction
+)
+from src.simulation_from_chess.core.scheduler import ActionScheduler
+
+
+class RecordingAction(Action):
+    """Тестовое действие, запоминающее номера ходов выполнения."""
+    def __init__(self, frequency=1, offset=0, reads=frozenset(), writes=frozenset(),
+                 skip_if_unchanged=False, guard=True):
+        self.frequency = frequency
+        self.offset = offset
+        self.reads = reads
+        self.writes = writes
+        self.skip_if_unchanged = skip_if_unchanged
+        self.guard = guard
+        self.turns = []
+
+    def should_run(self, board):
+        return self.guard
+
+    def execute(self, board, logger):
+        pass
+
+
+class TestActionScheduler(unittest.TestCase):
+    def setUp(self):
+        """Подготовка тестового окружения."""
+        self.board = Board(5, 5)
+        self.scheduler = ActionScheduler()
+
+    def _run(self, actions, turns):
+        for turn in range(turns):
+            for action in self.scheduler.due_actions(actions, self.board, turn):
+                action.turns.append(turn)
+
+    def test_frequency_and_offset(self):
+        """Тест выполнения действия раз в N ходов со смещением."""
+        every_turn = RecordingAction()
+        every_third = RecordingAction(frequency=3, offset=1)
+
+        self._run([every_turn, every_third], 7)
+
+        self.assertEqual(every_turn.turns, list(range(7)))
+        self.assertEqual(every_third.turns, [1, 4])
+
+    def test_guard_skips_action(self):
+        """Тест пропуска действия по дешевой проверке."""
+        action = RecordingAction(guard=False)
+        self._run([action], 3)
+
+        self.assertEqual(action.turns, [])
+        self.assertEqual(self.scheduler.skipped['RecordingAction'], 3)
+
+    def test_skip_if_reads_unchanged(self):
+        """Тест пропуска действия, если его входные данные не изменялись."""
+        writer = RecordingAction(frequency=2, writes=frozenset({'hp'}))
+        reader = RecordingAction(reads=frozenset({'hp'}), skip_if_unchanged=True)
+
+        self._run([writer, reader], 5)
+
+        # Первый запуск всегда выполняется, далее - только после записи 'hp'
+        self.assertEqual(writer.turns, [0, 2, 4])
+        self.assertEqual(reader.turns, [0, 2, 4])
+
+        self.scheduler.invalidate()
+        self._run([reader], 1)
+        self.assertEqual(reader.turns, [0, 2, 4, 0])
+
+    def test_builtin_action_guards(self):
+        """Тест проверок встроенных действий."""
+        spawn = SpawnGrassAction(min_grass=1, spawn_chance=1.0)
+        health_check = HealthCheckAction()
+
+        self.assertTrue(spawn.should_run(self.board))
+        self.assertFalse(health_check.should_run(self.board))
+
+        self.board.place_entity(Coordinates(1, 1), Grass(Coordinates(1, 1)))
+        self.board.place_entity(Coordinates(2, 2), Herbivore(Coordinates(2, 2)))
+
+        self.assertFalse(spawn.should_run(self.board))
+        self.assertTrue(health_check.should_run(self.board))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from src.simulation_from_chess.actions.move_action import MoveAction
+from src.simulation_from_chess.core.board import Board
+from src.simulation_from_chess.core.coordinates import Coordinates
+from src.simulation_from_chess.core.shard_planner import ShardedPlanner
+from src.simulation_from_chess.entities.creature import Creature
+from src.simulation_from_chess.entities.grass import Grass
+from src.simulation_from_chess.entities.herbivore import Herbivore
+from src.simulation_from_chess.entities.predator import Predator
+from src.simulation_from_chess.entities.stone import Stone
+
+
+class TestShardedPlanner(unittest.TestCase):
+    def setUp(self) -> None:
+        """Случайно заполненная доска с голодными существами."""
+        rng = random.Random(3)
+        self.board = Board(12, 9)
+        cells = [Coordinates(x, y) for x in range(1, 13) for y in range(1, 10)]
+        rng.shuffle(cells)
+        kinds = [Herbivore] * 14 + [Predator] * 6 + [Grass] * 12 + [Stone] * 10
+        for entity_class, coordinates in zip(kinds, cells):
+            entity = entity_class(coordinates)
+            self.board.place_entity(coordinates, entity)
+            if isinstance(entity, Creature):
+                entity.take_damage(rng.randint(1, 40))
+        self.creatures = [entity for entity in self.board.entities.values() if isinstance(entity, Creature)]
+        self.planner = ShardedPlanner(processes=2, shards=3)
+
+    def tearDown(self) -> None:
+        self.planner.shutdown()
+
+    def test_plans_match_sequential(self) -> None:
+        """Планы по полосам совпадают с последовательными, включая выбор цели при равных расстояниях."""
+        sequential = MoveAction().plan_creatures(self.board, self.creatures)
+        sharded = self.planner.plan(self.board, self.creatures)
+
+        self.assertEqual(sharded, sequential)
+        for expected, actual in zip(sequential, sharded):
+            self.assertIs(actual.target, expected.target)
+            # Порядок обхода ходов влияет на выбор лучшего хода при равных расстояниях
+            self.assertEqual(list(actual.available_moves), list(expected.available_moves))
+
+    def test_grid_updated_from_board_journal(self) -> None:
+        """Сетка занятости живет между вызовами и следует за изменениями доски."""
+        self.planner.plan(self.board, self.creatures)
+        grid_name = self.planner._grid_block.name
+
+        mover = self.creatures[0]
+        target = next(iter(mover.available_moves))
+        self.board.move_entity(mover.coordinates, target)
+        stone = next(entity for entity in self.board.entities.values() if isinstance(entity, Stone))
+        self.board.remove_entity(stone.coordinates)
+        sequential = MoveAction().plan_creatures(self.board, self.creatures)
+        self.assertEqual(self.planner.plan(self.board, self.creatures), sequential)
+        self.assertEqual(self.planner._grid_block.name, grid_name)
+
+        # После массового изменения доски сетка заполняется заново
+        self.board.recount_entities()
+        self.board.place_entity(stone.coordinates, stone)
+        sequential = MoveAction().plan_creatures(self.board, self.creatures)
+        self.assertEqual(self.planner.plan(self.board, self.creatures), sequential)
+
+    def test_dead_herbivores_are_not_targets(self) -> None:
+        """Травоядные с нулевым здоровьем не становятся целью хищников."""
+        for entity in self.creatures:
+            if isinstance(entity, Herbivore):
+                entity.hp = 0
+        for plan, entity in zip(self.planner.plan(self.board, self.creatures), self.creatures):
+            if isinstance(entity, Predator):
+                self.assertIsNone(plan.target)
+
+    def test_invalid_process_count(self) -> None:
+        """Некорректное количество процессов или полос."""
+        with self.assertRaises(ValueError):
+            ShardedPlanner(processes=0)
+        with self.assertRaises(ValueError):
+            ShardedPlanner(processes=2, shards=0)
+        with self.assertRaises(ValueError):
+            MoveAction(planning_workers=2, planning_processes=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -90,6 +90,22 @@ class TestSimulation(TestCase):
         self.assertTrue(self.simulation.is_running)
         self.assertTrue(herbivore.hp > 0)
 
+    def test_run_shuts_down_actions(self):
+        """После запуска потоки и процессы действий хода останавливаются, даже при ошибке хода."""
+        self._add_test_creature()
+        class FailingAction(Action):
+            def execute(self, board, logger):
+                raise RuntimeError("ошибка хода")
+
+        action = FailingAction()
+        action.shutdown = MagicMock()
+        self.simulation.turn_actions = [action]
+
+        with patch('keyboard.is_pressed', return_value=False), patch('time.sleep'):
+            with self.assertRaises(RuntimeError):
+                self.simulation.run(steps=3)
+        action.shutdown.assert_called_once_with()
+
     def test_action_execution(self):
         """Тест выполнения действий в правильном порядке."""
         executed_actions = []
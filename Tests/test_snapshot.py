@@ -0,0 +1,88 @@
+import os
+import random
+import tempfile
+import unittest
+
+from src.simulation_from_chess import Simulation, Coordinates, Herbivore, Predator, Grass, Stone, Creature
+from src.simulation_from_chess.core.snapshot import SnapshotSerializer
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        """Подготовка симуляции с сущностями всех типов."""
+        Creature.reset_counters()
+        self.simulation = Simulation(size=6)
+        self.herbivore = Herbivore(Coordinates(1, 1))
+        self.predator = Predator(Coordinates(4, 5))
+        self.herbivore.take_damage(15)
+        for entity in [self.herbivore, self.predator, Grass(Coordinates(2, 3)), Stone(Coordinates(6, 6))]:
+            self.simulation.place_entity(entity, entity.coordinates)
+        self.simulation.move_counter = 7
+
+    def test_round_trip(self):
+        """Тест восстановления доски, счетчиков и номеров существ."""
+        data = SnapshotSerializer.dumps(self.simulation)
+
+        restored = Simulation(size=3)
+        SnapshotSerializer.loads(restored, data)
+
+        self.assertEqual((restored.board.width, restored.board.height), (6, 6))
+        self.assertEqual(restored.move_counter, 7)
+        self.assertTrue(restored.is_running)
+        self.assertEqual(len(restored.board.entities), 4)
+
+        herbivore = restored.board.get_entity(Coordinates(1, 1))
+        self.assertIsInstance(herbivore, Herbivore)
+        self.assertEqual(herbivore.hp, self.herbivore.hp)
+        self.assertEqual(str(herbivore), str(self.herbivore))
+        self.assertIsInstance(restored.board.get_entity(Coordinates(4, 5)), Predator)
+        self.assertIsInstance(restored.board.get_entity(Coordinates(2, 3)), Grass)
+        self.assertIsInstance(restored.board.get_entity(Coordinates(6, 6)), Stone)
+        self.assertEqual(Creature._creature_counters, {'Herbivore': 1, 'Predator': 1})
+
+    def test_entity_ids_restored(self):
+        """Тест сохранения идентификаторов сущностей и счетчика новых идентификаторов."""
+        data = SnapshotSerializer.dumps(self.simulation)
+        restored = Simulation(size=3)
+        SnapshotSerializer.loads(restored, data)
+
+        herbivore = restored.board.get_entity(Coordinates(1, 1))
+        self.assertEqual(herbivore.entity_id, self.herbivore.entity_id)
+        new_grass = Grass(Coordinates(3, 3))
+        restored.place_entity(new_grass, new_grass.coordinates)
+        self.assertEqual(new_grass.entity_id, self.simulation.board._next_entity_id)
+
+    def test_random_state_restored(self):
+        """Тест восстановления состояния генератора случайных чисел."""
+        random.seed(42)
+        data = SnapshotSerializer.dumps(self.simulation)
+        expected = [random.random() for _ in range(5)]
+
+        SnapshotSerializer.loads(Simulation(size=3), data)
+        self.assertEqual([random.random() for _ in range(5)], expected)
+
+    def test_save_and_load_file(self):
+        """Тест сохранения и загрузки снапшота через файл."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'state.snap')
+            self.simulation.save_snapshot(path)
+
+            restored = Simulation(size=3)
+            restored.load_snapshot(path)
+
+        self.assertEqual(
+            sorted((c.x, c.y) for c in restored.board.entities),
+            sorted((c.x, c.y) for c in self.simulation.board.entities)
+        )
+
+    def test_invalid_data(self):
+        """Тест обработки поврежденных данных."""
+        data = SnapshotSerializer.dumps(self.simulation)
+        with self.assertRaises(ValueError):
+            SnapshotSerializer.loads(Simulation(size=3), b'XXXX' + data[4:])
+        with self.assertRaises(ValueError):
+            SnapshotSerializer.loads(Simulation(size=3), data[:-3])
+
+
+if __name__ == '__main__':
+    unittest.main()
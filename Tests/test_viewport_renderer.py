@@ -0,0 +1,69 @@
+import unittest
+from io import StringIO
+
+from src.simulation_from_chess.core.board import Board
+from src.simulation_from_chess.core.coordinates import Coordinates
+from src.simulation_from_chess.entities.grass import Grass
+from src.simulation_from_chess.entities.herbivore import Herbivore
+from src.simulation_from_chess.entities.predator import Predator
+from src.simulation_from_chess.renderers.viewport_renderer import ViewportRenderer
+
+
+class TestViewportRenderer(unittest.TestCase):
+    def setUp(self) -> None:
+        """Доска 20x10: травоядное в левом нижнем углу, хищник и трава в правой половине."""
+        self.board = Board(20, 10)
+        self.herbivore = Herbivore(Coordinates(2, 2))
+        self.predator = Predator(Coordinates(17, 8))
+        self.grass = Grass(Coordinates(18, 8))
+        for entity in [self.herbivore, self.predator, self.grass]:
+            self.board.place_entity(entity.coordinates, entity)
+        self.renderer = ViewportRenderer(width=5, height=3, minimap_width=4, minimap_height=2, stream=StringIO())
+
+    def _minimap(self, output: str) -> list:
+        """Строки мини-карты без выделения окна."""
+        lines = output.split("Мини-карта")[1].splitlines()[1:]
+        return [line.replace(ViewportRenderer.ANSI_INVERSE, '').replace(ViewportRenderer.ANSI_RESET, '')
+                for line in lines]
+
+    def test_window_clamped_to_board(self):
+        """Окно вокруг существа у края поля прижимается к краю."""
+        self.renderer.follow(self.herbivore)
+        self.assertEqual(self.renderer.window(self.board), (1, 1, 5, 3))
+        self.renderer.look_at(Coordinates(10, 5))
+        self.assertEqual(self.renderer.window(self.board), (8, 4, 12, 6))
+
+    def test_window_follows_creature(self):
+        """Окно перемещается вместе с существом и остается на месте после его исчезновения."""
+        self.renderer.follow(self.predator)
+        self.board.move_entity(Coordinates(17, 8), Coordinates(10, 5))
+        self.assertEqual(self.renderer.window(self.board), (8, 4, 12, 6))
+        self.board.remove_entity(Coordinates(10, 5))
+        self.assertEqual(self.renderer.window(self.board), (8, 4, 12, 6))
+
+    def test_render_only_window_cells(self):
+        """Выводятся только клетки окна."""
+        self.renderer.follow(self.herbivore)
+        output = self.renderer.render(self.board)
+        self.assertIn("🐇", output)
+        self.assertNotIn("🐅", output.split("Мини-карта")[0])
+        self.assertEqual(output.split("Мини-карта")[0].count(ViewportRenderer.ANSI_RESET), 15)
+
+    def test_minimap_updates_from_changes(self):
+        """Мини-карта (блоки 5x5) показывает преобладающий тип и обновляется по изменениям доски."""
+        self.renderer.follow(self.herbivore)
+        self.assertEqual(self._minimap(self.renderer.render(self.board)), ['...P', 'h...'])
+        self.board.move_entity(Coordinates(2, 2), Coordinates(7, 2))
+        self.board.remove_entity(Coordinates(17, 8))
+        self.assertEqual(self._minimap(self.renderer.render(self.board)), ['..."', '.h..'])
+
+    def test_density_minimap(self):
+        """В режиме плотности пустые блоки - пробелы, занятые - символ плотности."""
+        self.renderer.minimap_mode = ViewportRenderer.MODE_DENSITY
+        minimap = self._minimap(self.renderer.render(self.board))
+        self.assertEqual(minimap[0][:3], '   ')
+        self.assertEqual(minimap[0][3], '.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import tempfile
+import unittest
+
+from src.simulation_from_chess import (
+    Board,
+    Coordinates,
+    Grass,
+    Herbivore,
+    HealthCheckAction,
+    HungerAction,
+    MoveAction,
+    Simulation,
+    Stone
+)
+from src.simulation_from_chess.core.columnar_history import ColumnarHistoryReader, ColumnarHistoryWriter
+
+
+class TestZobristHash(unittest.TestCase):
+    def setUp(self):
+        """Подготовка тестового окружения."""
+        self.board = Board(5, 5)
+
+    def test_hash_restored_after_move_back(self):
+        """Хеш возвращается к прежнему значению после обратного перемещения."""
+        self.board.place_entity(Coordinates(1, 1), Herbivore(Coordinates(1, 1)))
+        initial_hash = self.board.zobrist_hash
+
+        self.board.move_entity(Coordinates(1, 1), Coordinates(2, 1))
+        self.assertNotEqual(self.board.zobrist_hash, initial_hash)
+
+        self.board.move_entity(Coordinates(2, 1), Coordinates(1, 1))
+        self.assertEqual(self.board.zobrist_hash, initial_hash)
+
+    def test_hash_independent_of_placement_order(self):
+        """Хеш зависит только от расстановки, а не от порядка размещения."""
+        other = Board(5, 5)
+        self.board.place_entity(Coordinates(3, 1), Grass(Coordinates(3, 1)))
+        self.board.place_entity(Coordinates(2, 2), Stone(Coordinates(2, 2)))
+        other.place_entity(Coordinates(2, 2), Stone(Coordinates(2, 2)))
+        other.place_entity(Coordinates(3, 1), Grass(Coordinates(3, 1)))
+        self.assertEqual(self.board.zobrist_hash, other.zobrist_hash)
+
+        # Тип сущности входит в хеш
+        other.remove_entity(Coordinates(3, 1))
+        other.place_entity(Coordinates(3, 1), Stone(Coordinates(3, 1)))
+        self.assertNotEqual(self.board.zobrist_hash, other.zobrist_hash)
+
+    def test_hash_after_remove_and_recount(self):
+        """Удаление и пересчет дают тот же хеш, что и инкрементальное обновление."""
+        self.board.place_entity(Coordinates(3, 3), Grass(Coordinates(3, 3)))
+        self.board.remove_entity(Coordinates(3, 3))
+        self.assertEqual(self.board.zobrist_hash, 0)
+
+        self.board.place_entity(Coordinates(4, 1), Stone(Coordinates(4, 1)))
+        incremental = self.board.zobrist_hash
+        self.board.recount_entities()
+        self.assertEqual(self.board.zobrist_hash, incremental)
+
+    def test_detect_cycle(self):
+        """Поиск неподвижного состояния и периодичности в истории хешей."""
+        for value in (5, 7, 7, 7):
+            self.board.hash_history.append(value)
+        self.assertEqual(self.board.detect_cycle(min_repeats=2), 1)
+        self.assertIsNone(self.board.detect_cycle(min_repeats=3))
+
+        self.board.hash_history.clear()
+        for value in (1, 2, 1, 2, 1, 2):
+            self.board.hash_history.append(value)
+        self.assertEqual(self.board.detect_cycle(min_repeats=2), 2)
+
+
+class TestSteadyStatePolicy(unittest.TestCase):
+    def _build(self, policy, hunger_damage=1):
+        """Травоядное без еды: расстановка не меняется до его гибели от голода."""
+        simulation = Simulation(size=5, headless=True, steady_state_policy=policy)
+        simulation.place_entity(Herbivore(Coordinates(1, 1)), Coordinates(1, 1))
+        simulation.turn_actions = [MoveAction(), HungerAction(hunger_damage=hunger_damage), HealthCheckAction()]
+        return simulation
+
+    def test_unknown_policy(self):
+        """Неизвестная политика отклоняется."""
+        with self.assertRaises(ValueError):
+            Simulation(size=5, steady_state_policy='rewind')
+
+    def test_stop_policy(self):
+        """Политика stop останавливает симуляцию, когда не меняются ни расстановка, ни здоровье."""
+        simulation = self._build(Simulation.STEADY_STATE_STOP, hunger_damage=0)
+        turns = 0
+        while simulation.next_turn():
+            turns += 1
+        self.assertEqual(turns, simulation.steady_state_repeats + 1)
+        self.assertFalse(simulation.is_running)
+
+    def test_stop_policy_waits_for_starvation(self):
+        """Повтор расстановки при голоде не останавливает симуляцию: итог совпадает с полным прогоном."""
+        full = self._build(None)
+        stopping = self._build(Simulation.STEADY_STATE_STOP)
+        while full.next_turn():
+            pass
+        while stopping.next_turn():
+            pass
+
+        self.assertEqual(stopping.move_counter, full.move_counter)
+        self.assertEqual(stopping.board.count_entities_by_type(Herbivore), 0)
+
+    def test_skip_policy_matches_full_run(self):
+        """Пропуск неподвижных ходов дает тот же результат, что и полный прогон."""
+        full = self._build(None)
+        skipping = self._build(Simulation.STEADY_STATE_SKIP)
+        herbivore = skipping.board.get_entity(Coordinates(1, 1))
+        initial_hp = herbivore.hp
+
+        full_calls = 0
+        while full.next_turn():
+            full_calls += 1
+        skip_calls = 0
+        while skipping.next_turn():
+            skip_calls += 1
+
+        self.assertEqual(skipping.move_counter, full.move_counter)
+        self.assertEqual(skipping.move_counter, initial_hp)
+        self.assertLess(skip_calls, full_calls)
+        self.assertEqual(skipping.board.count_entities_by_type(Herbivore), 0)
+
+    def test_skip_keeps_turn_counters_aligned(self):
+        """После пропуска номер хода доски и записанные ходы истории совпадают с move_counter."""
+        with tempfile.TemporaryDirectory() as directory:
+            writer = ColumnarHistoryWriter(directory)
+            simulation = self._build(Simulation.STEADY_STATE_SKIP)
+            simulation.history_writer = writer
+            herbivore = simulation.board.get_entity(Coordinates(1, 1))
+            while simulation.next_turn():
+                if simulation.move_counter > simulation.steady_state_repeats + 1:
+                    break  # Первый вызов после пропуска
+
+            self.assertGreater(simulation.move_counter, simulation.steady_state_repeats + 2)
+            self.assertEqual(simulation.board.game_state.current_turn, simulation.move_counter)
+            self.assertEqual(writer.turn_count, simulation.move_counter)
+            self.assertEqual(len(simulation.board.hash_history),
+                             min(simulation.move_counter, simulation.board.hash_history.maxlen))
+            writer.close()
+            reader = ColumnarHistoryReader(directory)
+            self.assertEqual(list(reader.turns), list(range(simulation.move_counter)))
+            # Здоровье на последнем записанном ходу учитывает голод пропущенных ходов
+            self.assertEqual(list(reader.column('hp')[-1:]), [herbivore.hp])
+            reader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
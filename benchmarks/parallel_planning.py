@@ -0,0 +1,186 @@
+"""
+Бенчмарк параллельной фазы планирования MoveAction.
+
+Строит мир, делает несколько ходов для естественной расстановки и затем
+замеряет MoveAction.plan_creatures для разного количества потоков. Для
+каждого количества проверяется, что планы совпадают с последовательными.
+Ускорение считается относительно планирования в одном потоке по тому же
+снимку доски: снимок хранит готовые списки сущностей по типам и сам по себе
+быстрее живой доски, этот выигрыш не относится к параллельности.
+Ускорение ожидается только на сборках CPython без GIL (3.13t и новее);
+с GIL потоки выполняются по очереди и показывают накладные расходы пула.
+Отдельно замеряется планирование процессами по полосам поля (ShardedPlanner),
+которое не зависит от GIL. Его ускорение считается относительно того же ядра
+в одном рабочем процессе: ядро само по себе быстрее планирования по доске, и
+этот выигрыш не относится к параллельности (он указан отдельно). Выигрыш
+от процессов имеет смысл оценивать только на машине с несколькими ядрами.
+
+Запуск из корня репозитория:
+    python -m benchmarks.parallel_planning --size 200 --density 0.2
+    python -m benchmarks.parallel_planning --workers 1 2 4 8 --repeats 5 --output planning.json
+    python -m benchmarks.parallel_planning --size 500 --processes 2 4
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Sequence
+
+from benchmarks.scaling import build_simulation, environment_info
+from src.simulation_from_chess import Creature, MoveAction
+from src.simulation_from_chess.actions.move_action import _plan_chunk
+from src.simulation_from_chess.core.board_snapshot import BoardSnapshot
+from src.simulation_from_chess.core.shard_planner import ShardedPlanner
+
+
+def gil_enabled() -> bool:
+    """Включен ли GIL в текущем интерпретаторе (до 3.13 - всегда)."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def measure_planning(size: int, density: float, workers: List[int], repeats: int,
+                     warmup_turns: int, seed: int, processes: Sequence[int] = ()) -> Dict:
+    """
+    Замер времени планирования для каждого количества потоков.
+
+    Args:
+        size: Сторона квадратного поля
+        density: Доля занятых клеток
+        workers: Количества потоков для замера
+        repeats: Повторов замера для каждого количества
+        warmup_turns: Ходов симуляции перед замером
+        seed: Зерно генератора случайных чисел
+        processes: Количества процессов для замера планирования по полосам
+
+    Returns:
+        Dict: Количество существ, медианы последовательного планирования по доске
+            и по снимку, для каждого количества потоков медиана, ускорение
+            относительно снимка в одном потоке и совпадение планов; медиана ядра
+            полос в одном процессе и для каждого количества процессов - то же с
+            ускорением относительно одного процесса
+    """
+    simulation = build_simulation(size, density, seed)
+    for _ in range(warmup_turns):
+        simulation.next_turn()
+    board = simulation.board
+    creatures = [entity for entity in board.entities.values() if isinstance(entity, Creature)]
+
+    def median_time(plan) -> float:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            plan()
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    reference = MoveAction().plan_creatures(board, creatures)
+    board_sequential = median_time(lambda: MoveAction().plan_creatures(board, creatures))
+    snapshot_sequential = median_time(lambda: _plan_chunk(BoardSnapshot(board), creatures))
+    results = {}
+    for count in workers:
+        action = MoveAction(planning_workers=count)
+        timings = []
+        try:
+            for _ in range(repeats):
+                start = time.perf_counter()
+                plans = action.plan_creatures(board, creatures)
+                timings.append(time.perf_counter() - start)
+        finally:
+            action.shutdown()
+        results[str(count)] = {
+            'median_s': statistics.median(timings),
+            'matches_sequential': plans == reference,
+        }
+    for result in results.values():
+        result['speedup'] = snapshot_sequential / result['median_s'] if result['median_s'] else None
+
+    def sharded_time(planner):
+        try:
+            plans = planner.plan(board, creatures)  # Запуск процессов не входит в замер
+            return median_time(lambda: planner.plan(board, creatures)), plans == reference
+        finally:
+            planner.shutdown()
+
+    sharded = {}
+    kernel_single = None
+    if processes:
+        kernel_single, _ = sharded_time(ShardedPlanner(1, shards=max(processes)))
+    for count in processes:
+        median, matches = sharded_time(ShardedPlanner(count))
+        sharded[str(count)] = {
+            'median_s': median,
+            'speedup': kernel_single / median if median else None,
+            'matches_sequential': matches,
+        }
+    return {
+        'size': size, 'density': density, 'creatures': len(creatures),
+        'board_sequential_s': board_sequential,
+        'snapshot_sequential_s': snapshot_sequential,
+        'kernel_single_process_s': kernel_single,
+        'workers': results,
+        'processes': sharded,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Бенчмарк параллельного планирования ходов")
+    parser.add_argument('--size', type=int, default=200, help="Сторона поля")
+    parser.add_argument('--density', type=float, default=0.2, help="Доля занятых клеток")
+    parser.add_argument('--workers', type=int, nargs='+',
+                        help="Количества потоков (по умолчанию степени двойки до числа ядер)")
+    parser.add_argument('--processes', type=int, nargs='*', default=[],
+                        help="Количества процессов для планирования по полосам поля")
+    parser.add_argument('--repeats', type=int, default=5, help="Повторов замера")
+    parser.add_argument('--warmup-turns', type=int, default=2, help="Ходов перед замером")
+    parser.add_argument('--seed', type=int, default=0, help="Зерно генератора случайных чисел")
+    parser.add_argument('--output', default='planning_results.json', help="Путь к JSON с результатами")
+    return parser.parse_args(argv)
+
+
+def default_workers() -> List[int]:
+    cpu_count = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cpu_count:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cpu_count:
+        workers.append(cpu_count)
+    return workers
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    workers = args.workers or default_workers()
+    report = {
+        'environment': dict(environment_info(), gil_enabled=gil_enabled()),
+        'result': measure_planning(
+            args.size, args.density, workers, args.repeats, args.warmup_turns, args.seed,
+            args.processes
+        ),
+    }
+    result = report['result']
+    print(
+        f"последовательно: доска {result['board_sequential_s'] * 1000:.1f} мс, "
+        f"снимок {result['snapshot_sequential_s'] * 1000:.1f} мс "
+        f"(GIL {'включен' if report['environment']['gil_enabled'] else 'выключен'})"
+    )
+    if result['kernel_single_process_s'] is not None:
+        print(f"ядро полос в одном процессе: {result['kernel_single_process_s'] * 1000:.1f} мс "
+              f"(ядер: {os.cpu_count()})")
+    for label, key in (('потоков', 'workers'), ('процессов', 'processes')):
+        for count, measured in result[key].items():
+            print(
+                f"{label} {count:>3}: {measured['median_s'] * 1000:8.1f} мс, "
+                f"ускорение {measured['speedup']:.2f}x, "
+                f"планы {'совпадают' if measured['matches_sequential'] else 'РАСХОДЯТСЯ'}"
+            )
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены в {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
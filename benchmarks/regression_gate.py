@@ -0,0 +1,248 @@
+"""
+Проверка производительности против сохраненного базового замера.
+
+Прогоняет те же сценарии, что записаны в базовом JSON бенчмарка
+масштабирования, и сравнивает метрики. Регрессией считается изменение,
+которое одновременно хуже допуска по медиане и статистически значимо
+по одностороннему U-критерию Манна-Уитни на повторных прогонах. Если при
+данном числе повторов значимость на уровне alpha недостижима (см.
+min_samples), регрессия определяется только по допуску.
+Код выхода 1 означает найденную регрессию.
+
+Запуск из корня репозитория:
+    python -m benchmarks.scaling --preset quick --trials 5 --output baseline.json
+    python -m benchmarks.regression_gate --baseline baseline.json
+    python -m benchmarks.regression_gate --baseline baseline.json --fresh bench_results.json
+"""
+import argparse
+import json
+import math
+import statistics
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+from .scaling import run_benchmarks
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_USAGE = 2
+
+
+
+def min_samples(alpha: float) -> int:
+    """
+    Наименьшее число повторов на сторону, при котором U-критерий может дать p < alpha.
+
+    Наименьшее точное p-value для выборок по n значений равно 1 / C(2n, n);
+    при меньшем числе повторов значимость недостижима при любой разнице.
+    """
+    n = 1
+    while 1 / math.comb(2 * n, n) >= alpha:
+        n += 1
+    return n
+
+
+@lru_cache(maxsize=None)
+def _u_distribution(n1: int, n2: int) -> tuple:
+    """
+    Точное распределение статистики U при нулевой гипотезе.
+
+    Returns:
+        tuple: Количество перестановок для каждого значения U от 0 до n1*n2
+    """
+    if n1 == 0 or n2 == 0:
+        return (1,)
+    without_first = _u_distribution(n1 - 1, n2)
+    without_second = _u_distribution(n1, n2 - 1)
+    counts = [0] * (n1 * n2 + 1)
+    for u, count in enumerate(without_first):
+        counts[u + n2] += count
+    for u, count in enumerate(without_second):
+        counts[u] += count
+    return tuple(counts)
+
+
+def mann_whitney_greater(sample: Sequence[float], reference: Sequence[float]) -> float:
+    """
+    Односторонний U-критерий: p-value гипотезы, что sample стохастически больше reference.
+
+    Для малых выборок используется точное распределение, для больших -
+    нормальное приближение с поправкой на непрерывность. Совпадения
+    учитываются как половина победы.
+    """
+    n1, n2 = len(sample), len(reference)
+    if not n1 or not n2:
+        return 1.0
+    u = sum(1.0 if a > b else 0.5 if a == b else 0.0 for a in sample for b in reference)
+
+    if n1 * n2 <= 400:
+        counts = _u_distribution(n1, n2)
+        total = sum(counts)
+        threshold = math.ceil(u)
+        return sum(counts[threshold:]) / total
+
+    mean = n1 * n2 / 2
+    sigma = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    z = (u - mean - 0.5) / sigma
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_metric(name: str, baseline: List[float], fresh: List[float], higher_is_better: bool,
+                   tolerance: float, alpha: float) -> Dict:
+    """
+    Сравнение одной метрики сценария.
+
+    Args:
+        name: Название метрики
+        baseline: Значения из базового замера по повторам
+        fresh: Значения нового замера по повторам
+        higher_is_better: True для пропускной способности, False для времени
+        tolerance: Допустимое относительное ухудшение медианы
+        alpha: Уровень значимости
+
+    Returns:
+        Dict: Медианы, относительное изменение, p-value и вердикт
+    """
+    baseline_median = statistics.median(baseline)
+    fresh_median = statistics.median(fresh)
+    if baseline_median:
+        change = (fresh_median - baseline_median) / baseline_median
+    else:
+        change = 0.0
+    worsening = -change if higher_is_better else change
+
+    # Значимость проверяется, только если она достижима: наименьшее точное p-value - 1 / C(n1 + n2, n1)
+    enough_samples = (bool(baseline) and bool(fresh)
+                      and 1 / math.comb(len(baseline) + len(fresh), len(baseline)) < alpha)
+    if higher_is_better:
+        p_value = mann_whitney_greater(baseline, fresh)
+    else:
+        p_value = mann_whitney_greater(fresh, baseline)
+
+    exceeds_tolerance = worsening > tolerance
+    significant = p_value < alpha if enough_samples else True
+    return {
+        'metric': name,
+        'baseline': baseline_median,
+        'fresh': fresh_median,
+        'change': change,
+        'p_value': p_value,
+        'samples_checked': enough_samples,
+        'regression': exceeds_tolerance and significant,
+    }
+
+
+def compare_reports(baseline: Dict, fresh: Dict, tolerance: float, action_tolerance: float,
+                    alpha: float, actions: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Сравнение всех сценариев базового и нового отчетов.
+
+    Raises:
+        KeyError: Если сценарий базового отчета отсутствует в новом
+    """
+    fresh_scenarios = {scenario['name']: scenario for scenario in fresh['scenarios']}
+    comparisons = []
+    for scenario in baseline['scenarios']:
+        name = scenario['name']
+        if name not in fresh_scenarios:
+            raise KeyError(name)
+        current = fresh_scenarios[name]
+
+        results = [compare_metric(
+            'turns_per_sec',
+            scenario['samples']['turns_per_sec'],
+            current['samples']['turns_per_sec'],
+            higher_is_better=True, tolerance=tolerance, alpha=alpha
+        )]
+        baseline_actions = scenario['samples']['actions_mean_us']
+        current_actions = current['samples']['actions_mean_us']
+        for stage in actions or sorted(baseline_actions):
+            if stage in baseline_actions and stage in current_actions:
+                results.append(compare_metric(
+                    f"{stage}.mean_us",
+                    baseline_actions[stage],
+                    current_actions[stage],
+                    higher_is_better=False, tolerance=action_tolerance, alpha=alpha
+                ))
+        comparisons.append({'scenario': name, 'metrics': results})
+    return comparisons
+
+
+def format_comparisons(comparisons: List[Dict]) -> str:
+    """Текстовый отчет сравнения."""
+    lines = []
+    for comparison in comparisons:
+        lines.append(comparison['scenario'])
+        for metric in comparison['metrics']:
+            verdict = "РЕГРЕССИЯ" if metric['regression'] else "ok"
+            note = "" if metric['samples_checked'] else " (мало повторов, только допуск)"
+            lines.append(
+                f"  {metric['metric']:<28}{metric['baseline']:>14.2f}{metric['fresh']:>14.2f}"
+                f"{metric['change']:>+10.1%}  p={metric['p_value']:.4f}  {verdict}{note}"
+            )
+    return "\n".join(lines)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Проверка регрессий производительности")
+    parser.add_argument('--baseline', required=True, help="JSON базового замера (benchmarks.scaling)")
+    parser.add_argument('--fresh', help="Готовый JSON нового замера (иначе прогон выполняется заново)")
+    parser.add_argument('--trials', type=int, help="Повторов нового прогона (по умолчанию как в базовом)")
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help="Допустимое падение ходов/с (доля, по умолчанию 0.10)")
+    parser.add_argument('--action-tolerance', type=float, default=0.15,
+                        help="Допустимый рост времени действия (доля, по умолчанию 0.15)")
+    parser.add_argument('--alpha', type=float, default=0.05, help="Уровень значимости U-критерия")
+    parser.add_argument('--actions', nargs='+',
+                        help="Проверяемые стадии (по умолчанию все из базового замера)")
+    parser.add_argument('--output', help="Сохранить новый замер в JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    with open(args.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)
+
+    if args.fresh:
+        with open(args.fresh, encoding='utf-8') as file:
+            fresh = json.load(file)
+    else:
+        parameters = baseline['parameters']
+        fresh = run_benchmarks(
+            sizes=parameters['sizes'],
+            densities=parameters['densities'],
+            turns=parameters['turns'],
+            trials=args.trials or max(parameters['trials'], min_samples(args.alpha)),
+            seed=parameters['seed'],
+            alloc_turns=0,
+        )
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(fresh, file, ensure_ascii=False, indent=2)
+
+    try:
+        comparisons = compare_reports(
+            baseline, fresh, args.tolerance, args.action_tolerance, args.alpha, args.actions
+        )
+    except KeyError as e:
+        print(f"Сценарий {e} отсутствует в новом замере")
+        return EXIT_USAGE
+
+    print(format_comparisons(comparisons))
+    regressions = [
+        (comparison['scenario'], metric['metric'])
+        for comparison in comparisons
+        for metric in comparison['metrics']
+        if metric['regression']
+    ]
+    if regressions:
+        print(f"\nНайдено регрессий: {len(regressions)}")
+        return EXIT_REGRESSION
+    print("\nРегрессий не найдено")
+    return EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
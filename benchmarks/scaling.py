@@ -0,0 +1,365 @@
+"""
+Бенчмарк масштабирования движка симуляции.
+
+Строит миры по сетке размеров поля и плотностей сущностей, прогоняет
+фиксированное число ходов без вывода и сохраняет результаты в JSON:
+ходов в секунду, время каждого действия, пиковый RSS и аллокации на ход,
+а также объем памяти на одну сущность каждого типа.
+
+Запуск из корня репозитория:
+    python -m benchmarks.scaling --preset quick --output bench_results.json
+    python -m benchmarks.scaling --sizes 10 100 2000 --densities 0.05 0.2 --turns 20
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from src.simulation_from_chess import (
+    Coordinates,
+    Creature,
+    Grass,
+    Herbivore,
+    Predator,
+    Stone,
+    Simulation,
+    SpawnGrassAction,
+    MoveAction,
+    HealthCheckAction,
+    HungerAction,
+    TurnProfiler,
+    SIMULATION_CONFIG
+)
+from src.simulation_from_chess.core.game_state import EntityState
+
+PRESETS = {
+    'quick': {'sizes': [10, 25, 50], 'densities': [0.1, 0.3]},
+    'full': {'sizes': [10, 50, 100, 250, 500, 1000, 2000], 'densities': [0.05, 0.1, 0.3]},
+}
+
+# Доли типов сущностей от общего числа размещаемых сущностей
+ENTITY_MIX = {'herbivores': 0.3, 'predators': 0.1, 'grass': 0.4, 'stones': 0.2}
+
+# Количество объектов каждого типа при замере памяти на сущность
+MEMORY_SAMPLE = 10000
+
+
+def build_simulation(size: int, density: float, seed: int) -> Simulation:
+    """
+    Создание мира заданного размера и плотности.
+
+    Args:
+        size: Сторона квадратного поля
+        density: Доля занятых клеток (0.0 - 1.0)
+        seed: Зерно генератора случайных чисел
+    """
+    random.seed(seed)
+    total = int(size * size * density)
+    counts = {name: max(1, int(total * share)) for name, share in ENTITY_MIX.items()}
+
+    simulation = Simulation(size=size, profiler=TurnProfiler(), headless=True)
+    simulation.initialize(**counts)
+    simulation.turn_actions = [
+        SpawnGrassAction(
+            min_grass=counts['grass'],
+            spawn_chance=SIMULATION_CONFIG['grass_spawn_chance']
+        ),
+        MoveAction(),
+        HungerAction(hunger_damage=SIMULATION_CONFIG['hunger_damage']),
+        HealthCheckAction()
+    ]
+    return simulation
+
+
+def run_trial(size: int, density: float, turns: int, seed: int, alloc_turns: int) -> Dict:
+    """
+    Один прогон сценария: построение мира, замер ходов и аллокаций.
+
+    Returns:
+        Dict: Метрики прогона
+    """
+    setup_start = time.perf_counter()
+    simulation = build_simulation(size, density, seed)
+    setup_seconds = time.perf_counter() - setup_start
+    entities = len(simulation.board.entities)
+
+    completed = 0
+    start = time.perf_counter()
+    for _ in range(turns):
+        if not simulation.next_turn():
+            break
+        completed += 1
+    elapsed = time.perf_counter() - start
+
+    # Статистику берем до замера аллокаций: трассировка искажает время действий
+    timings = simulation.profiler.get_stats()['timings']
+    allocation = measure_allocations(simulation, alloc_turns)
+
+    return {
+        'entities': entities,
+        'setup_s': setup_seconds,
+        'turns_completed': completed,
+        'elapsed_s': elapsed,
+        'turns_per_sec': completed / elapsed if elapsed > 0 else 0.0,
+        'actions': {
+            stage: {
+                'mean_us': summary['total'] / summary['count'] / 1000 if summary['count'] else 0.0,
+                'p50_us': summary['p50'] / 1000,
+                'p95_us': summary['p95'] / 1000,
+                'p99_us': summary['p99'] / 1000,
+                'max_us': summary['max'] / 1000,
+            }
+            for stage, summary in timings.items()
+        },
+        'peak_rss_kb': peak_rss_kb(),
+        **allocation,
+    }
+
+
+def measure_allocations(simulation: Simulation, turns: int) -> Dict:
+    """
+    Замер аллокаций на ход под tracemalloc.
+
+    Выполняется отдельно от замера скорости, так как трассировка замедляет ход.
+    allocated_bytes_per_turn - средний пик выделенной за ход памяти,
+    net_blocks_per_turn - средний прирост числа живых блоков памяти.
+    """
+    peaks = []
+    blocks = []
+    tracemalloc.start()
+    try:
+        for _ in range(turns):
+            if not simulation.is_running:
+                break
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            blocks_before = sys.getallocatedblocks()
+            if not simulation.next_turn():
+                break
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+            blocks.append(sys.getallocatedblocks() - blocks_before)
+    finally:
+        tracemalloc.stop()
+    return {
+        'allocated_bytes_per_turn': statistics.mean(peaks) if peaks else None,
+        'net_blocks_per_turn': statistics.mean(blocks) if blocks else None,
+    }
+
+
+def measure_entity_memory(count: int = MEMORY_SAMPLE) -> Dict[str, float]:
+    """
+    Средний объем памяти на один объект каждого типа сущности в байтах.
+
+    Учитывается все, что выделяется при создании объекта: сам объект, его
+    Coordinates и вложенные контейнеры (например, available_moves существ).
+    EntityState замеряется отдельно - записи состояния создаются каждый ход.
+    """
+    factories = {
+        entity_class.__name__: entity_class
+        for entity_class in (Grass, Stone, Herbivore, Predator)
+    }
+    factories['EntityState'] = lambda coordinates: EntityState(coordinates=coordinates, hp=1)
+
+    # Конструкторы существ увеличивают счетчики номеров, восстанавливаем их после замера
+    counters = dict(Creature._creature_counters)
+    result = {}
+    try:
+        for name, factory in factories.items():
+            tracemalloc.start()
+            try:
+                before, _ = tracemalloc.get_traced_memory()
+                # Координаты в пределах кеша малых int, чтобы не учитывать память самих чисел
+                objects = [factory(Coordinates(i % 250 + 1, i // 250 % 250 + 1)) for i in range(count)]
+                after, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            result[name] = (after - before - sys.getsizeof(objects)) / count
+            del objects
+    finally:
+        Creature._creature_counters.clear()
+        Creature._creature_counters.update(counters)
+    return result
+
+
+def format_entity_memory(memory: Dict[str, float]) -> str:
+    """Строка отчета о памяти на сущность."""
+    return "Память на объект: " + ", ".join(f"{name}={size:.0f} Б" for name, size in memory.items())
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Пиковый RSS процесса в килобайтах (None, если недоступно на платформе)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # На macOS ru_maxrss в байтах, на Linux - в килобайтах
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_scenario(size: int, density: float, turns: int, trials: int, seed: int,
+                 alloc_turns: int, isolate: bool) -> Dict:
+    """
+    Прогон сценария несколько раз и агрегирование результатов.
+
+    Все повторы используют одно зерно, поэтому разброс между ними - это шум
+    измерения, а не различие миров. При isolate=True каждый прогон выполняется
+    в отдельном процессе, чтобы пиковый RSS не накапливался между сценариями.
+    """
+    results = []
+    args = (size, density, turns, seed, alloc_turns)
+    for _ in range(trials):
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                results.append(executor.submit(run_trial, *args).result())
+        else:
+            results.append(run_trial(*args))
+
+    stages = sorted({stage for result in results for stage in result['actions']})
+    return {
+        'name': scenario_name(size, density),
+        'size': size,
+        'density': density,
+        'turns': turns,
+        'trials': trials,
+        'entities': results[0]['entities'],
+        'setup_s': statistics.median(r['setup_s'] for r in results),
+        'turns_completed': min(r['turns_completed'] for r in results),
+        'turns_per_sec': statistics.median(r['turns_per_sec'] for r in results),
+        'actions': {
+            stage: {
+                metric: statistics.median(r['actions'][stage][metric] for r in results if stage in r['actions'])
+                for metric in ('mean_us', 'p50_us', 'p95_us', 'p99_us', 'max_us')
+            }
+            for stage in stages
+        },
+        'peak_rss_kb': max((r['peak_rss_kb'] for r in results if r['peak_rss_kb'] is not None), default=None),
+        'allocated_bytes_per_turn': _median_or_none(r['allocated_bytes_per_turn'] for r in results),
+        'net_blocks_per_turn': _median_or_none(r['net_blocks_per_turn'] for r in results),
+        'samples': {
+            'turns_per_sec': [r['turns_per_sec'] for r in results],
+            'actions_mean_us': {
+                stage: [r['actions'][stage]['mean_us'] for r in results if stage in r['actions']]
+                for stage in stages
+            },
+        },
+    }
+
+
+def _median_or_none(values) -> Optional[float]:
+    values = [value for value in values if value is not None]
+    return statistics.median(values) if values else None
+
+
+def scenario_name(size: int, density: float) -> str:
+    """Идентификатор сценария для сравнения результатов между запусками."""
+    return f"size={size},density={density:g}"
+
+
+def environment_info() -> Dict:
+    """Сведения о машине и коммите для сравнения результатов."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def run_benchmarks(sizes: List[int], densities: List[float], turns: int, trials: int = 1,
+                   seed: int = 0, alloc_turns: int = 3, isolate: bool = True,
+                   verbose: bool = True) -> Dict:
+    """
+    Прогон всей сетки сценариев.
+
+    Returns:
+        Dict: Отчет с окружением, параметрами и результатами сценариев
+    """
+    report = {
+        'environment': environment_info(),
+        'parameters': {
+            'sizes': sizes, 'densities': densities, 'turns': turns,
+            'trials': trials, 'seed': seed, 'alloc_turns': alloc_turns,
+        },
+        'entity_memory_bytes': measure_entity_memory(),
+        'scenarios': [],
+    }
+    if verbose:
+        print(format_entity_memory(report['entity_memory_bytes']), flush=True)
+    for size in sizes:
+        for density in densities:
+            result = run_scenario(size, density, turns, trials, seed, alloc_turns, isolate)
+            report['scenarios'].append(result)
+            if verbose:
+                print(format_result(result), flush=True)
+    return report
+
+
+def format_result(result: Dict) -> str:
+    """Строка краткого отчета по сценарию."""
+    slowest = max(result['actions'].items(), key=lambda item: item[1]['mean_us'], default=(None, None))[0]
+    rss = result['peak_rss_kb']
+    return (
+        f"{result['name']:<28} entities={result['entities']:<9} "
+        f"{result['turns_per_sec']:>10.1f} ходов/с  "
+        f"RSS={rss if rss is not None else 'n/a'} КБ  "
+        f"самое долгое: {slowest}"
+    )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Бенчмарк масштабирования симуляции")
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='quick',
+                        help="Набор размеров и плотностей по умолчанию")
+    parser.add_argument('--sizes', type=int, nargs='+', help="Размеры поля (переопределяют пресет)")
+    parser.add_argument('--densities', type=float, nargs='+', help="Плотности сущностей (переопределяют пресет)")
+    parser.add_argument('--turns', type=int, default=50, help="Количество ходов в прогоне")
+    parser.add_argument('--trials', type=int, default=1, help="Количество повторов каждого сценария")
+    parser.add_argument('--seed', type=int, default=0, help="Зерно генератора случайных чисел")
+    parser.add_argument('--alloc-turns', type=int, default=3, help="Ходов для замера аллокаций")
+    parser.add_argument('--no-isolate', action='store_true', help="Не запускать прогоны в отдельных процессах")
+    parser.add_argument('--output', default='bench_results.json', help="Путь к JSON с результатами")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    preset = PRESETS[args.preset]
+    report = run_benchmarks(
+        sizes=args.sizes or preset['sizes'],
+        densities=args.densities or preset['densities'],
+        turns=args.turns,
+        trials=args.trials,
+        seed=args.seed,
+        alloc_turns=args.alloc_turns,
+        isolate=not args.no_isolate,
+    )
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены в {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,12 +4,19 @@ from src.simulation_from_chess import (
     MoveAction,
     HealthCheckAction,
     HungerAction,
+    DiffConsoleRenderer,
+    ViewportRenderer,
     SIMULATION_CONFIG
 )
 
 def main():
     # Создание симуляции с настроенным размером поля
-    simulation = Simulation(size=SIMULATION_CONFIG['board_size'])
+    renderer = None
+    if SIMULATION_CONFIG['viewport'] is not None:
+        renderer = ViewportRenderer(*SIMULATION_CONFIG['viewport'])
+    elif SIMULATION_CONFIG['diff_rendering']:
+        renderer = DiffConsoleRenderer()
+    simulation = Simulation(size=SIMULATION_CONFIG['board_size'], renderer=renderer)
     
     # Инициализируем симуляцию начальными существами
     simulation.initialize(
@@ -25,7 +32,10 @@ def main():
             min_grass=SIMULATION_CONFIG['min_grass'],
             spawn_chance=SIMULATION_CONFIG['grass_spawn_chance']
         ),
-        MoveAction(),
+        MoveAction(
+            planning_workers=SIMULATION_CONFIG['planning_workers'],
+            planning_processes=SIMULATION_CONFIG['planning_processes']
+        ),
         HungerAction(hunger_damage=SIMULATION_CONFIG['hunger_damage']),
         HealthCheckAction()
     ]
@@ -2,9 +2,10 @@ from .actions.action import Action
 from .core import Board, Coordinates, Simulation
 from .entities import Herbivore, Predator, Grass, Stone
 from .entities.creature import Creature
-from .renderers import BoardConsoleRenderer
+from .renderers import BoardConsoleRenderer, DiffConsoleRenderer, ViewportRenderer, FrameExporter
 from .actions import SpawnGrassAction, MoveAction, HealthCheckAction, HungerAction, InitAction
 from .config import SIMULATION_CONFIG, CREATURE_CONFIG
+from .utils.profiler import TurnProfiler
 
 __all__ = [
     # Core
@@ -14,11 +15,14 @@ __all__ = [
     'Herbivore', 'Predator', 'Grass', 'Stone', 'Creature',
     
     # Renderers
-    'BoardConsoleRenderer',
+    'BoardConsoleRenderer', 'DiffConsoleRenderer', 'ViewportRenderer', 'FrameExporter',
     
     # Actions
     'SpawnGrassAction', 'MoveAction', 'HealthCheckAction', 'HungerAction', 'InitAction','Action',
     
     # Config
-    'SIMULATION_CONFIG', 'CREATURE_CONFIG'
+    'SIMULATION_CONFIG', 'CREATURE_CONFIG',
+    
+    # Utils
+    'TurnProfiler'
 ]
@@ -1,4 +1,31 @@
+from typing import FrozenSet
+
+
 class Action:
+    """
+    Базовое действие хода.
+
+    Атрибуты для планировщика (ActionScheduler):
+        frequency: Выполнять раз в N ходов
+        offset: Номер хода внутри периода, на котором выполняется действие
+        reads: Части состояния, которые действие читает
+        writes: Части состояния, которые действие изменяет
+        skip_if_unchanged: Результат действия определяется только reads,
+            поэтому его можно пропустить, если они не менялись с прошлого выполнения
+
+    Части состояния обозначаются строками: 'positions' (размещение сущностей),
+    'hp' (здоровье существ), 'grass' (трава на поле).
+    """
+    frequency: int = 1
+    offset: int = 0
+    reads: FrozenSet[str] = frozenset()
+    writes: FrozenSet[str] = frozenset()
+    skip_if_unchanged: bool = False
+
+    def should_run(self, board) -> bool:
+        """Дешевая проверка, есть ли для действия работа на текущем ходу."""
+        return True
+
     def execute(self, board, logger):
         """Выполнить действие."""
         pass
@@ -1,7 +1,17 @@
 from ..entities.creature import Creature
 from .action import Action
+from ..utils.events import EventCode
 
 class HealthCheckAction(Action):
+    reads = frozenset({'hp'})
+    writes = frozenset({'positions'})
+    # Новые погибшие появляются только после изменения здоровья
+    skip_if_unchanged = True
+
+    def should_run(self, board):
+        """Проверять нечего, если на поле нет существ."""
+        return board.count_entities_by_type(Creature) > 0
+
     def execute(self, board, logger):
         """Проверяет здоровье существ и удаляет мёртвых."""
         entities_to_remove = []
@@ -9,7 +19,7 @@ class HealthCheckAction(Action):
         for coordinates, entity in board.entities.items():
             if isinstance(entity, Creature) and entity.hp <= 0:
                 entities_to_remove.append(coordinates)
-                logger.log_action(entity, "Погиб", f"на координатах ({coordinates.x}, {coordinates.y})")
+                logger.emit(EventCode.DIED, entity, coordinates.x, coordinates.y)
                 
         for coordinates in entities_to_remove:
             board.remove_entity(coordinates) 
\ No newline at end of file
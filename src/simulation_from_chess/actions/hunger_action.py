@@ -1,14 +1,22 @@
 from ..actions.action import Action
 from ..entities.creature import Creature
 from ..core.board import Board
+from ..utils.events import EventCode
 from ..utils.logger import Logger
 
 
 class HungerAction(Action):
+    reads = frozenset({'hp'})
+    writes = frozenset({'hp', 'positions'})
+
     def __init__(self, hunger_damage: int):
         self.hunger_damage = hunger_damage
         self.dead_entities = {}  # Словарь для хранения мертвых существ и их координат
 
+    def should_run(self, board: Board) -> bool:
+        """Голод действует, пока на поле есть существа или не убраны погибшие."""
+        return bool(self.dead_entities) or board.count_entities_by_type(Creature) > 0
+
     def execute(self, board: Board, logger: Logger) -> None:
         """
         Применяет урон от голода ко всем существам.
@@ -17,19 +25,20 @@ class HungerAction(Action):
             board: Игровое поле
             logger: Логгер для записи действий
         """
-        # Сначала удаляем существ, умерших на прошлом ходу
+        # Сначала удаляем существ, умерших на прошлом ходу (если их еще не убрала проверка здоровья)
         for coordinates, entity in self.dead_entities.items():
-            board.remove_entity(coordinates)
+            if board.get_entity(coordinates) is entity:
+                board.remove_entity(coordinates)
         self.dead_entities.clear()
         
-        # Обрабатываем текущий ход
-        for coordinates, entity in board.entities.items():
-            if isinstance(entity, Creature):
-                # Применяем урон от голода
-                old_hp = entity.hp
-                entity.take_damage(self.hunger_damage)
-                
-                # Если существо погибло, добавляем в список мертвых
-                if entity.hp <= 0:
-                    logger.log_action(entity, "Погиб", f"от голода на координатах ({coordinates.x}, {coordinates.y})")
-                    self.dead_entities[coordinates] = entity
\ No newline at end of file
+        # Здоровье существ уменьшается аналитически, обрабатываются только погибающие на этом ходу
+        store = board.store
+        drain_before = store.hunger_drain
+        for row in store.drain_hunger(self.hunger_damage):
+            entity = store.entities[row]
+            coordinates = entity.coordinates
+            # От голода погибли только те, кто был жив до этого урона; остальных (например,
+            # раненых в атаке) очередь выдает сейчас, но голод не причина их гибели
+            starved = store.hp[row] + store.fed_drain[row] > drain_before
+            logger.emit(EventCode.STARVED if starved else EventCode.DIED, entity, coordinates.x, coordinates.y)
+            self.dead_entities[coordinates] = entity
\ No newline at end of file
@@ -44,7 +44,7 @@ class InitAction(Action):
                 self._place_entities(board, entity_class, count, logger)
         
         # Обновляем состояние всех существ после размещения
-        logger.log_creatures_state(board.entities)
+        logger.sync_board(board)
         
         # Логируем начальное состояние всех существ
         for entity in board.entities.values():
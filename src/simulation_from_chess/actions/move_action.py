@@ -1,16 +1,75 @@
-from typing import List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from ..actions.action import Action
+from ..core.board_snapshot import BoardSnapshot
+from ..core.coordinates import Coordinates
+from ..core.move_resolver import MoveRequest, MoveResolver
+from ..core.shard_planner import ShardedPlanner
 from ..entities import Entity
 from ..entities.herbivore import Herbivore
 from ..entities.predator import Predator
-from ..entities.creature import Creature
+from ..entities.creature import Creature, MoveDecision, MovePlan
+from ..utils.distance_calculator import DistanceCalculator
+from ..utils.events import EventCode
+
+
+def _changed_within(changed: Set[Coordinates], center: Coordinates, radius: int) -> Iterator[Coordinates]:
+    """
+    Измененные клетки на манхэттенском расстоянии не больше radius от center.
+
+    Перебирается меньшее из двух множеств: журнал изменений или клетки ромба радиуса radius.
+    """
+    if len(changed) <= 2 * radius * (radius + 1) + 1:
+        for coordinates in changed:
+            if DistanceCalculator.manhattan_distance(center, coordinates) <= radius:
+                yield coordinates
+        return
+    for dx in range(-radius, radius + 1):
+        rest = radius - abs(dx)
+        for dy in range(-rest, rest + 1):
+            coordinates = Coordinates(center.x + dx, center.y + dy)
+            if coordinates in changed:
+                yield coordinates
+
+
+def _plan_chunk(snapshot: BoardSnapshot, entities: Sequence[Creature]) -> List[MovePlan]:
+    """Расчет планов части существ в рабочем потоке (результат - буфер этого потока)."""
+    return [entity.plan_move(snapshot) for entity in entities]
 
 
 class MoveAction(Action):
-    def __init__(self):
+    reads = frozenset({'positions', 'hp', 'grass'})
+    writes = frozenset({'positions', 'hp', 'grass'})
+
+    def __init__(self, planning_workers: int = 1, planning_processes: int = 1):
+        """
+        Args:
+            planning_workers: Потоков для фазы планирования (1 - последовательно).
+                Имеет смысл на сборках CPython без GIL (3.13t и новее).
+            planning_processes: Процессов для фазы планирования по полосам поля
+                (1 - без процессов, см. ShardedPlanner)
+                
+        Raises:
+            ValueError: Если количество потоков или процессов меньше 1 или заданы оба
+        """
+        if planning_workers < 1:
+            raise ValueError(f"Количество потоков планирования должно быть не меньше 1, получено: {planning_workers}")
+        if planning_processes < 1:
+            raise ValueError(f"Количество процессов планирования должно быть не меньше 1, получено: {planning_processes}")
+        if planning_workers > 1 and planning_processes > 1:
+            raise ValueError("Планирование выполняется либо потоками, либо процессами, но не обоими способами")
+        self.planning_workers = planning_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.planner = ShardedPlanner(planning_processes) if planning_processes > 1 else None
         self.is_planning_phase = True  # Флаг для отслеживания фазы
         self.planned_entities = []  # Список существ с запланированными действиями
+        # Планы фазы планирования и журнал изменений доски после их расчета
+        self._plans: Dict[Creature, MovePlan] = {}
+        self._journal: Optional[Set[Coordinates]] = None
+        self._journal_board = None
+        self.plan_stats = {'reused': 0, 'replanned': 0}
+        self.resolver = MoveResolver()  # Одновременное разрешение перемещений фазы выполнения
 
     def _format_target_description(self, target: Entity) -> str:
         """
@@ -30,6 +89,90 @@ class MoveAction(Action):
             # Для остальных сущностей только координаты
             return f"{target_type} на ({target.coordinates.x}, {target.coordinates.y})"
 
+    def plan_creatures(self, board, entities: Sequence[Creature]) -> List[MovePlan]:
+        """
+        Расчет планов для существ в порядке entities.
+        
+        При planning_workers > 1 список делится на непрерывные части по числу
+        потоков; потоки читают общий неизменяемый снимок доски и возвращают
+        планы своей части, которые объединяются в исходном порядке. Поэтому
+        результат не зависит от количества потоков и порядка их завершения.
+        При planning_processes > 1 планы рассчитывает ShardedPlanner.
+        """
+        if self.planner is not None:
+            return self.planner.plan(board, entities)
+        workers = min(self.planning_workers, len(entities))
+        if workers <= 1:
+            return [entity.plan_move(board) for entity in entities]
+
+        snapshot = BoardSnapshot(board)
+        size = -(-len(entities) // workers)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.planning_workers, thread_name_prefix='planning')
+        futures = [
+            self._executor.submit(_plan_chunk, snapshot, entities[start:start + size])
+            for start in range(0, len(entities), size)
+        ]
+        plans = []
+        for future in futures:
+            plans.extend(future.result())
+        # Запросы к поиску пути снимка учитываются в счетчике доски (его читает профилировщик)
+        board.path_finder.call_count += snapshot.path_finder.call_count
+        return plans
+
+    def shutdown(self) -> None:
+        """Остановка потоков и процессов планирования (если они создавались)."""
+        if self.planner is not None:
+            self.planner.shutdown()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _open_journal(self, board) -> None:
+        self._close_journal()
+        self._journal = board.open_change_journal()
+        self._journal_board = board
+
+    def _close_journal(self) -> None:
+        if self._journal_board is not None:
+            self._journal_board.close_change_journal(self._journal)
+        self._journal = None
+        self._journal_board = None
+
+    @staticmethod
+    def _is_plan_valid(board, entity: Creature, plan: MovePlan, changed: Set[Coordinates]) -> bool:
+        """
+        Проверка, что план существа совпадет с пересчитанным заново.
+
+        План устарел, если существо сместилось, изменилась клетка в пределах его
+        скорости (доступные ходы), цель ушла или погибла, или в измененной клетке
+        не дальше цели появилась сущность целевого типа (могла стать ближайшей).
+        """
+        coordinates = entity.coordinates
+        if plan.coordinates != coordinates:
+            return False
+        for _ in _changed_within(changed, coordinates, entity.speed):
+            return False
+
+        target = plan.target
+        if target is None:
+            radius = board.width + board.height
+        else:
+            if board.get_entity(plan.target_coordinates) is not target:
+                return False
+            if isinstance(target, Creature) and target.hp <= 0:
+                return False
+            radius = DistanceCalculator.manhattan_distance(coordinates, plan.target_coordinates)
+        target_type = entity.target_type
+        for cell in _changed_within(changed, coordinates, radius):
+            if isinstance(board.get_entity(cell), target_type):
+                return False
+        return True
+
+    def should_run(self, board) -> bool:
+        """Двигаться некому, если на поле нет существ."""
+        return board.count_entities_by_type(Creature) > 0
+
     def execute(self, board, logger) -> None:
         """
         Перемещение всех существ на поле.
@@ -38,25 +181,39 @@ class MoveAction(Action):
             board: Игровая доска
             logger: Логгер для записи действий
         """
+        # Журнал проверяется один раз: отключенный журнал не стоит ничего, кроме этой проверки
+        log_enabled = logger.enabled
         # Обновляем состояние всех существ в начале действия
-        logger.log_creatures_state(board.entities)
-        
-        entities = [
-            entity for entity in board.entities.values()
-            if isinstance(entity, (Herbivore, Predator))
-        ]
+        if log_enabled:
+            logger.sync_board(board)
+
+        # Сытые существа спят до хода, когда им снова понадобится пища, и не участвуют в фазах
+        store = board.store
+        woken_rows = store.wake_due()
+        resting = store.resting
 
         if self.is_planning_phase:
             # Фаза планирования
+            self._close_journal()
+            self._plans.clear()
             self.planned_entities.clear()
+            entities = []
+            for entity in board.entities.values():
+                if not isinstance(entity, (Herbivore, Predator)) or entity._row in resting:
+                    continue
+                if not entity.needs_food() and store.park(entity._row):
+                    entity.planned_action = ("Отдыхает", "сыт")
+                    board.update_entity_state(entity)
+                    if log_enabled:
+                        logger.log_action(entity, "Отдыхает", "сыт")
+                    continue
+                entities.append(entity)
             
-            # Обновляем доступные ходы для всех существ
-            for entity in entities:
-                entity.update_available_moves(board)
-            
-            # Планируем действия и логируем их
-            for entity in entities:
-                target = entity.find_target(board)
+            # Рассчитываем доступные ходы и цель, планируем действия и логируем их
+            plans = self._plans
+            for entity, plan in zip(entities, self.plan_creatures(board, entities)):
+                plans[entity] = plan
+                target = plan.target
                 if target and entity.needs_food():
                     if entity._can_interact_with_target(target):
                         planned_action = entity._get_planned_interaction(target)
@@ -81,39 +238,97 @@ class MoveAction(Action):
                 
                 entity.planned_action = planned_action
                 board.update_entity_state(entity)
-                logger.log_action(entity, planned_action[0], planned_action[1])
+                if log_enabled:
+                    logger.log_action(entity, planned_action[0], planned_action[1])
                 self.planned_entities.append(entity)
+
+            # Дальнейшие изменения доски записываются, чтобы при выполнении пересчитать только устаревшие планы
+            self._open_journal(board)
         else:
-            # Фаза выполнения
-            for entity in self.planned_entities:
-                if entity in entities:  # Проверяем, что существо всё ещё живо
-                    old_coords = entity.coordinates  # Запоминаем старые координаты
-                    move_result = entity.make_move(board)
-                    
-                    if not move_result or not isinstance(move_result, (list, tuple)):
+            # Фаза выполнения: запланированные существа и проснувшиеся после планирования
+            planned = self.planned_entities
+            if woken_rows:
+                already_planned = set(planned)
+                planned.extend(
+                    store.entities[row] for row in woken_rows
+                    if store.entities[row] not in already_planned
+                )
+            changed = self._journal if self._journal_board is board else None
+
+            # Все существа выбирают действие по одному и тому же состоянию доски
+            decisions = []
+            for entity in planned:
+                # Проверяем, что существо всё ещё на доске (могло быть съедено в этом же ходу)
+                if board.get_entity(entity.coordinates) is entity:
+                    plan = self._plans.get(entity)
+                    if plan is not None and changed is not None and self._is_plan_valid(board, entity, plan, changed):
+                        self.plan_stats['reused'] += 1
+                    else:
+                        plan = None
+                        self.plan_stats['replanned'] += 1
+                    decisions.append((entity, entity.coordinates, entity.decide_move(board, plan)))
+
+            # Взаимодействия выполняются по порядку; цель могла исчезнуть из-за предыдущих
+            results = {}
+            requests = []
+            for entity, old_coords, decision in decisions:
+                if decision.kind == MoveDecision.INTERACT:
+                    target = decision.target
+                    if board.get_entity(entity.coordinates) is not entity:
                         continue
-                    
-                    # Логируем результаты действий
-                    if isinstance(move_result[0], tuple):
-                        for action in move_result:
-                            if len(action) == 4:  # Действие с информацией о смерти
-                                action_type, details, target, killer = action
-                                logger.log_action(target, action_type, details, killer=killer)
-                            elif len(action) == 2:  # Обычное действие
-                                if action[0] == "Переместился":
-                                    logger.log_action(
-                                        entity,
-                                        action[0],
-                                        f"с ({old_coords.x}, {old_coords.y}) на {action[1]}"
-                                    )
-                                else:
-                                    logger.log_action(entity, action[0], action[1])
+                    if board.get_entity(target.coordinates) is not target:
+                        results[entity] = [("Неудачное взаимодействие", "цель уже исчезла")]
+                    else:
+                        results[entity] = entity.perform_interaction(board, target)
+                elif decision.kind == MoveDecision.MOVE:
+                    # Приоритет у более голодного существа
+                    requests.append(MoveRequest(entity, old_coords, decision.destination, entity.hp))
+                else:
+                    results[entity] = [entity.planned_action]
+
+            # Перемещения разрешаются и применяются одним пакетом
+            moved = self.resolver.resolve(board, requests)
+            for request in requests:
+                if board.get_entity(request.entity.coordinates) is request.entity:
+                    results[request.entity] = request.entity.finish_move(
+                        board, request.target, moved[request.entity]
+                    )
+
+            if log_enabled:
+                for entity, old_coords, _ in decisions:
+                    if entity in results:
+                        self._log_results(logger, entity, old_coords, results[entity])
+
+            self._close_journal()
+            self._plans.clear()
         
         # Переключаем фазу
         self.is_planning_phase = not self.is_planning_phase
         
         # После выполнения всех действий обновляем состояние
-        logger.log_creatures_state(board.entities)
+        if log_enabled:
+            logger.sync_board(board)
+
+    @staticmethod
+    def _log_results(logger, entity: Creature, old_coords: Coordinates, move_result: List[Tuple]) -> None:
+        """Логирование результатов действия существа."""
+        if not move_result or not isinstance(move_result, (list, tuple)):
+            return
+        if isinstance(move_result[0], tuple):
+            for action in move_result:
+                if len(action) == 4:  # Действие с информацией о смерти
+                    action_type, details, target, killer = action
+                    logger.log_action(target, action_type, details, killer=killer)
+                elif len(action) == 2:  # Обычное действие
+                    if action[0] == "Переместился":
+                        # Текст перемещения строится только при чтении журнала
+                        coordinates = entity.coordinates
+                        logger.emit(
+                            EventCode.MOVED, entity,
+                            old_coords.x, old_coords.y, coordinates.x, coordinates.y
+                        )
+                    else:
+                        logger.log_action(entity, action[0], action[1])
 
     def __repr__(self) -> str:
         return "MoveAction()"
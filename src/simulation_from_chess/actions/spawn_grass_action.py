@@ -3,10 +3,14 @@ from typing import List
 
 from ..core.coordinates import Coordinates
 from ..entities.grass import Grass
+from ..utils.events import EventCode
 from .action import Action
 
 
 class SpawnGrassAction(Action):
+    reads = frozenset({'grass', 'positions'})
+    writes = frozenset({'grass', 'positions'})
+
     def __init__(self, min_grass: int = 3, spawn_chance: float = 0.3):
         """
         Инициализация действия спавна травы.
@@ -18,6 +22,10 @@ class SpawnGrassAction(Action):
         self.min_grass = min_grass
         self.spawn_chance = spawn_chance
 
+    def should_run(self, board) -> bool:
+        """Трава может появиться, только если ее меньше минимума и есть свободные клетки."""
+        return self._count_grass(board) < self.min_grass and board.has_vacant_cells()
+
     def execute(self, board, logger) -> None:
         """
         Добавляет траву на поле, если её слишком мало.
@@ -35,12 +43,11 @@ class SpawnGrassAction(Action):
                 spawn_pos = empty_coords[randint(0, len(empty_coords) - 1)]
                 grass = Grass(spawn_pos)
                 if board.place_entity(spawn_pos, grass):
-                    logger.log_action(grass, "Появилась", f"на координатах ({spawn_pos.x}, {spawn_pos.y})")
+                    logger.emit(EventCode.SPAWNED, grass, spawn_pos.x, spawn_pos.y)
 
     def _count_grass(self, board) -> int:
         """Подсчет количества травы на поле."""
-        return sum(1 for entity in board.entities.values() 
-                  if isinstance(entity, Grass))
+        return board.count_entities_by_type(Grass)
 
     def _should_spawn(self) -> bool:
         """Проверка, должна ли появиться новая трава."""
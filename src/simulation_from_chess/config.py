@@ -30,5 +30,11 @@ SIMULATION_CONFIG = {
     'grass_spawn_chance': 0.3,
     'hunger_damage': 5,
     'max_turns': 100,
-    'turn_delay': 1.0
+    'turn_delay': 1.0,
+    'planning_workers': 1,  # Потоков планирования ходов (выигрыш только на CPython без GIL)
+    'planning_processes': 1,  # Процессов планирования ходов по полосам поля
+    'history_retention': 0,  # Сколько последних ходов хранить в истории состояний (0 - не хранить, включается явно)
+    'history_keyframe_interval': 10,  # Ходов между ключевыми кадрами истории
+    'diff_rendering': False,  # Перерисовывать только изменившиеся клетки (DiffConsoleRenderer)
+    'viewport': None,  # (ширина, высота) окна поля с мини-картой (ViewportRenderer), None - все поле
 }
\ No newline at end of file
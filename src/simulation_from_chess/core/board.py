@@ -1,20 +1,27 @@
-from typing import Dict, Optional, List, Type, Tuple, Set
+from collections import deque
+from typing import Deque, Dict, Optional, List, Type, Tuple, Set
 
 from .board_state import BoardState
 from .coordinates import Coordinates
+from .entity_store import EntityStore
 from .interfaces import IBoard
 from .path_finder import PathFinder
+from .zobrist import zobrist_key
 from ..entities.entity import Entity  # Базовый класс вместо конкретных
 from ..utils.distance_calculator import DistanceCalculator
 
 class Board:
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, hash_history_size: int = 64,
+                 history_retention: int = 0, keyframe_interval: int = 10):
         """
         Инициализация игровой доски.
         
         Args:
             width: Ширина поля
             height: Высота поля
+            hash_history_size: Сколько последних хешей состояния хранить для поиска циклов
+            history_retention: Сколько последних ходов хранить в истории состояний (0 - не хранить)
+            keyframe_interval: Ходов между ключевыми кадрами истории
             
         Raises:
             ValueError: Если размеры поля невалидны
@@ -25,9 +32,19 @@ class Board:
         self.width = width
         self.height = height
         self.entities: Dict[Coordinates, Entity] = {}
-        self.game_state = BoardState()
+        self.store = EntityStore()  # Поля размещенных сущностей в столбцах
+        self.game_state = BoardState(history_retention, keyframe_interval)
+        self._next_entity_id = 1  # Идентификатор, выдаваемый следующей размещенной сущности
         self.path_finder = PathFinder(self)
         self._entity_cache: Dict[Type[Entity], List[Entity]] = {}
+        self.mutation_count = 0  # Количество изменений доски (размещение, перемещение, удаление)
+        self.bulk_mutation_count = 0  # Количество массовых изменений (clear, recount_entities), не попадающих в журналы
+        self._type_counts: Dict[Type[Entity], int] = {}  # Количество сущностей каждого класса
+        # Хеш Zobrist расстановки сущностей, обновляется при каждом изменении доски
+        self.zobrist_hash = 0
+        self.hash_history: Deque[int] = deque(maxlen=hash_history_size)
+        # Открытые журналы клеток, в которых менялось размещение (см. open_change_journal)
+        self._change_journals: List[Set[Coordinates]] = []
 
     def is_valid_coordinates(self, coordinates: Coordinates) -> bool:
         """
@@ -61,9 +78,18 @@ class Board:
             
         self.entities[coordinates] = entity
         entity.coordinates = coordinates
+        if entity.entity_id is None:
+            self._assign_entity_id(entity)
+        self.store.attach(entity)
+        entity_class = type(entity)
+        self._type_counts[entity_class] = self._type_counts.get(entity_class, 0) + 1
+        self.zobrist_hash ^= zobrist_key(entity_class.type_code, coordinates.x, coordinates.y)
+        for journal in self._change_journals:
+            journal.add(coordinates)
+        self.mutation_count += 1
         self._invalidate_cache()
 
-    def move_entity(self, old_coordinates: Coordinates, new_coordinates: Coordinates) -> None:
+    def move_entity(self, old_coordinates: Coordinates, new_coordinates: Coordinates) -> bool:
         """
         Перемещение сущности с одних координат на другие.
         
@@ -71,6 +97,9 @@ class Board:
             old_coordinates: Текущие координаты сущности
             new_coordinates: Новые координаты для перемещения
             
+        Returns:
+            bool: True после успешного перемещения
+            
         Raises:
             ValueError: Если координаты невалидны или позиция занята
         """
@@ -87,7 +116,16 @@ class Board:
         del self.entities[old_coordinates]
         self.entities[new_coordinates] = entity
         entity.coordinates = new_coordinates
+        self.store.move(entity, new_coordinates)
+        type_code = type(entity).type_code
+        self.zobrist_hash ^= (zobrist_key(type_code, old_coordinates.x, old_coordinates.y) ^
+                              zobrist_key(type_code, new_coordinates.x, new_coordinates.y))
+        for journal in self._change_journals:
+            journal.add(old_coordinates)
+            journal.add(new_coordinates)
+        self.mutation_count += 1
         self._invalidate_cache()
+        return True
         
     def get_entities_in_range(self, coordinates: Coordinates, range_limit: int) -> List[Tuple[Entity, int]]:
         """Получение списка сущностей в радиусе."""
@@ -104,6 +142,42 @@ class Board:
             if isinstance(entity, entity_type)
         ]
     
+    def count_entities_by_type(self, entity_type: Type) -> int:
+        """
+        Количество сущностей определенного типа (включая подклассы) без обхода доски.
+        
+        Args:
+            entity_type: Класс сущности
+            
+        Returns:
+            int: Количество сущностей на доске
+        """
+        return sum(
+            count for entity_class, count in self._type_counts.items()
+            if issubclass(entity_class, entity_type)
+        )
+
+    def has_vacant_cells(self) -> bool:
+        """Проверка наличия хотя бы одной свободной клетки."""
+        return len(self.entities) < self.width * self.height
+
+    def recount_entities(self) -> None:
+        """Пересчет количества сущностей по типам после массовой загрузки в словарь entities."""
+        self._type_counts.clear()
+        self.zobrist_hash = 0
+        store = self.store
+        store.detach_all()
+        for coordinates, entity in self.entities.items():
+            if entity.entity_id is None:
+                self._assign_entity_id(entity)
+            store.attach(entity)
+            entity_class = type(entity)
+            self._type_counts[entity_class] = self._type_counts.get(entity_class, 0) + 1
+            self.zobrist_hash ^= zobrist_key(entity_class.type_code, coordinates.x, coordinates.y)
+        self.mutation_count += 1
+        self.bulk_mutation_count += 1
+        self._invalidate_cache()
+
     def get_entities_in_radius(self, center: Coordinates, radius: int) -> List[Entity]:
         """Получение всех сущностей в заданном радиусе."""
         return [
@@ -117,8 +191,9 @@ class Board:
         self.path_finder._available_moves_cache.clear()
 
     def _invalidate_cache(self) -> None:
-        """Инвалидация кэша сущностей."""
+        """Инвалидация кэша сущностей и кэшей поиска пути, зависящих от занятости клеток."""
         self._entity_cache.clear()
+        self.clear_caches()
         
     def get_empty_cells(self) -> List[Coordinates]:
         """Получение списка пустых клеток."""
@@ -156,7 +231,15 @@ class Board:
             coordinates: Координаты для удаления
         """
         if coordinates in self.entities:
-            del self.entities[coordinates]
+            entity = self.entities.pop(coordinates)
+            self.store.detach(entity)
+            entity_class = type(entity)
+            self._type_counts[entity_class] -= 1
+            self.zobrist_hash ^= zobrist_key(entity_class.type_code, coordinates.x, coordinates.y)
+            for journal in self._change_journals:
+                journal.add(coordinates)
+            self.mutation_count += 1
+            self._invalidate_cache()
 
     def get_entity(self, coordinates: Coordinates) -> Optional[Entity]:
         """
@@ -214,16 +297,60 @@ class Board:
         """Вычисление манхэттенского расстояния между координатами."""
         return abs(coords1.x - coords2.x) + abs(coords1.y - coords2.y)
 
+    def _assign_entity_id(self, entity: Entity) -> None:
+        """Выдача постоянного идентификатора при первом размещении сущности на доске."""
+        entity.entity_id = self._next_entity_id
+        self._next_entity_id += 1
+
     def next_turn(self) -> None:
-        """Переход к следующему ходу."""
-        self.game_state.current_turn += 1
-        # Сохраняем состояние всех сущностей
-        for entity in self.entities.values():
-            self.game_state.save_entity_state(
-                self.game_state.current_turn,
-                entity.entity_id,
-                entity.get_state()
-            )
+        """Закрытие хода: запись состояний всех сущностей в историю (если она включена)."""
+        game_state = self.game_state
+        states = {
+            entity.entity_id: entity.get_state() for entity in self.entities.values()
+        } if game_state.retention else {}
+        game_state.record_turn(states)
+
+    def open_change_journal(self) -> Set[Coordinates]:
+        """
+        Начало записи клеток, в которых меняется размещение сущностей.
+        
+        В журнал попадают клетки размещения, удаления и обе клетки перемещения.
+        Массовые clear и recount_entities не записываются: после них прежние
+        сущности не находятся на доске, что проверяется по идентичности
+        (или по изменению bulk_mutation_count).
+        
+        Returns:
+            Set[Coordinates]: Журнал, пополняемый доской до close_change_journal
+        """
+        journal: Set[Coordinates] = set()
+        self._change_journals.append(journal)
+        return journal
+
+    def close_change_journal(self, journal: Set[Coordinates]) -> None:
+        """Прекращение записи в журнал, открытый open_change_journal."""
+        self._change_journals = [opened for opened in self._change_journals if opened is not journal]
+
+    def record_hash(self) -> None:
+        """Сохранение текущего хеша расстановки в историю (вызывается в конце хода)."""
+        self.hash_history.append(self.zobrist_hash)
+
+    def detect_cycle(self, min_repeats: int = 2) -> Optional[int]:
+        """
+        Поиск периодичности в истории хешей расстановки.
+        
+        Args:
+            min_repeats: Сколько раз подряд должен повториться период
+            
+        Returns:
+            Optional[int]: Наименьший период в ходах (1 - неподвижное состояние) или None
+        """
+        history = self.hash_history
+        size = len(history)
+        for period in range(1, size // (min_repeats + 1) + 1):
+            span = period * min_repeats
+            if all(history[size - 1 - i] == history[size - 1 - i - period] for i in range(span)):
+                return period
+        return None
 
     def update_entity_state(self, entity: Entity) -> None:
         """Обновление состояния сущности."""
@@ -249,4 +376,9 @@ class Board:
     def clear(self) -> None:
         """Очистка доски от всех сущностей."""
         self.entities.clear()
+        self.store.detach_all()
+        self._type_counts.clear()
+        self.zobrist_hash = 0
+        self.mutation_count += 1
+        self.bulk_mutation_count += 1
         self._invalidate_cache()
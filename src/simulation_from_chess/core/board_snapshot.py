@@ -0,0 +1,51 @@
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Type
+
+from .coordinates import Coordinates
+from .interfaces import IBoard
+from .path_finder import PathFinder
+from ..entities.entity import Entity
+
+
+class BoardSnapshot(IBoard):
+    """
+    Неизменяемый снимок размещения сущностей для параллельного чтения.
+
+    Поддерживает методы доски, которые используют поиск цели и расчет
+    доступных ходов (Creature.plan_move), поэтому несколько потоков могут
+    планировать ходы по одному снимку, не трогая кеши живой доски.
+    Собственный PathFinder снимка только мемоизирует чистые функции
+    от неизменного размещения, поэтому его общий кеш не влияет на результат.
+    """
+    __slots__ = ('width', 'height', 'entities', '_by_class', 'path_finder')
+
+    def __init__(self, board):
+        """
+        Args:
+            board: Доска, с которой снимается размещение
+        """
+        self.width = board.width
+        self.height = board.height
+        self.entities: Mapping[Coordinates, Entity] = MappingProxyType(dict(board.entities))
+        # Сущности каждого класса в порядке словаря доски (как в Board.get_entities_by_type)
+        by_class: Dict[type, List[Entity]] = {}
+        for entity in self.entities.values():
+            by_class.setdefault(type(entity), []).append(entity)
+        self._by_class = {entity_class: tuple(entities) for entity_class, entities in by_class.items()}
+        self.path_finder = PathFinder(self)
+
+    def is_valid_coordinates(self, coordinates: Coordinates) -> bool:
+        return 1 <= coordinates.x <= self.width and 1 <= coordinates.y <= self.height
+
+    def is_position_vacant(self, coordinates: Coordinates) -> bool:
+        return coordinates not in self.entities
+
+    def get_entity(self, coordinates: Coordinates) -> Optional[Entity]:
+        return self.entities.get(coordinates)
+
+    def get_entities_by_type(self, entity_type: Type) -> List[Entity]:
+        """Сущности типа entity_type (включая подклассы) в порядке словаря доски."""
+        classes = [entity_class for entity_class in self._by_class if issubclass(entity_class, entity_type)]
+        if len(classes) == 1:
+            return list(self._by_class[classes[0]])
+        return [entity for entity in self.entities.values() if isinstance(entity, entity_type)]
@@ -1,22 +1,139 @@
-from typing import Dict, Any
-from ..entities.entity import Entity
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from .game_state import EntityState
+
+
+class TurnDelta(NamedTuple):
+    """Изменения относительно предыдущего хода."""
+    changed: Dict[int, EntityState]  # Сущности с новыми координатами, здоровьем или действием
+    removed: Tuple[int, ...]  # Сущности, исчезнувшие с доски
+
+
+class TurnGroup(NamedTuple):
+    """Ключевой кадр и дельты следующих за ним ходов."""
+    start_turn: int
+    keyframe: Dict[int, EntityState]
+    deltas: List[TurnDelta]
 
 
 class BoardState:
-    def __init__(self):
+    """
+    История состояний сущностей по ходам с ограниченным окном хранения.
+
+    В течение хода состояния сохраняются в буфер текущего хода (последняя
+    запись сущности заменяет предыдущие). При закрытии хода (record_turn)
+    раз в keyframe_interval ходов записывается ключевой кадр - состояния всех
+    сущностей, в остальные ходы - дельта только по изменившимся сущностям.
+    Хранятся последние retention ходов; старые ходы удаляются целыми
+    группами (ключевой кадр и его дельты), поэтому в памяти не больше
+    retention + keyframe_interval ходов. retention=0 отключает историю.
+    """
+
+    def __init__(self, retention: int = 0, keyframe_interval: int = 10):
+        """
+        Args:
+            retention: Сколько последних ходов хранить (0 - только текущий ход)
+            keyframe_interval: Ходов между ключевыми кадрами
+
+        Raises:
+            ValueError: Если окно хранения отрицательно или интервал кадров меньше 1
+        """
+        if retention < 0:
+            raise ValueError(f"Окно хранения истории не может быть отрицательным, получено: {retention}")
+        if keyframe_interval < 1:
+            raise ValueError(f"Интервал ключевых кадров должен быть не меньше 1, получено: {keyframe_interval}")
         self.current_turn = 0
-        self.entity_states: Dict[int, Dict[str, Dict[str, Any]]] = {}
-        
-    def save_entity_state(self, turn: int, entity_id: str, state: Dict[str, Any]) -> None:
+        self.retention = retention
+        self.keyframe_interval = keyframe_interval
+        self._pending: Dict[int, EntityState] = {}  # Состояния текущего хода
+        self._latest: Dict[int, EntityState] = {}  # Состояния последнего записанного хода
+        self._groups: Deque[TurnGroup] = deque()
+
+    def save_entity_state(self, turn: int, entity_id: int, state: EntityState) -> None:
+        """
+        Сохранение состояния сущности в текущем ходу.
+
+        Raises:
+            ValueError: Если ход не текущий (записанная история не изменяется)
+        """
+        if turn != self.current_turn:
+            raise ValueError(f"Состояние можно сохранить только в текущем ходу {self.current_turn}, получено: {turn}")
+        self._pending[entity_id] = state
+
+    def get_entity_state(self, turn: int, entity_id: int) -> Optional[EntityState]:
+        """Состояние сущности на ходу turn (None, если ход вне окна хранения или сущности не было)."""
+        if turn == self.current_turn:
+            return self._pending.get(entity_id)
+        states = self.states_at(turn)
+        return states.get(entity_id) if states is not None else None
+
+    def record_turn(self, states: Dict[int, EntityState]) -> None:
         """
-        Сохранение состояния сущности.
+        Закрытие текущего хода: запись состояний всех сущностей на доске и переход к следующему.
+
+        Args:
+            states: Идентификатор -> состояние для всех сущностей на доске (словарь
+                переходит во владение истории)
         """
-        if turn not in self.entity_states:
-            self.entity_states[turn] = {}
-        self.entity_states[turn][entity_id] = state
-        
-    def get_entity_state(self, turn: int, entity_id: str) -> Dict[str, Any]:
+        turn = self.current_turn
+        self._pending = {}
+        self.current_turn += 1
+        if not self.retention:
+            return
+
+        groups = self._groups
+        if groups and turn != self.last_turn + 1:
+            groups.clear()  # Ход изменен извне (загрузка снапшота): прежняя история несовместима
+        if not groups or turn - groups[-1].start_turn >= self.keyframe_interval:
+            groups.append(TurnGroup(turn, states, []))
+        else:
+            latest = self._latest
+            groups[-1].deltas.append(TurnDelta(
+                {entity_id: state for entity_id, state in states.items() if latest.get(entity_id) != state},
+                tuple(entity_id for entity_id in latest if entity_id not in states)
+            ))
+        self._latest = states
+
+        first_kept = turn - self.retention + 1
+        while len(groups) > 1 and groups[1].start_turn <= first_kept:
+            groups.popleft()
+
+    @property
+    def first_turn(self) -> Optional[int]:
+        """Первый ход, состояние которого хранится в истории."""
+        return self._groups[0].start_turn if self._groups else None
+
+    @property
+    def last_turn(self) -> Optional[int]:
+        """Последний записанный ход."""
+        if not self._groups:
+            return None
+        group = self._groups[-1]
+        return group.start_turn + len(group.deltas)
+
+    def states_at(self, turn: int) -> Optional[Dict[int, EntityState]]:
         """
-        Получение состояния сущности.
+        Восстановление состояний всех сущностей на записанном ходу.
+
+        Берется ближайший ключевой кадр не позже turn, к нему применяются
+        дельты, поэтому стоимость не больше keyframe_interval дельт.
+
+        Returns:
+            Optional[Dict[int, EntityState]]: Идентификатор -> состояние или None,
+                если ход вне окна хранения
         """
-        return self.entity_states.get(turn, {}).get(entity_id, {}) 
\ No newline at end of file
+        for group in reversed(self._groups):
+            if group.start_turn <= turn:
+                break
+        else:
+            return None
+        offset = turn - group.start_turn
+        if offset > len(group.deltas):
+            return None
+        states = dict(group.keyframe)
+        for delta in group.deltas[:offset]:
+            for entity_id in delta.removed:
+                del states[entity_id]
+            states.update(delta.changed)
+        return states
@@ -0,0 +1,445 @@
+import json
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
+
+from ..entities.creature import Creature
+
+# Столбцы записей: имя -> код типа array/memoryview (фиксированная ширина)
+RECORD_COLUMNS = {
+    'turn': 'I',
+    'entity_id': 'I',
+    'type_code': 'B',
+    'x': 'H',
+    'y': 'H',
+    'hp': 'i',
+    'action': 'H',  # 0 - нет действия, иначе номер в списке actions метаданных + 1
+}
+# Индекс ходов: номер хода, номер первой записи хода и признак ключевого кадра
+INDEX_COLUMNS = {
+    'index_turn': 'I',
+    'index_start': 'q',
+    'index_keyframe': 'B',
+}
+# Столбцы индекса траекторий: записи, упорядоченные по сущности, затем по ходу
+TRAJECTORY_COLUMNS = {
+    'turn': 'I',
+    'type_code': 'B',
+    'x': 'H',
+    'y': 'H',
+    'hp': 'i',
+    'action': 'H',
+}
+META_FILE = 'meta.json'
+TRAJECTORY_META_FILE = 'trajectory.json'
+FORMAT_VERSION = 2
+# Код типа записи об исчезновении сущности с доски (в ходах-дельтах)
+REMOVED_TYPE_CODE = 0xFF
+_MAX_COORDINATE = 0xFFFF
+
+
+def _column_path(directory: str, name: str) -> str:
+    return os.path.join(directory, f'{name}.col')
+
+
+class ColumnarHistoryWriter:
+    """
+    Запись истории ходов в столбцовые файлы фиксированной ширины.
+
+    Каждая запись - состояние одной сущности на ходу (ход, идентификатор,
+    код типа, x, y, здоровье, код действия); каждый столбец хранится в своем
+    файле. Записи копятся в буферах array и дописываются в файлы пакетами
+    по buffer_records; метаданные (количество записей, словарь действий)
+    обновляются при каждом сбросе, поэтому файлы читаемы и во время прогона.
+
+    Без keyframe_interval каждый ход - полный кадр. С keyframe_interval полный
+    (ключевой) кадр пишется раз в keyframe_interval ходов, а в остальные ходы -
+    только записи изменившихся сущностей и записи с кодом типа
+    REMOVED_TYPE_CODE для исчезнувших.
+    """
+
+    def __init__(self, directory: str, buffer_records: int = 65536,
+                 keyframe_interval: Optional[int] = None):
+        """
+        Args:
+            directory: Каталог для файлов столбцов (создается; прежние файлы перезаписываются)
+            buffer_records: Сколько записей накопить перед записью на диск
+            keyframe_interval: Ходов между ключевыми кадрами (None - каждый ход полный кадр)
+
+        Raises:
+            ValueError: Если размер буфера или интервал кадров меньше 1
+        """
+        if buffer_records < 1:
+            raise ValueError(f"Размер буфера должен быть не меньше 1, получено: {buffer_records}")
+        if keyframe_interval is not None and keyframe_interval < 1:
+            raise ValueError(f"Интервал ключевых кадров должен быть не меньше 1, получено: {keyframe_interval}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.buffer_records = buffer_records
+        self.keyframe_interval = keyframe_interval
+        self._turns_since_keyframe = 0
+        self.width: Optional[int] = None  # Размеры поля записываемого прогона
+        self.height: Optional[int] = None
+        self._previous: Dict[int, tuple] = {}  # Идентификатор -> (тип, x, y, hp, действие) прошлого хода
+        self.record_count = 0  # Записей на диске и в буферах
+        self.turn_count = 0
+        self.action_codes: Dict[str, int] = {}
+        self._last_turn: Optional[int] = None
+        self._columns = {name: array(typecode) for name, typecode in {**RECORD_COLUMNS, **INDEX_COLUMNS}.items()}
+        self._files = {
+            name: open(_column_path(directory, name), 'wb')
+            for name in self._columns
+        }
+
+    def append_turn(self, turn: int, board) -> None:
+        """
+        Добавление записей всех сущностей доски на ходу turn.
+
+        Raises:
+            ValueError: Если ход не больше предыдущего записанного, размеры поля
+                изменились или координаты не помещаются в формат
+        """
+        if self._last_turn is not None and turn <= self._last_turn:
+            raise ValueError(f"Ходы записываются по возрастанию: ход {turn} после {self._last_turn}")
+        if board.width > _MAX_COORDINATE or board.height > _MAX_COORDINATE:
+            raise ValueError(f"Размеры поля {board.width}x{board.height} не поддерживаются форматом истории")
+        if self.width is None:
+            self.width, self.height = board.width, board.height
+        elif (board.width, board.height) != (self.width, self.height):
+            raise ValueError(
+                f"Размеры поля изменились: {board.width}x{board.height} вместо {self.width}x{self.height}"
+            )
+        self._last_turn = turn
+        interval = self.keyframe_interval
+        keyframe = interval is None or not self.turn_count or self._turns_since_keyframe >= interval
+        self._turns_since_keyframe = 1 if keyframe else self._turns_since_keyframe + 1
+        columns = self._columns
+        columns['index_turn'].append(turn)
+        columns['index_start'].append(self.record_count)
+        columns['index_keyframe'].append(keyframe)
+
+        rows = self._rows(turn, board)
+        if interval is not None:
+            previous = self._previous
+            current = {}
+            changed = []
+            for row in rows:
+                state = row[2:]
+                current[row[1]] = state
+                if keyframe or previous.get(row[1]) != state:
+                    changed.append(row)
+            if not keyframe:
+                changed.extend(
+                    (turn, entity_id, REMOVED_TYPE_CODE, 0, 0, 0, 0)
+                    for entity_id in previous if entity_id not in current
+                )
+            self._previous = current
+            rows = changed
+
+        for name, values in zip(RECORD_COLUMNS, zip(*rows)):
+            columns[name].extend(values)
+        self.record_count += len(rows)
+        self.turn_count += 1
+
+        if len(columns['turn']) >= self.buffer_records:
+            self.flush()
+
+    def _rows(self, turn: int, board) -> List[tuple]:
+        """Записи (ход, идентификатор, тип, x, y, hp, код действия) всех сущностей доски."""
+        action_codes = self.action_codes
+        rows = []
+        for coordinates, entity in board.entities.items():
+            if isinstance(entity, Creature):
+                hp = entity.hp
+                action = entity._performed_action or entity.planned_action
+                if action:
+                    code = action_codes.get(action[0])
+                    if code is None:
+                        code = action_codes[action[0]] = len(action_codes) + 1
+                else:
+                    code = 0
+            else:
+                hp = code = 0
+            rows.append((turn, entity.entity_id, type(entity).type_code, coordinates.x, coordinates.y, hp, code))
+        return rows
+
+    def flush(self) -> None:
+        """Запись буферов в файлы столбцов и обновление метаданных."""
+        for name, column in self._columns.items():
+            if column:
+                column.tofile(self._files[name])
+                del column[:]
+            self._files[name].flush()
+        meta = {
+            'version': FORMAT_VERSION,
+            'byteorder': sys.byteorder,
+            'columns': RECORD_COLUMNS,
+            'index_columns': INDEX_COLUMNS,
+            'record_count': self.record_count,
+            'turn_count': self.turn_count,
+            'width': self.width,
+            'height': self.height,
+            'keyframe_interval': self.keyframe_interval,
+            'actions': sorted(self.action_codes, key=self.action_codes.get),
+        }
+        meta_path = os.path.join(self.directory, META_FILE)
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as file:
+            json.dump(meta, file, ensure_ascii=False)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def close(self) -> None:
+        """Сброс буферов и закрытие файлов."""
+        if not self._files:
+            return
+        self.flush()
+        for file in self._files.values():
+            file.close()
+        self._files = {}
+
+    def __enter__(self) -> 'ColumnarHistoryWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+
+def build_trajectory_index(directory: str, chunk_records: int = 65536) -> None:
+    """
+    Построение индекса траекторий для записанной истории.
+
+    Записи упорядочиваются сортировкой подсчетом по идентификатору сущности:
+    количества записей каждого идентификатора копятся в array('q'), их
+    префиксные суммы дают начала участков, а номера записей раскладываются
+    по участкам в заранее выделенный массив порядка. В файлах записи идут по
+    возрастанию хода, поэтому внутри сущности порядок остается
+    хронологическим. Столбцы TRAJECTORY_COLUMNS переписываются в этом порядке
+    пакетами по chunk_records записей, и траектория сущности становится
+    непрерывным участком каждого из них; объекты на запись не создаются.
+    Рядом пишутся идентификаторы и начала их участков. Индекс строится после
+    записи прогона; дописанная позже история его не использует до
+    повторного построения.
+
+    Args:
+        directory: Каталог, записанный ColumnarHistoryWriter
+        chunk_records: Сколько записей столбца переставляется и пишется за раз
+    """
+    with ColumnarHistoryReader(directory) as reader:
+        ids = reader.column('entity_id')
+        record_count = reader.record_count
+        counts = array('q', bytes(8 * (max(ids, default=-1) + 1)))
+        for entity_id in ids:
+            counts[entity_id] += 1
+
+        distinct, starts = array('I'), array('q')
+        positions = array('q', bytes(8 * len(counts)))  # Следующая свободная позиция участка сущности
+        start = 0
+        for entity_id, count in enumerate(counts):
+            if count:
+                distinct.append(entity_id)
+                starts.append(start)
+                positions[entity_id] = start
+                start += count
+        starts.append(start)
+
+        order = array('q', bytes(8 * record_count))  # Позиция в индексе -> номер записи
+        for record, entity_id in enumerate(ids):
+            order[positions[entity_id]] = record
+            positions[entity_id] += 1
+
+        for name, typecode in TRAJECTORY_COLUMNS.items():
+            column = reader.column(name)
+            with open(_column_path(directory, f'trajectory_{name}'), 'wb') as file:
+                for first in range(0, record_count, chunk_records):
+                    array(typecode, map(column.__getitem__, order[first:first + chunk_records])).tofile(file)
+        with open(_column_path(directory, 'trajectory_ids'), 'wb') as file:
+            distinct.tofile(file)
+        with open(_column_path(directory, 'trajectory_starts'), 'wb') as file:
+            starts.tofile(file)
+        with open(os.path.join(directory, TRAJECTORY_META_FILE), 'w', encoding='utf-8') as file:
+            json.dump({'record_count': reader.record_count}, file)
+
+
+class ColumnarHistoryReader:
+    """
+    Чтение столбцовой истории через mmap без копирования.
+
+    Столбцы возвращаются как memoryview над отображенными файлами: срез
+    по диапазону ходов не создает объектов на запись. Пока существуют
+    выданные memoryview, close() завершится ошибкой BufferError.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Каталог, записанный ColumnarHistoryWriter
+
+        Raises:
+            ValueError: Если версия формата или порядок байт не поддерживаются
+        """
+        with open(os.path.join(directory, META_FILE), encoding='utf-8') as file:
+            meta = json.load(file)
+        if meta['version'] != FORMAT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия истории: {meta['version']}")
+        if meta['byteorder'] != sys.byteorder:
+            raise ValueError(f"История записана с порядком байт {meta['byteorder']}, чтение без копирования невозможно")
+        self.directory = directory
+        self.record_count: int = meta['record_count']
+        self.keyframe_interval: Optional[int] = meta['keyframe_interval']
+        self.width: Optional[int] = meta['width']
+        self.height: Optional[int] = meta['height']
+        self.actions: List[str] = meta['actions']
+        self._maps: List[mmap.mmap] = []
+        self._columns: Dict[str, memoryview] = {}
+        for name, typecode in {**meta['columns'], **meta['index_columns']}.items():
+            self._columns[name] = self._map_column(name, typecode)
+        # Файлы могут быть дописаны после сброса метаданных: читаем только учтенные записи
+        for name in meta['columns']:
+            self._columns[name] = self._columns[name][:self.record_count]
+        for name in meta['index_columns']:
+            self._columns[name] = self._columns[name][:meta['turn_count']]
+        self.has_trajectory_index = self._map_trajectory_index()
+
+    def _map_trajectory_index(self) -> bool:
+        """Отображение столбцов индекса траекторий, если он построен для всех записей."""
+        try:
+            with open(os.path.join(self.directory, TRAJECTORY_META_FILE), encoding='utf-8') as file:
+                indexed = json.load(file)['record_count']
+        except FileNotFoundError:
+            return False
+        if indexed != self.record_count:
+            return False
+        columns = {f'trajectory_{name}': typecode for name, typecode in TRAJECTORY_COLUMNS.items()}
+        columns.update(trajectory_ids='I', trajectory_starts='q')
+        for name, typecode in columns.items():
+            self._columns[name] = self._map_column(name, typecode)
+        return True
+
+    def _map_column(self, name: str, typecode: str) -> memoryview:
+        path = _column_path(self.directory, name)
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            size -= size % array(typecode).itemsize
+            if not size:
+                return memoryview(array(typecode))
+            mapped = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    @property
+    def turns(self) -> memoryview:
+        """Номера записанных ходов по возрастанию."""
+        return self._columns['index_turn']
+
+    @property
+    def keyframes(self) -> memoryview:
+        """Признаки ключевого кадра для записанных ходов (в порядке turns)."""
+        return self._columns['index_keyframe']
+
+    def turn_start(self, position: int) -> int:
+        """Номер первой записи хода с порядковым номером position (или record_count за последним)."""
+        starts = self._columns['index_start']
+        return starts[position] if position < len(starts) else self.record_count
+
+    def column(self, name: str) -> memoryview:
+        """Весь столбец записей по имени из RECORD_COLUMNS."""
+        return self._columns[name]
+
+    def turn_slice(self, first_turn: int, last_turn: int) -> slice:
+        """Диапазон номеров записей ходов first_turn..last_turn включительно."""
+        turns = self._columns['index_turn']
+        return slice(self.turn_start(bisect_left(turns, first_turn)), self.turn_start(bisect_right(turns, last_turn)))
+
+    def turn_range(self, first_turn: int, last_turn: int) -> Dict[str, memoryview]:
+        """
+        Столбцы записей ходов first_turn..last_turn включительно (срезы без копирования).
+
+        Для ходов-дельт это только записи изменений; полное состояние
+        восстанавливает ReplayEngine.
+        """
+        records = self.turn_slice(first_turn, last_turn)
+        return {name: self._columns[name][records] for name in RECORD_COLUMNS}
+
+    def entity_records(self, entity_id: int) -> array:
+        """
+        Номера записей сущности по возрастанию хода.
+
+        Столбец идентификаторов просматривается поиском байтового образа
+        значения в отображенном файле, без создания объекта на каждую запись.
+        В режиме ключевых кадров находятся только записи изменений сущности.
+        """
+        ids = self._columns['entity_id']
+        positions = array('q')
+        if not len(ids):
+            return positions
+        raw = ids.obj if isinstance(ids.obj, mmap.mmap) else bytes(ids)
+        end = len(ids) * ids.itemsize
+        pattern = array(RECORD_COLUMNS['entity_id'], [entity_id]).tobytes()
+        offset = raw.find(pattern, 0, end)
+        while offset >= 0:
+            if offset % ids.itemsize == 0:
+                positions.append(offset // ids.itemsize)
+                offset = raw.find(pattern, offset + ids.itemsize, end)
+            else:
+                offset = raw.find(pattern, offset + 1, end)
+        return positions
+
+    def trajectory(self, entity_id: int, first_turn: Optional[int] = None,
+                   last_turn: Optional[int] = None) -> Dict[str, memoryview]:
+        """
+        Записи сущности по возрастанию хода из индекса траекторий.
+
+        Участок сущности и границы по ходам находятся двоичным поиском, столбцы
+        возвращаются непрерывными срезами без копирования. В режиме ключевых
+        кадров записи есть только на ходах изменений, поэтому первой идет
+        последняя запись не позже first_turn - состояние сущности на first_turn.
+
+        Args:
+            entity_id: Идентификатор сущности
+            first_turn: Первый ход (None - с начала)
+            last_turn: Последний ход включительно (None - до конца)
+
+        Returns:
+            Dict[str, memoryview]: Столбцы TRAJECTORY_COLUMNS (пустые, если сущности нет)
+
+        Raises:
+            ValueError: Если индекс траекторий не построен для всех записей
+        """
+        if not self.has_trajectory_index:
+            raise ValueError("Индекс траекторий не построен или устарел: вызовите build_trajectory_index")
+        ids = self._columns['trajectory_ids']
+        starts = self._columns['trajectory_starts']
+        position = bisect_left(ids, entity_id)
+        if position < len(ids) and ids[position] == entity_id:
+            start, stop = starts[position], starts[position + 1]
+        else:
+            start = stop = 0
+
+        turns = self._columns['trajectory_turn'][start:stop]
+        low = 0 if first_turn is None else bisect_left(turns, first_turn)
+        if (first_turn is not None and self.keyframe_interval is not None and low
+                and (low == len(turns) or turns[low] != first_turn)):
+            low -= 1
+        high = len(turns) if last_turn is None else max(bisect_right(turns, last_turn), low)
+        turns.release()
+        return {
+            name: self._columns[f'trajectory_{name}'][start + low:start + high]
+            for name in TRAJECTORY_COLUMNS
+        }
+
+    def close(self) -> None:
+        """Освобождение отображений файлов."""
+        for view in self._columns.values():
+            view.release()
+        self._columns = {}
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+    def __enter__(self) -> 'ColumnarHistoryReader':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
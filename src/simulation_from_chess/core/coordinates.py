@@ -1,4 +1,6 @@
 class Coordinates:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -0,0 +1,240 @@
+from array import array
+from heapq import heapify, heappop, heappush
+from typing import List, Optional, Set, Tuple
+
+
+class EntityStore:
+    """
+    Хранилище полей сущностей доски в типизированных столбцах (structure of arrays).
+
+    Каждой размещенной сущности выделяется строка. Сущность остается обычным
+    объектом, но поля существ (здоровье, скорость, питательность) читаются и
+    пишутся через строку хранилища, поэтому массовые операции могут
+    обрабатывать столбцы целиком. Координаты объекта остаются атрибутом,
+    а столбцы xs/ys обновляет доска при размещении и перемещении.
+
+    Столбцы:
+        type_codes  код типа сущности (FREE_ROW для свободной строки)
+        xs, ys      координаты
+        hp, max_hp  здоровье при последнем изменении и максимальное здоровье (0 для не-существ)
+        fed_drain   значение hunger_drain при последнем изменении здоровья
+        speed       скорость (0 для не-существ)
+        food_value  питательность пищи (NO_FOOD_VALUE, если не задана)
+
+    Голод учитывается аналитически: урон за ход одинаков для всех существ,
+    поэтому хранилище копит суммарный урон hunger_drain, а текущее здоровье
+    равно hp - (hunger_drain - fed_drain). Гибель от голода планируется
+    в очереди с приоритетом по значению hunger_drain, при котором hp
+    достигает нуля, поэтому ход голода обрабатывает только погибающих.
+
+    Сытые существа "засыпают" (строка в resting) до значения hunger_drain,
+    при котором им снова понадобится пища; их пробуждение планируется
+    во второй очереди.
+    """
+    FREE_ROW = -1
+    NO_FOOD_VALUE = -1
+
+    def __init__(self):
+        self.type_codes = array('b')
+        self.xs = array('i')
+        self.ys = array('i')
+        self.hp = array('i')
+        self.max_hp = array('i')
+        self.speed = array('i')
+        self.food_value = array('i')
+        self.fed_drain = array('q')
+        self.hunger_drain = 0
+        self.entities: List[Optional[object]] = []  # Сущность каждой строки
+        self._free_rows: List[int] = []
+        # События гибели от голода: (порог hunger_drain, порядковый номер, строка, сущность)
+        self._death_queue: List[Tuple[int, int, int, object]] = []
+        self._death_seq = 0
+        # Спящие (сытые) строки и события их пробуждения: (порог hunger_drain, номер, строка, сущность)
+        self.resting: Set[int] = set()
+        self._wake_queue: List[Tuple[int, int, int, object]] = []
+
+    def __len__(self) -> int:
+        """Количество занятых строк."""
+        return len(self.entities) - len(self._free_rows)
+
+    def attach(self, entity) -> int:
+        """
+        Выделение строки для сущности и перенос ее полей в столбцы.
+
+        Args:
+            entity: Размещаемая сущность
+
+        Returns:
+            int: Номер строки
+        """
+        hp, max_hp, speed, food_value = entity._column_values()
+        if food_value is None:
+            food_value = self.NO_FOOD_VALUE
+        coordinates = entity.coordinates
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self.type_codes[row] = entity.type_code
+            self.xs[row] = coordinates.x
+            self.ys[row] = coordinates.y
+            self.hp[row] = hp
+            self.max_hp[row] = max_hp
+            self.speed[row] = speed
+            self.food_value[row] = food_value
+            self.fed_drain[row] = self.hunger_drain
+            self.entities[row] = entity
+        else:
+            row = len(self.entities)
+            self.type_codes.append(entity.type_code)
+            self.xs.append(coordinates.x)
+            self.ys.append(coordinates.y)
+            self.hp.append(hp)
+            self.max_hp.append(max_hp)
+            self.speed.append(speed)
+            self.food_value.append(food_value)
+            self.fed_drain.append(self.hunger_drain)
+            self.entities.append(entity)
+        entity._attach(self, row)
+        return row
+
+    def move(self, entity, coordinates) -> None:
+        """Обновление координат сущности в столбцах (вызывается доской при перемещении)."""
+        self.xs[entity._row] = coordinates.x
+        self.ys[entity._row] = coordinates.y
+
+    def detach(self, entity) -> None:
+        """
+        Освобождение строки сущности; значения полей возвращаются в объект.
+
+        Args:
+            entity: Удаляемая с доски сущность
+        """
+        row = entity._row
+        entity._detach()
+        self.resting.discard(row)
+        self.type_codes[row] = self.FREE_ROW
+        self.entities[row] = None
+        self._free_rows.append(row)
+
+    def detach_all(self) -> None:
+        """Освобождение всех строк (при очистке или перезагрузке доски)."""
+        for entity in self.entities:
+            if entity is not None:
+                entity._detach()
+        for column in (self.type_codes, self.xs, self.ys, self.hp, self.max_hp, self.speed,
+                       self.food_value, self.fed_drain):
+            del column[:]
+        self.entities.clear()
+        self._free_rows.clear()
+        self._death_queue.clear()
+        self.resting.clear()
+        self._wake_queue.clear()
+
+    def set_hp(self, row: int, hp: int) -> None:
+        """
+        Установка здоровья строки с пересчетом момента гибели от голода.
+
+        Args:
+            row: Строка существа
+            hp: Новое текущее здоровье
+        """
+        self.hp[row] = hp
+        self.fed_drain[row] = self.hunger_drain
+        self.schedule_death(row)
+        if row in self.resting:
+            # Момент пробуждения сдвинулся; прежнее событие станет устаревшим
+            self._schedule_wake(row)
+
+    def schedule_death(self, row: int) -> None:
+        """Постановка в очередь события гибели строки от голода."""
+        queue = self._death_queue
+        if len(queue) > 4 * len(self) + 64:
+            self._rebuild_death_queue()
+        self._death_seq += 1
+        heappush(queue, (self.hp[row] + self.fed_drain[row], self._death_seq, row, self.entities[row]))
+
+    def drain_hunger(self, damage: int) -> List[int]:
+        """
+        Урон от голода всем существам хранилища.
+
+        Здоровье не пересчитывается построчно: увеличивается общий счетчик
+        hunger_drain, а из очереди извлекаются только события гибели,
+        наступившие к новому значению счетчика.
+
+        Args:
+            damage: Урон каждому существу
+
+        Returns:
+            List[int]: Строки существ со здоровьем <= 0 после урона
+        """
+        self.hunger_drain += damage
+        drain = self.hunger_drain
+        queue = self._death_queue
+        hp, fed_drain, entities = self.hp, self.fed_drain, self.entities
+        rows = []
+        seen = set()
+        while queue and queue[0][0] <= drain:
+            threshold, _, row, entity = heappop(queue)
+            # Событие устарело, если строка освобождена или здоровье менялось после постановки в очередь
+            if entities[row] is not entity or hp[row] + fed_drain[row] != threshold or row in seen:
+                continue
+            seen.add(row)
+            rows.append(row)
+        return rows
+
+    def park(self, row: int) -> bool:
+        """
+        Перевод сытого существа в сон до момента, когда ему понадобится пища.
+
+        Args:
+            row: Строка существа
+
+        Returns:
+            bool: False, если у существа не задана питательность пищи (оно всегда ищет пищу)
+        """
+        if self.food_value[row] == self.NO_FOOD_VALUE:
+            return False
+        self.resting.add(row)
+        self._schedule_wake(row)
+        return True
+
+    def wake_due(self) -> List[int]:
+        """
+        Пробуждение существ, которым к текущему hunger_drain снова нужна пища.
+
+        Returns:
+            List[int]: Строки проснувшихся существ
+        """
+        drain = self.hunger_drain
+        queue = self._wake_queue
+        resting, entities = self.resting, self.entities
+        rows = []
+        while queue and queue[0][0] <= drain:
+            threshold, _, row, entity = heappop(queue)
+            if row in resting and entities[row] is entity and self._wake_threshold(row) == threshold:
+                resting.discard(row)
+                rows.append(row)
+        if not resting:
+            queue.clear()
+        return rows
+
+    def _wake_threshold(self, row: int) -> int:
+        """
+        Значение hunger_drain, начиная с которого существу нужна пища.
+
+        Пища нужна при hp < entity.hunger_threshold() (порог класса существа, тот же,
+        что в needs_food), где hp = hp[row] + fed_drain[row] - hunger_drain.
+        """
+        return self.hp[row] + self.fed_drain[row] - self.entities[row].hunger_threshold() + 1
+
+    def _schedule_wake(self, row: int) -> None:
+        self._death_seq += 1
+        heappush(self._wake_queue, (self._wake_threshold(row), self._death_seq, row, self.entities[row]))
+
+    def _rebuild_death_queue(self) -> None:
+        """Перестроение очереди из актуальных событий (устаревшие копятся при частых изменениях hp)."""
+        live = {}
+        for threshold, seq, row, entity in self._death_queue:
+            if self.entities[row] is entity and self.hp[row] + self.fed_drain[row] == threshold:
+                live[row] = (threshold, seq, row, entity)
+        self._death_queue = list(live.values())
+        heapify(self._death_queue)
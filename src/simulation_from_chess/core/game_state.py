@@ -1,11 +1,9 @@
-from dataclasses import dataclass
-from typing import Dict, Optional, Any
+from typing import Dict, NamedTuple, Optional, Any
 from ..core.coordinates import Coordinates
 
 
-@dataclass
-class EntityState:
-    """Состояние сущности на определенном ходу."""
+class EntityState(NamedTuple):
+    """Состояние сущности на определенном ходу (неизменяемая запись без __dict__)."""
     coordinates: Coordinates
     hp: Optional[int] = None
     planned_action: Optional[tuple] = None
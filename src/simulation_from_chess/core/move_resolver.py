@@ -0,0 +1,73 @@
+import random
+from typing import Dict, List, NamedTuple, Sequence
+
+from .coordinates import Coordinates
+
+
+class MoveRequest(NamedTuple):
+    """Заявка существа на перемещение в клетку."""
+    entity: object
+    source: Coordinates
+    target: Coordinates
+    priority: float  # Меньшее значение - более высокий приоритет
+
+
+class MoveResolver:
+    """
+    Пакетное разрешение одновременных перемещений через таблицу резервирования клеток.
+
+    Все существа подают заявки, после чего за один проход:
+        - для каждой клетки назначения выбирается одна заявка: с наименьшим
+          priority, при равенстве - случайно (через переданный генератор);
+        - заявка в занятую клетку отклоняется, даже если занявшее ее существо
+          само уходит на этом ходу: решения о перемещении принимаются по доске
+          до применения перемещений и выбирают только свободные клетки, поэтому
+          разрешаются лишь конфликты за одну и ту же клетку назначения.
+    """
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: Генератор для разрешения равных приоритетов (по умолчанию модуль random)
+        """
+        self.rng = rng if rng is not None else random
+        self.stats = {'applied': 0, 'conflicts': 0, 'blocked': 0}
+
+    def resolve(self, board, requests: Sequence[MoveRequest]) -> Dict[object, bool]:
+        """
+        Разрешение конфликтов и применение выигравших перемещений.
+
+        Заявки существ, которые к моменту разрешения уже не стоят на исходной
+        клетке (например, были съедены), отбрасываются.
+
+        Args:
+            board: Игровая доска
+            requests: Заявки на перемещение (не больше одной на существо)
+
+        Returns:
+            Dict[object, bool]: Для каждого существа с заявкой - выполнено ли перемещение
+        """
+        results = {request.entity: False for request in requests}
+
+        # Таблица резервирования: клетка назначения -> выигравшая заявка
+        claims: Dict[Coordinates, List[MoveRequest]] = {}
+        for request in requests:
+            if board.get_entity(request.source) is request.entity:
+                claims.setdefault(request.target, []).append(request)
+        reserved: Dict[Coordinates, MoveRequest] = {}
+        for target, contenders in claims.items():
+            if len(contenders) > 1:
+                self.stats['conflicts'] += len(contenders) - 1
+                tiebreak = {id(request): self.rng.random() for request in contenders}
+                contenders.sort(key=lambda request: (request.priority, tiebreak[id(request)]))
+            reserved[target] = contenders[0]
+
+        # Занятость клеток проверяется до применения, чтобы результат не зависел от порядка заявок;
+        # выигравшие заявки назначены в разные свободные клетки и применяются в любом порядке
+        accepted = [request for target, request in reserved.items() if board.get_entity(target) is None]
+        self.stats['blocked'] += len(reserved) - len(accepted)
+        for request in accepted:
+            board.move_entity(request.source, request.target)
+            results[request.entity] = True
+            self.stats['applied'] += 1
+        return results
@@ -11,6 +11,7 @@ class PathFinder:
         self.board = board
         self._path_cache = {}
         self._available_moves_cache = {}
+        self.call_count = 0  # Количество запросов к поиску пути и доступных ходов
         
     def find_path(self, start: Coordinates, end: Coordinates, max_distance: int = None) -> Optional[List[Coordinates]]:
         """
@@ -21,6 +22,7 @@ class PathFinder:
             end: Конечные координаты
             max_distance: Максимальная длина пути
         """
+        self.call_count += 1
         cache_key = (start, end, max_distance)
         if cache_key in self._path_cache:
             return self._path_cache[cache_key]
@@ -40,6 +42,7 @@ class PathFinder:
         Returns:
             Set[Coordinates]: Множество доступных координат для перемещения
         """
+        self.call_count += 1
         cache_key = (coordinates, speed)
         if cache_key in self._available_moves_cache:
             return self._available_moves_cache[cache_key]
@@ -57,6 +60,7 @@ class PathFinder:
     
     def find_nearest_target(self, start: Coordinates, target_type: type, max_distance: int = None) -> Optional[Tuple[Entity, List[Coordinates]]]:
         """Поиск ближайшей цели определенного типа."""
+        self.call_count += 1
         nearest_target = None
         best_path = None
         min_distance = float('inf')
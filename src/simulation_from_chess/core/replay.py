@@ -0,0 +1,139 @@
+from array import array
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, NamedTuple, Tuple
+
+from .board import Board
+from .columnar_history import REMOVED_TYPE_CODE, ColumnarHistoryReader
+from .coordinates import Coordinates
+from .snapshot import SnapshotSerializer
+from ..entities.creature import Creature
+
+
+class ReplayRecord(NamedTuple):
+    """Состояние сущности в восстановленном кадре."""
+    type_code: int
+    x: int
+    y: int
+    hp: int
+    action: int  # Код действия: 0 - нет, иначе номер в reader.actions + 1
+
+
+class ReplayEngine:
+    """
+    Восстановление доски записанного прогона на любом ходу.
+
+    Поиск хода берет ближайший ключевой кадр не позже него и применяет
+    дельты следующих ходов, поэтому стоимость не зависит от номера хода и
+    ограничена интервалом ключевых кадров (для истории без интервала каждый
+    ход - ключевой кадр).
+    """
+
+    def __init__(self, reader: ColumnarHistoryReader):
+        """
+        Args:
+            reader: Открытая столбцовая история прогона
+        """
+        self.reader = reader
+        keyframes = reader.keyframes
+        # Порядковые номера ходов с ключевыми кадрами (один проход по индексу ходов)
+        self._keyframe_positions = array('q', (
+            position for position in range(len(keyframes)) if keyframes[position]
+        ))
+
+    def _position(self, turn: int) -> int:
+        turns = self.reader.turns
+        position = bisect_right(turns, turn) - 1
+        if position < 0 or turns[position] != turn:
+            raise ValueError(f"Ход {turn} не записан в истории")
+        return position
+
+    def _apply(self, frame: Dict[int, ReplayRecord], start: int, stop: int) -> None:
+        """Применение записей start..stop-1 к кадру."""
+        reader = self.reader
+        ids, types = reader.column('entity_id'), reader.column('type_code')
+        xs, ys, hps, actions = reader.column('x'), reader.column('y'), reader.column('hp'), reader.column('action')
+        for index in range(start, stop):
+            type_code = types[index]
+            if type_code == REMOVED_TYPE_CODE:
+                frame.pop(ids[index], None)
+            else:
+                frame[ids[index]] = ReplayRecord(type_code, xs[index], ys[index], hps[index], actions[index])
+
+    def _seek(self, position: int) -> Dict[int, ReplayRecord]:
+        """Кадр хода с порядковым номером position: ключевой кадр и дельты после него."""
+        keyframe = self._keyframe_positions[bisect_right(self._keyframe_positions, position) - 1]
+        frame: Dict[int, ReplayRecord] = {}
+        self._apply(frame, self.reader.turn_start(keyframe), self.reader.turn_start(position + 1))
+        return frame
+
+    def frame_at(self, turn: int) -> Dict[int, ReplayRecord]:
+        """
+        Состояния всех сущностей на ходу turn.
+
+        Returns:
+            Dict[int, ReplayRecord]: Идентификатор сущности -> состояние
+
+        Raises:
+            ValueError: Если ход не записан
+        """
+        return self._seek(self._position(turn))
+
+    def iter_frames(self, first_turn: int, last_turn: int) -> Iterator[Tuple[int, Mapping[int, ReplayRecord]]]:
+        """
+        Последовательные кадры записанных ходов first_turn..last_turn.
+
+        Поиск выполняется один раз, далее применяются дельты каждого хода.
+        Выдается представление одного и того же изменяемого кадра: чтобы
+        сохранить кадр, его нужно скопировать.
+
+        Raises:
+            ValueError: Если first_turn не записан
+        """
+        reader = self.reader
+        turns = reader.turns
+        position = self._position(first_turn)
+        frame = self._seek(position)
+        view = MappingProxyType(frame)
+        while True:
+            yield turns[position], view
+            position += 1
+            if position >= len(turns) or turns[position] > last_turn:
+                return
+            if reader.keyframes[position]:
+                frame.clear()
+            self._apply(frame, reader.turn_start(position), reader.turn_start(position + 1))
+
+    def board_at(self, turn: int) -> Board:
+        """Доска с сущностями хода turn (типы, координаты, здоровье и идентификаторы)."""
+        return self.build_board(self.frame_at(turn))
+
+    def iter_boards(self, first_turn: int, last_turn: int) -> Iterator[Tuple[int, Board]]:
+        """Доски записанных ходов first_turn..last_turn (новая доска на каждый ход)."""
+        for turn, frame in self.iter_frames(first_turn, last_turn):
+            yield turn, self.build_board(frame)
+
+    def build_board(self, frame: Mapping[int, ReplayRecord]) -> Board:
+        """
+        Создание доски из кадра.
+
+        Счетчики номеров существ не меняются: восстановление не влияет на
+        имена существ текущей симуляции.
+        """
+        board = Board(self.reader.width, self.reader.height)
+        entity_types = SnapshotSerializer.ENTITY_TYPES
+        counters = dict(Creature._creature_counters)
+        try:
+            for entity_id, record in frame.items():
+                coordinates = Coordinates(record.x, record.y)
+                entity = entity_types[record.type_code](coordinates)
+                entity.entity_id = entity_id
+                if isinstance(entity, Creature):
+                    entity.hp = record.hp
+                board.entities[coordinates] = entity
+        finally:
+            Creature._creature_counters.clear()
+            Creature._creature_counters.update(counters)
+        board.recount_entities()
+        board._next_entity_id = max(frame, default=0) + 1
+        return board
@@ -0,0 +1,65 @@
+from typing import Dict, Iterable, Iterator, Tuple
+
+from ..actions.action import Action
+
+
+class ActionScheduler:
+    """
+    Планировщик действий хода.
+
+    Порядок действий задается списком turn_actions. Планировщик отбрасывает
+    действия без работы на текущем ходу:
+        - по частоте (frequency/offset);
+        - по дешевой проверке should_run;
+        - по зависимостям: действие с skip_if_unchanged пропускается, если ни одна
+          из частей состояния в его reads не изменялась другими действиями
+          с момента его последнего выполнения.
+    """
+
+    def __init__(self):
+        # Версия каждой части состояния увеличивается при выполнении действия, которое ее пишет
+        self._versions: Dict[str, int] = {}
+        # Версии reads, с которыми действие выполнялось в последний раз
+        self._seen_versions: Dict[Action, Tuple[int, ...]] = {}
+        self.executed: Dict[str, int] = {}
+        self.skipped: Dict[str, int] = {}
+
+    def due_actions(self, actions: Iterable[Action], board, turn: int) -> Iterator[Action]:
+        """
+        Перебор действий, которые нужно выполнить на ходу.
+
+        Действие считается выполненным, когда вызывающий код запрашивает
+        следующее, поэтому записи действия учитываются для последующих.
+
+        Args:
+            actions: Действия в порядке выполнения
+            board: Игровая доска
+            turn: Номер хода (с нуля)
+        """
+        for action in actions:
+            name = action.__class__.__name__
+            if not self._is_due(action, board, turn):
+                self.skipped[name] = self.skipped.get(name, 0) + 1
+                continue
+
+            yield action
+
+            self.executed[name] = self.executed.get(name, 0) + 1
+            for resource in action.writes:
+                self._versions[resource] = self._versions.get(resource, 0) + 1
+            if action.skip_if_unchanged:
+                self._seen_versions[action] = self._read_versions(action)
+
+    def invalidate(self) -> None:
+        """Сброс сведений о зависимостях (например, после изменения доски извне)."""
+        self._seen_versions.clear()
+
+    def _is_due(self, action: Action, board, turn: int) -> bool:
+        if action.frequency > 1 and turn % action.frequency != action.offset % action.frequency:
+            return False
+        if action.skip_if_unchanged and self._seen_versions.get(action) == self._read_versions(action):
+            return False
+        return action.should_run(board)
+
+    def _read_versions(self, action: Action) -> Tuple[int, ...]:
+        return tuple(self._versions.get(resource, 0) for resource in sorted(action.reads))
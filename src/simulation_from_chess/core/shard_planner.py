@@ -0,0 +1,334 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .coordinates import Coordinates
+from ..entities.creature import Creature, MovePlan
+from ..entities.grass import Grass
+from ..entities.herbivore import Herbivore
+from ..entities.predator import Predator
+
+# Ромб ходов радиуса 5 содержит 61 клетку, поэтому доступные ходы помещаются в маску int64
+MAX_KERNEL_SPEED = 5
+
+# Существа, чей поиск цели повторяет ядро: ближайшая по манхэттену цель, при равенстве -
+# первая в порядке доски. Значение - номер списка целей (трава или живые травоядные)
+_KERNEL_TARGET_LISTS = {Herbivore: 0, Predator: 1}
+
+
+def _diamond(speed: int) -> List[Tuple[int, int]]:
+    """Смещения клеток в пределах скорости в порядке обхода PathFinder.get_available_moves."""
+    return [
+        (dx, dy)
+        for dx in range(-speed, speed + 1)
+        for dy in range(-speed + abs(dx), speed - abs(dx) + 1)
+    ]
+
+
+_DIAMONDS = [_diamond(speed) for speed in range(MAX_KERNEL_SPEED + 1)]
+
+
+def _column_layout(creatures: int, target_lists: Sequence[int]) -> Tuple[Dict[str, Tuple[int, str, int]], int]:
+    """
+    Раскладка столбцов вызова в общем блоке памяти (сетка занятости хранится в отдельном блоке).
+
+    Returns:
+        Tuple: Имя столбца -> (смещение, код типа, длина) и общий размер блока
+    """
+    columns = [('masks', 'q', creatures), ('targets', 'i', creatures), ('xs', 'i', creatures),
+               ('ys', 'i', creatures), ('speeds', 'i', creatures), ('lists', 'i', creatures)]
+    for index, length in enumerate(target_lists):
+        columns += [(f'target_xs{index}', 'i', length), (f'target_ys{index}', 'i', length)]
+
+    layout = {}
+    offset = 0
+    for name, typecode, length in columns:
+        layout[name] = (offset, typecode, length)
+        offset += length * (8 if typecode == 'q' else 4 if typecode == 'i' else 1)
+        offset = -(-offset // 8) * 8  # Выравнивание следующего столбца
+    return layout, max(offset, 1)
+
+
+def _open_columns(buffer, layout) -> Dict[str, memoryview]:
+    columns = {}
+    for name, (offset, typecode, length) in layout.items():
+        size = length * (8 if typecode == 'q' else 4 if typecode == 'i' else 1)
+        columns[name] = buffer[offset:offset + size].cast(typecode)
+    return columns
+
+
+# Блоки общей памяти, открытые рабочим процессом: имя -> блок (живут между вызовами)
+_ATTACHED: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _attach(names: Sequence[str]) -> List[shared_memory.SharedMemory]:
+    """Блоки с именами names; блоки прежних вызовов, замененные основным процессом, закрываются."""
+    for name in [name for name in _ATTACHED if name not in names]:
+        _ATTACHED.pop(name).close()
+    blocks = []
+    for name in names:
+        block = _ATTACHED.get(name)
+        if block is None:
+            block = _ATTACHED[name] = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+    return blocks
+
+
+def _plan_shard(grid_name: str, name: str, layout, width: int, height: int, start: int, stop: int) -> None:
+    """
+    Ядро планирования для существ шарда (строки столбцов start..stop-1) в рабочем процессе.
+
+    Читает общую сетку занятости (включая клетки соседних шардов в пределах
+    скорости) и списки целей, записывает маску доступных ходов и номер
+    ближайшей цели (-1, если целей нет) в выходные столбцы.
+    """
+    grid_block, block = _attach((grid_name, name))
+    grid = grid_block.buf[:width * height]
+    columns = _open_columns(block.buf, layout)
+    try:
+        masks, targets = columns['masks'], columns['targets']
+        xs, ys, speeds, lists = columns['xs'], columns['ys'], columns['speeds'], columns['lists']
+        for row in range(start, stop):
+            x, y = xs[row], ys[row]
+            mask = 0
+            for bit, (dx, dy) in enumerate(_DIAMONDS[speeds[row]]):
+                nx, ny = x + dx, y + dy
+                if 1 <= nx <= width and 1 <= ny <= height and not grid[(ny - 1) * width + nx - 1]:
+                    mask |= 1 << bit
+            masks[row] = mask
+
+            target_xs = columns[f'target_xs{lists[row]}']
+            target_ys = columns[f'target_ys{lists[row]}']
+            best, best_distance = -1, 0
+            for index in range(len(target_xs)):
+                distance = abs(target_xs[index] - x) + abs(target_ys[index] - y)
+                if best < 0 or distance < best_distance:
+                    best, best_distance = index, distance
+            targets[row] = best
+    finally:
+        for column in columns.values():
+            column.release()
+        grid.release()
+
+
+class ShardedPlanner:
+    """
+    Планирование ходов в нескольких процессах по вертикальным полосам поля.
+
+    Поле делится на shards полос равной ширины, существа - по полосе, в которой
+    стоят. Сетка занятости, координаты существ и списки целей записываются
+    в общую память; процессы читают их без копирования (соседние клетки
+    других полос - как гало шириной в скорость) и пишут результаты в
+    выходные столбцы. Планы собираются в исходном порядке существ и
+    совпадают с Creature.plan_move.
+
+    Блок сетки занятости живет, пока не меняются доска и ее размер: после
+    первого заполнения он обновляется по журналу изменений доски (целиком -
+    только после массового изменения). Блок столбцов вызова переиспользуется,
+    пока в него помещаются данные. Блоки освобождает shutdown.
+
+    Выигрыш от процессов зависит от числа ядер и размера поля: перед
+    включением его стоит замерить на целевой машине (benchmarks.parallel_planning
+    --processes сравнивает с тем же ядром в одном процессе).
+
+    Поиск цели в движке ведется по всему полю, поэтому списки целей общие для
+    всех полос. Выполнение хода (взаимодействия, разрешение конфликтов
+    перемещений через MoveResolver, голод, появление травы) остается в
+    основном процессе: оно использует общий генератор случайных чисел, и
+    только так результат совпадает с однопроцессным при том же зерне.
+    """
+
+    def __init__(self, processes: int, shards: Optional[int] = None):
+        """
+        Args:
+            processes: Количество рабочих процессов
+            shards: Количество полос (по умолчанию равно количеству процессов)
+
+        Raises:
+            ValueError: Если количество процессов или полос меньше 1
+        """
+        if processes < 1:
+            raise ValueError(f"Количество процессов должно быть не меньше 1, получено: {processes}")
+        shards = processes if shards is None else shards
+        if shards < 1:
+            raise ValueError(f"Количество полос должно быть не меньше 1, получено: {shards}")
+        self.processes = processes
+        self.shards = shards
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Сетка занятости в общей памяти и доска, по журналу которой она обновляется
+        self._grid_block: Optional[shared_memory.SharedMemory] = None
+        self._grid_board = None
+        self._journal = None
+        self._bulk_mutation_count = 0
+        self._block: Optional[shared_memory.SharedMemory] = None  # Столбцы вызова
+        # Разобранные маски: (x, y, скорость, маска) -> доступные ходы (как кеш PathFinder)
+        self._moves_cache: Dict[Tuple[int, int, int, int], set] = {}
+
+    def plan(self, board, entities: Sequence[Creature]) -> List[MovePlan]:
+        """
+        Расчет планов для существ в порядке entities.
+
+        Существа, поиск цели которых ядро не повторяет (другие классы или
+        скорость больше MAX_KERNEL_SPEED), планируются в основном процессе.
+        """
+        kernel = [
+            entity for entity in entities
+            if type(entity) in _KERNEL_TARGET_LISTS and entity.speed <= MAX_KERNEL_SPEED
+        ]
+        if not kernel:
+            return [entity.plan_move(board) for entity in entities]
+
+        width, height = board.width, board.height
+        strip = -(-width // self.shards)
+        # Существа сгруппированы по полосам, внутри полосы - в порядке доски
+        kernel.sort(key=lambda entity: (entity.coordinates.x - 1) // strip)
+        target_lists = [
+            board.get_entities_by_type(Grass),
+            [entity for entity in board.get_entities_by_type(Herbivore) if entity.hp > 0],
+        ]
+
+        grid_name = self._sync_grid(board)
+        layout, size = _column_layout(len(kernel), [len(targets) for targets in target_lists])
+        block = self._reserve_block(size)
+        columns = _open_columns(block.buf, layout)
+        try:
+            self._write_inputs(columns, kernel, target_lists)
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.processes)
+            futures = [
+                self._executor.submit(_plan_shard, grid_name, block.name, layout, width, height, start, stop)
+                for start, stop in self._shard_ranges(kernel, strip)
+            ]
+            for future in futures:
+                future.result()
+            masks = columns['masks'].tolist()
+            targets = columns['targets'].tolist()
+        finally:
+            for column in columns.values():
+                column.release()
+
+        moves_cache = self._moves_cache
+        if len(moves_cache) > 4 * len(kernel) + 1024:
+            moves_cache.clear()
+        kernel_plans = {}
+        for row, entity in enumerate(kernel):
+            coordinates = entity.coordinates
+            key = (coordinates.x, coordinates.y, entity.speed, masks[row])
+            moves = moves_cache.get(key)
+            if moves is None:
+                moves = moves_cache[key] = self._decode_moves(*key)
+            entity.available_moves = moves
+            target = None if targets[row] < 0 else target_lists[_KERNEL_TARGET_LISTS[type(entity)]][targets[row]]
+            kernel_plans[entity] = MovePlan(
+                coordinates, moves, target, target.coordinates if target is not None else None
+            )
+        return [
+            kernel_plans[entity] if entity in kernel_plans else entity.plan_move(board)
+            for entity in entities
+        ]
+
+    @staticmethod
+    def _decode_moves(x: int, y: int, speed: int, mask: int) -> set:
+        """Доступные ходы по маске в порядке обхода PathFinder (перебираются только установленные биты)."""
+        diamond = _DIAMONDS[speed]
+        moves = set()
+        while mask:
+            low = mask & -mask
+            dx, dy = diamond[low.bit_length() - 1]
+            moves.add(Coordinates(x + dx, y + dy))
+            mask ^= low
+        return moves
+
+    def _sync_grid(self, board) -> str:
+        """
+        Обновление сетки занятости в общей памяти по журналу изменений доски.
+
+        Блок создается заново при смене размера поля; после смены доски или ее
+        массового изменения сетка заполняется целиком.
+
+        Returns:
+            str: Имя блока сетки
+        """
+        cells = board.width * board.height
+        block = self._grid_block
+        if board is self._grid_board and board.bulk_mutation_count == self._bulk_mutation_count:
+            grid, entities, width = block.buf, board.entities, board.width
+            for coordinates in self._journal:
+                grid[(coordinates.y - 1) * width + coordinates.x - 1] = coordinates in entities
+            self._journal.clear()
+            return block.name
+
+        self._release_grid_board()
+        if block is not None and block.size < cells:
+            self._unlink(block)
+            block = None
+        if block is None:
+            block = self._grid_block = shared_memory.SharedMemory(create=True, size=max(cells, 1))
+        grid, width = block.buf, board.width
+        grid[:cells] = bytes(cells)
+        for coordinates in board.entities:
+            grid[(coordinates.y - 1) * width + coordinates.x - 1] = 1
+        self._grid_board = board
+        self._journal = board.open_change_journal()
+        self._bulk_mutation_count = board.bulk_mutation_count
+        return block.name
+
+    def _reserve_block(self, size: int) -> shared_memory.SharedMemory:
+        """Блок столбцов вызова размером не меньше size (при нехватке заменяется вдвое большим)."""
+        block = self._block
+        if block is None or block.size < size:
+            if block is not None:
+                self._unlink(block)
+            block = self._block = shared_memory.SharedMemory(
+                create=True, size=max(size, 2 * block.size if block is not None else 0)
+            )
+        return block
+
+    @staticmethod
+    def _unlink(block: shared_memory.SharedMemory) -> None:
+        block.close()
+        block.unlink()
+
+    def _release_grid_board(self) -> None:
+        if self._grid_board is not None:
+            self._grid_board.close_change_journal(self._journal)
+        self._grid_board = None
+        self._journal = None
+
+    @staticmethod
+    def _write_inputs(columns, kernel: Sequence[Creature], target_lists) -> None:
+        xs, ys, speeds, lists = columns['xs'], columns['ys'], columns['speeds'], columns['lists']
+        for row, entity in enumerate(kernel):
+            xs[row] = entity.coordinates.x
+            ys[row] = entity.coordinates.y
+            speeds[row] = entity.speed
+            lists[row] = _KERNEL_TARGET_LISTS[type(entity)]
+        for index, targets in enumerate(target_lists):
+            target_xs, target_ys = columns[f'target_xs{index}'], columns[f'target_ys{index}']
+            for position, target in enumerate(targets):
+                target_xs[position] = target.coordinates.x
+                target_ys[position] = target.coordinates.y
+
+    @staticmethod
+    def _shard_ranges(kernel: Sequence[Creature], strip: int) -> List[Tuple[int, int]]:
+        """Непрерывные диапазоны строк столбцов, принадлежащие каждой непустой полосе."""
+        ranges = []
+        start = 0
+        for row in range(1, len(kernel) + 1):
+            if row == len(kernel) or (kernel[row].coordinates.x - 1) // strip != (kernel[start].coordinates.x - 1) // strip:
+                ranges.append((start, row))
+                start = row
+        return ranges
+
+    def shutdown(self) -> None:
+        """Остановка рабочих процессов и освобождение блоков общей памяти (если они создавались)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._release_grid_board()
+        for block in (self._grid_block, self._block):
+            if block is not None:
+                self._unlink(block)
+        self._grid_block = None
+        self._block = None
+        self._moves_cache.clear()
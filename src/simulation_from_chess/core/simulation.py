@@ -1,26 +1,87 @@
+from ..actions.health_check_action import HealthCheckAction
+from ..actions.hunger_action import HungerAction
 from ..actions.init_action import InitAction
+from ..actions.move_action import MoveAction
 from ..core.board import Board
+from ..core.columnar_history import ColumnarHistoryWriter
+from ..core.scheduler import ActionScheduler
+from ..core.snapshot import SnapshotSerializer
 from ..entities.creature import Creature
 from ..renderers.board_console_renderer import BoardConsoleRenderer
+from ..renderers.frame_exporter import FrameExporter
+from ..utils.log_sink import LogSink
 from ..utils.logger import Logger
+from ..utils.profiler import TurnProfiler
 from ..config import SIMULATION_CONFIG
 import time
+from typing import Optional
 import keyboard
 
 
 class Simulation:
-    def __init__(self, size: int = None):
-        """Инициализация симуляции."""
+    # Политики обработки устойчивого состояния (повторяющейся расстановки)
+    STEADY_STATE_STOP = 'stop'
+    STEADY_STATE_SKIP = 'skip'
+
+    def __init__(self, size: int = None, profiler: Optional[TurnProfiler] = None, headless: bool = False,
+                 steady_state_policy: Optional[str] = None, steady_state_repeats: int = 3,
+                 history_retention: Optional[int] = None,
+                 history_writer: Optional[ColumnarHistoryWriter] = None,
+                 log_sink: Optional[LogSink] = None,
+                 renderer: Optional[BoardConsoleRenderer] = None,
+                 frame_exporter: Optional[FrameExporter] = None):
+        """
+        Инициализация симуляции.
+        
+        Args:
+            size: Размер поля
+            profiler: Профилировщик хода (None - профилирование отключено)
+            headless: Не выводить поле и логи (для бенчмарков и фоновых прогонов)
+            steady_state_policy: Что делать при повторе расстановки: None - продолжать,
+                'stop' - остановить симуляцию, если состояние больше не изменится (расстановка
+                неподвижна и здоровье не меняется), 'skip' - пропустить неподвижные ходы аналитически
+            steady_state_repeats: Сколько раз подряд должен повториться период расстановки
+            history_retention: Сколько последних ходов хранить в истории состояний доски
+                (по умолчанию из SIMULATION_CONFIG, 0 - не хранить)
+            history_writer: Запись всех ходов в столбцовые файлы (закрывается вызывающим кодом)
+            log_sink: Фоновая запись событий журнала в файл (закрывается вызывающим кодом)
+            renderer: Рендерер поля (по умолчанию BoardConsoleRenderer)
+            frame_exporter: Запись кадров поля в файл, в том числе без вывода (закрывается вызывающим кодом)
+            
+        Raises:
+            ValueError: Если политика устойчивого состояния неизвестна
+        """
         if size is None:
             size = SIMULATION_CONFIG['board_size']
+        if steady_state_policy not in (None, self.STEADY_STATE_STOP, self.STEADY_STATE_SKIP):
+            raise ValueError(f"Неизвестная политика устойчивого состояния: {steady_state_policy}")
         
-        self.board = Board(size, size)
-        self.renderer = BoardConsoleRenderer()
+        if history_retention is None:
+            history_retention = SIMULATION_CONFIG['history_retention']
+        
+        self.board = Board(
+            size, size, history_retention=history_retention,
+            keyframe_interval=SIMULATION_CONFIG['history_keyframe_interval']
+        )
+        self.renderer = renderer if renderer is not None else BoardConsoleRenderer()
         self.logger = Logger()
+        # Без вывода текстовый журнал не нужен: события записываются, только если есть приемник
+        self.logger.enabled = not headless or log_sink is not None
+        self.logger.keep_text = not headless
+        if log_sink is not None:
+            self.logger.add_sink(log_sink)
         self.move_counter = 0
         self.is_running = False
         self.is_paused = False
         self.turn_actions = []
+        self.scheduler = ActionScheduler()
+        self.profiler = profiler
+        self.headless = headless
+        self.steady_state_policy = steady_state_policy
+        self.steady_state_repeats = steady_state_repeats
+        self._turn_limit: Optional[int] = None
+        self.history_writer = history_writer
+        self.frame_exporter = frame_exporter
 
     def initialize(self, herbivores: int = 0, predators: int = 0, grass: int = 0, stones: int = 0) -> None:
         """
@@ -33,7 +94,7 @@ class Simulation:
             stones: Количество камней
         """
         # Очищаем доску перед инициализацией
-        self.board.entities.clear()
+        self.board.clear()
         self.is_running = False
         self.move_counter = 0
         
@@ -44,6 +105,7 @@ class Simulation:
             stones=stones
         )
         init_action.execute(self.board, self.logger)
+        self.scheduler.invalidate()
         
         # Проверяем наличие существ
         creatures_exist = any(
@@ -61,6 +123,7 @@ class Simulation:
             coordinates: Координаты для размещения
         """
         self.board.place_entity(coordinates, entity)
+        self.scheduler.invalidate()
         if isinstance(entity, Creature):
             self.is_running = True
 
@@ -85,17 +148,152 @@ class Simulation:
             print("Симуляция завершена: на поле не осталось живых существ")
             return False
 
-        # Выполняем все действия хода
+        if self.profiler is not None:
+            self._profiled_turn()
+        else:
+            # Выполняем действия хода, у которых есть работа на этом ходу
+            for action in self.scheduler.due_actions(self.turn_actions, self.board, self.move_counter):
+                action.execute(self.board, self.logger)
+
+            # Обновляем состояние
+            self.move_counter += 1
+            self._render_turn()
+            self._flush_logs()
+
+        self._close_turn()
+        if self.steady_state_policy is not None:
+            self._handle_steady_state()
+
+        return True
+
+    def _close_turn(self) -> None:
+        """Закрытие хода доски: хеш расстановки, история состояний, запись истории и кадр хода."""
+        board = self.board
+        board.record_hash()
+        board.next_turn()
+        turn = board.game_state.current_turn - 1
+        if self.history_writer is not None:
+            self.history_writer.append_turn(turn, board)
+        if self.frame_exporter is not None:
+            self.frame_exporter.capture(board, turn)
+
+    def _handle_steady_state(self) -> None:
+        """Обработка цикла в истории хешей расстановки согласно политике."""
+        period = self.board.detect_cycle(self.steady_state_repeats)
+        if period is None:
+            return
+
+        if period != 1:
+            return
+        hunger_damage = self._static_hunger_damage()
+        if hunger_damage is None:
+            return
+        if self.steady_state_policy == self.STEADY_STATE_SKIP:
+            self._skip_static_turns(hunger_damage)
+        elif hunger_damage == 0:
+            # Расстановка в хеше не учитывает здоровье: остановка, только если не меняется и оно
+            self.is_running = False
+            print("Симуляция завершена: состояние больше не меняется")
+
+    def _static_hunger_damage(self) -> Optional[int]:
+        """
+        Урон от голода за ход в неподвижном состоянии.
+
+        Состояние неподвижно, если каждое существо заблокировано (нет доступных
+        ходов) или не имеет цели, голод не ждет удаления погибших, а остальные
+        действия, кроме движения, голода и проверки здоровья, не имеют работы.
+        Тогда до первой смерти от голода меняется только здоровье, и оно
+        уменьшается на возвращаемый урон за ход.
+
+        Returns:
+            Optional[int]: Урон от голода за ход или None, если состояние не неподвижно
+        """
+        hunger_damage = 0
         for action in self.turn_actions:
-            action.execute(self.board, self.logger)
+            if isinstance(action, HungerAction):
+                if action.dead_entities:
+                    return None
+                hunger_damage += action.hunger_damage
+            elif not isinstance(action, (MoveAction, HealthCheckAction)) and action.should_run(self.board):
+                return None
 
-        # Обновляем состояние
-        self.move_counter += 1
-        self.renderer.render(self.board)
-        self.logger.print_logs()
+        for creature in self.board.get_entities_by_type(Creature):
+            moves = self.board.path_finder.get_available_moves(creature.coordinates, creature.speed)
+            if moves and creature.find_target(self.board) is not None:
+                return None
+        return hunger_damage
+
+    def _skip_static_turns(self, hunger_damage: int) -> bool:
+        """
+        Аналитический пропуск ходов неподвижного состояния (см. _static_hunger_damage).
+
+        Args:
+            hunger_damage: Урон от голода за ход
 
+        Returns:
+            bool: True если ходы были пропущены
+        """
+        creatures = self.board.get_entities_by_type(Creature)
+        if hunger_damage > 0:
+            # Пропускаем ходы до хода, на котором погибнет первое существо
+            turns = min(-(-creature.hp // hunger_damage) for creature in creatures) - 1
+        elif self._turn_limit is not None:
+            turns = self._turn_limit - self.move_counter
+        else:
+            return False
+        if self._turn_limit is not None:
+            turns = min(turns, self._turn_limit - self.move_counter)
+        if turns <= 0:
+            return False
+
+        # Действия ходов не выполняются, но каждый ход закрывается как обычный, чтобы номер хода
+        # доски, история хешей, запись истории и кадры совпадали с move_counter. До первой гибели
+        # очередь событий голода пуста, поэтому сдвиг счетчика ничего не извлекает
+        store = self.board.store
+        for _ in range(turns):
+            store.drain_hunger(hunger_damage)
+            self._close_turn()
+        if turns % 2:
+            # MoveAction чередует фазы планирования и выполнения на каждом ходу
+            for action in self.turn_actions:
+                if isinstance(action, MoveAction):
+                    action.is_planning_phase = not action.is_planning_phase
+        self.move_counter += turns
+        if not self.headless:
+            print(f"Пропущено {turns} ход(ов) неподвижного состояния")
         return True
 
+    def _profiled_turn(self) -> None:
+        """Выполнение хода с замером времени каждого действия, рендеринга и логирования."""
+        profiler = self.profiler
+        for action in self.scheduler.due_actions(self.turn_actions, self.board, self.move_counter):
+            with profiler.measure(action.__class__.__name__):
+                action.execute(self.board, self.logger)
+
+        self.move_counter += 1
+        with profiler.measure('render'):
+            self._render_turn()
+        with profiler.measure('logger'):
+            self._flush_logs()
+        profiler.end_turn(self.board)
+
+    def _render_turn(self) -> None:
+        """Отрисовка поля после хода."""
+        if not self.headless:
+            self.renderer.render(self.board)
+
+    def _flush_logs(self) -> None:
+        """Вывод логов хода (в режиме без вывода текст отбрасывается) и передача событий хода приемникам."""
+        if not self.headless:
+            output = self.logger.print_logs()
+            # Рендерер с перерисовкой изменений должен знать, не прокрутил ли вывод экран
+            report_output_below = getattr(self.renderer, 'report_output_below', None)
+            if report_output_below is not None:
+                report_output_below(output)
+        elif self.logger.keep_text:
+            self.logger.clear_logs()
+        self.logger.end_turn(self.board.game_state.current_turn)
+
     def run(self, steps: int = None) -> None:
         """Запуск симуляции."""
         print("\n=== Симуляция запущена ===")
@@ -107,28 +305,69 @@ class Simulation:
         
         current_step = 0
         self.is_running = True  # Устанавливаем флаг только если есть существа
+        self._turn_limit = self.move_counter + steps if steps is not None else None
         
-        while self.is_running:
-            if steps is not None and current_step >= steps:
-                print("\nДостигнуто максимальное количество ходов")
-                break
-            
-            if keyboard.is_pressed('q'):
-                self.stop_simulation()
-                break
-            
-            if keyboard.is_pressed('space'):
-                self.toggle_pause()
-                time.sleep(0.3)
-            
-            if not self.is_paused:
-                if not self.next_turn():
+        try:
+            while self.is_running:
+                if steps is not None and current_step >= steps:
+                    print("\nДостигнуто максимальное количество ходов")
+                    break
+                
+                if keyboard.is_pressed('q'):
+                    self.stop_simulation()
                     break
                 
-                if steps is not None:
-                    current_step += 1
+                if keyboard.is_pressed('space'):
+                    self.toggle_pause()
+                    time.sleep(0.3)
                 
-                time.sleep(SIMULATION_CONFIG['turn_delay'])
+                if not self.is_paused:
+                    counter_before = self.move_counter
+                    if not self.next_turn():
+                        break
+                    
+                    if steps is not None:
+                        # Ход может продвинуть счетчик больше чем на 1 при пропуске неподвижных ходов
+                        current_step += self.move_counter - counter_before
+                    
+                    time.sleep(SIMULATION_CONFIG['turn_delay'])
+        finally:
+            # Потоки и процессы действий создаются заново при следующем запуске
+            self.shutdown()
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Сохранение полного состояния симуляции в бинарный файл.
+        
+        Args:
+            path: Путь к файлу снапшота
+        """
+        with open(path, 'wb') as file:
+            file.write(SnapshotSerializer.dumps(self))
+
+    def load_snapshot(self, path: str) -> None:
+        """
+        Восстановление состояния симуляции из бинарного файла.
+        
+        Действия хода (turn_actions) не сохраняются в снапшоте и остаются прежними,
+        поэтому из одного снапшота можно запускать разные сценарии.
+        
+        Args:
+            path: Путь к файлу снапшота
+            
+        Raises:
+            ValueError: Если файл не является корректным снапшотом
+        """
+        with open(path, 'rb') as file:
+            SnapshotSerializer.loads(self, file.read())
+        self.scheduler.invalidate()
+
+    def shutdown(self) -> None:
+        """Остановка потоков и процессов действий хода (если действие их создавало)."""
+        for action in self.turn_actions:
+            shutdown = getattr(action, 'shutdown', None)
+            if shutdown is not None:
+                shutdown()
 
     def stop_simulation(self) -> None:
         """Остановка симуляции."""
@@ -0,0 +1,195 @@
+import gc
+import random
+import struct
+from typing import Dict, Type
+
+from .board import Board
+from .coordinates import Coordinates
+from ..entities.creature import Creature
+from ..entities.entity import Entity
+from ..entities.grass import Grass
+from ..entities.herbivore import Herbivore
+from ..entities.predator import Predator
+from ..entities.stone import Stone
+
+
+class SnapshotSerializer:
+    """
+    Компактный бинарный формат снапшота состояния симуляции.
+
+    Формат (little-endian):
+        заголовок   magic, версия, ширина, высота, счетчик ходов симуляции, ход доски,
+                    следующий идентификатор сущности
+        счетчики    количество записей, затем (длина имени, имя, значение)
+        ГСЧ         версия, 625 слов состояния Mersenne Twister, флаг и значение gauss_next
+        сущности    количество, затем записи фиксированной длины (код типа, x, y, hp, номер,
+                    идентификатор)
+    """
+    MAGIC = b'SFCS'
+    VERSION = 2
+
+    _HEADER = struct.Struct('<4sHIIIII')
+    _COUNTER = struct.Struct('<BI')
+    _RNG = struct.Struct('<B625IBd')
+    _COUNT = struct.Struct('<I')
+    _RECORD = struct.Struct('<BHHiII')
+    _MAX_DIMENSION = 0xFFFF
+
+    # Коды типов сущностей, поддерживаемых форматом
+    ENTITY_TYPES: Dict[int, Type[Entity]] = {
+        cls.type_code: cls for cls in (Grass, Stone, Herbivore, Predator)
+    }
+
+    @classmethod
+    def dumps(cls, simulation) -> bytes:
+        """
+        Сериализация состояния симуляции в байты.
+
+        Args:
+            simulation: Симуляция для сохранения
+
+        Returns:
+            bytes: Бинарный снапшот
+
+        Raises:
+            ValueError: Если размеры поля или тип сущности не поддерживаются форматом
+        """
+        board = simulation.board
+        if board.width > cls._MAX_DIMENSION or board.height > cls._MAX_DIMENSION:
+            raise ValueError(f"Размеры поля {board.width}x{board.height} не поддерживаются форматом снапшота")
+
+        parts = [cls._HEADER.pack(
+            cls.MAGIC, cls.VERSION, board.width, board.height,
+            simulation.move_counter, board.game_state.current_turn, board._next_entity_id
+        )]
+
+        counters = Creature._creature_counters
+        parts.append(cls._COUNT.pack(len(counters)))
+        for name, value in counters.items():
+            encoded = name.encode('utf-8')
+            parts.append(cls._COUNTER.pack(len(encoded), value))
+            parts.append(encoded)
+
+        rng_version, rng_state, gauss_next = random.getstate()
+        parts.append(cls._RNG.pack(
+            rng_version, *rng_state,
+            gauss_next is not None, gauss_next if gauss_next is not None else 0.0
+        ))
+
+        pack = cls._RECORD.pack
+        records = []
+        for coordinates, entity in board.entities.items():
+            type_code = type(entity).type_code
+            if type_code not in cls.ENTITY_TYPES:
+                raise ValueError(f"Сущность {entity!r} не поддерживается форматом снапшота")
+            if isinstance(entity, Creature):
+                records.append(pack(
+                    type_code, coordinates.x, coordinates.y, entity.hp, entity._number, entity.entity_id
+                ))
+            else:
+                records.append(pack(type_code, coordinates.x, coordinates.y, 0, 0, entity.entity_id))
+        parts.append(cls._COUNT.pack(len(records)))
+        parts.append(b''.join(records))
+
+        return b''.join(parts)
+
+    @classmethod
+    def loads(cls, simulation, data: bytes) -> None:
+        """
+        Восстановление состояния симуляции из байтов.
+
+        Доска симуляции заменяется новой, действия хода сохраняются.
+
+        Args:
+            simulation: Симуляция для восстановления
+            data: Бинарный снапшот
+
+        Raises:
+            ValueError: Если данные не являются снапшотом поддерживаемой версии
+        """
+        view = memoryview(data)
+        try:
+            magic, version, width, height, move_counter, board_turn, next_entity_id = cls._HEADER.unpack_from(view, 0)
+        except struct.error as e:
+            raise ValueError(f"Поврежденный снапшот: {e}")
+        if magic != cls.MAGIC:
+            raise ValueError("Данные не являются снапшотом симуляции")
+        if version != cls.VERSION:
+            raise ValueError(f"Неподдерживаемая версия снапшота: {version}")
+
+        try:
+            offset = cls._HEADER.size
+            counters = {}
+            (counters_count,) = cls._COUNT.unpack_from(view, offset)
+            offset += cls._COUNT.size
+            for _ in range(counters_count):
+                name_length, value = cls._COUNTER.unpack_from(view, offset)
+                offset += cls._COUNTER.size
+                counters[bytes(view[offset:offset + name_length]).decode('utf-8')] = value
+                offset += name_length
+
+            rng = cls._RNG.unpack_from(view, offset)
+            offset += cls._RNG.size
+
+            (entity_count,) = cls._COUNT.unpack_from(view, offset)
+            offset += cls._COUNT.size
+            records_end = offset + entity_count * cls._RECORD.size
+            if records_end != len(view):
+                raise ValueError(f"Ожидалось {entity_count} записей сущностей, размер данных не совпадает")
+            records = cls._RECORD.iter_unpack(view[offset:records_end])
+            history = simulation.board.game_state
+            board = Board(width, height, history_retention=history.retention,
+                          keyframe_interval=history.keyframe_interval)
+            # Массовое создание объектов без промежуточных проходов сборщика мусора
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                cls._restore_entities(board, records)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+        except struct.error as e:
+            raise ValueError(f"Поврежденный снапшот: {e}")
+
+        Creature._creature_counters.clear()
+        Creature._creature_counters.update(counters)
+        gauss_next = rng[-1] if rng[-2] else None
+        random.setstate((rng[0], tuple(rng[1:626]), gauss_next))
+
+        board.game_state.current_turn = board_turn
+        board._next_entity_id = next_entity_id
+        simulation.board = board
+        simulation.move_counter = move_counter
+        simulation.is_paused = False
+        simulation.is_running = any(isinstance(entity, Creature) for entity in board.entities.values())
+
+    @classmethod
+    def _restore_entities(cls, board: Board, records) -> None:
+        """
+        Создание сущностей из записей снапшота.
+
+        Записи добавляются в словарь доски напрямую, без поиска занятой позиции
+        на каждую запись: дубликаты координат обнаруживаются одной проверкой
+        размера словаря в конце.
+        """
+        entity_types = cls.ENTITY_TYPES
+        entities = board.entities
+        width, height = board.width, board.height
+        count = 0
+        for type_code, x, y, hp, number, entity_id in records:
+            entity_class = entity_types.get(type_code)
+            if entity_class is None:
+                raise ValueError(f"Неизвестный код типа сущности: {type_code}")
+            if not (1 <= x <= width and 1 <= y <= height):
+                raise ValueError(f"Невалидные координаты: ({x}, {y})")
+            coordinates = Coordinates(x, y)
+            entity = entity_class(coordinates)
+            entity.entity_id = entity_id
+            if number:
+                entity.hp = hp
+                entity._number = number
+            entities[coordinates] = entity
+            count += 1
+        if len(entities) != count:
+            raise ValueError("Снапшот содержит несколько сущностей на одной позиции")
+        board.recount_entities()
@@ -0,0 +1,16 @@
+_MASK64 = (1 << 64) - 1
+_SEED = 0x9E3779B97F4A7C15
+
+
+def zobrist_key(type_code: int, x: int, y: int) -> int:
+    """
+    64-битный ключ Zobrist для сущности типа type_code в клетке (x, y).
+
+    Ключ вычисляется хешем splitmix64 от упакованных (тип, x, y), поэтому
+    таблица случайных чисел размером с поле не хранится, а значения
+    одинаковы между запусками и не зависят от генератора random.
+    """
+    z = (((type_code << 42) | (x << 21) | y) + _SEED) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
@@ -1,14 +1,41 @@
 from collections import deque
 from ..core.coordinates import Coordinates
 from ..entities.entity import Entity
-from typing import List, Tuple, Optional, Set
+from typing import AbstractSet, List, NamedTuple, Tuple, Optional
 from ..core.game_state import EntityState
 # from ..core.board import Board
 from ..core.interfaces import IBoard, IMovable
 from ..utils.distance_calculator import DistanceCalculator
 
 
+_NO_MOVES: AbstractSet[Coordinates] = frozenset()
+
+
+class MoveDecision(NamedTuple):
+    """Действие существа на ход, выбранное до изменения доски."""
+    WAIT = 'wait'
+    INTERACT = 'interact'
+    MOVE = 'move'
+
+    kind: str
+    target: Optional[Entity]
+    destination: Optional[Coordinates]
+
+
+class MovePlan(NamedTuple):
+    """Результаты фазы планирования, переиспользуемые при выполнении хода."""
+    coordinates: Coordinates
+    available_moves: AbstractSet[Coordinates]
+    target: Optional[Entity]
+    target_coordinates: Optional[Coordinates]
+
+
 class Creature(Entity):
+    __slots__ = (
+        '_speed', '_hp', '_max_hp', '_food_value', 'available_moves', 'target_type',
+        'planned_action', '_performed_action', '_number'
+    )
+
     # Словарь для хранения счетчиков каждого типа существ
     _creature_counters = {}
 
@@ -25,7 +52,8 @@ class Creature(Entity):
         self.speed = speed
         self.hp = hp
         self.max_hp = hp
-        self.available_moves: Set[Coordinates] = set()
+        # Пустое множество общее для всех существ; заменяется при update_available_moves
+        self.available_moves: AbstractSet[Coordinates] = _NO_MOVES
         self.target_type = None  # Будет установлен в подклассах
         self.food_value = None  # Будет установлен в подклассах
         self.planned_action = None  # Планируемое действие на следующий ход
@@ -42,6 +70,80 @@ class Creature(Entity):
         self._creature_counters[class_name] += 1
         self._number = self._creature_counters[class_name]
 
+    @property
+    def hp(self) -> int:
+        store = self._store
+        if store is None:
+            return self._hp
+        row = self._row
+        return store.hp[row] - (store.hunger_drain - store.fed_drain[row])
+
+    @hp.setter
+    def hp(self, value: int) -> None:
+        store = self._store
+        if store is None:
+            self._hp = value
+        else:
+            store.set_hp(self._row, value)
+
+    @property
+    def max_hp(self) -> int:
+        store = self._store
+        return self._max_hp if store is None else store.max_hp[self._row]
+
+    @max_hp.setter
+    def max_hp(self, value: int) -> None:
+        store = self._store
+        if store is None:
+            self._max_hp = value
+        else:
+            store.max_hp[self._row] = value
+
+    @property
+    def speed(self) -> int:
+        store = self._store
+        return self._speed if store is None else store.speed[self._row]
+
+    @speed.setter
+    def speed(self, value: int) -> None:
+        store = self._store
+        if store is None:
+            self._speed = value
+        else:
+            store.speed[self._row] = value
+
+    @property
+    def food_value(self) -> Optional[int]:
+        store = self._store
+        if store is None:
+            return self._food_value
+        value = store.food_value[self._row]
+        return None if value == store.NO_FOOD_VALUE else value
+
+    @food_value.setter
+    def food_value(self, value: Optional[int]) -> None:
+        store = self._store
+        if store is None:
+            self._food_value = value
+        else:
+            store.food_value[self._row] = store.NO_FOOD_VALUE if value is None else value
+
+    def _column_values(self) -> tuple:
+        return self._hp, self._max_hp, self._speed, self._food_value
+
+    def _attach(self, store, row: int) -> None:
+        """Привязка к строке хранилища и планирование гибели от голода."""
+        super()._attach(store, row)
+        store.schedule_death(row)
+
+    def _detach(self) -> None:
+        """Перенос значений из столбцов хранилища в объект перед отвязкой."""
+        self._hp = self.hp
+        self._max_hp = self.max_hp
+        self._speed = self.speed
+        self._food_value = self.food_value
+        super()._detach()
+
     def __str__(self) -> str:
         """Строковое представление существа с номером."""
         return f"{self.__class__.__name__}{self._number}"
@@ -67,57 +169,108 @@ class Creature(Entity):
             self.speed
         )
 
-    def make_move(self, board) -> List[Tuple[str, str]]:
+    def plan_move(self, board) -> MovePlan:
+        """Расчет доступных ходов и цели для последующего make_move."""
+        self.update_available_moves(board)
+        target = self.find_target(board)
+        return MovePlan(
+            self.coordinates, self.available_moves, target,
+            target.coordinates if target is not None else None
+        )
+
+    def decide_move(self, board, plan: Optional[MovePlan] = None) -> MoveDecision:
         """
-        Базовая логика перемещения существа.
+        Выбор действия на ход без изменения доски.
+        
+        Args:
+            board: Игровая доска
+            plan: Актуальный план из фазы планирования; без него ходы и цель рассчитываются заново
+            
+        Returns:
+            MoveDecision: Ожидание, взаимодействие с целью или перемещение в клетку
         """
         self._performed_action = None
-        self.update_available_moves(board)
+        if plan is None:
+            self.update_available_moves(board)
+        else:
+            self.available_moves = plan.available_moves
         
         # Если нет доступных ходов
         if not self.available_moves:
-            self.planned_action = ("Ожидает", "нет доступных ходов")
-            board.update_entity_state(self)
-            return [self.planned_action]
+            return self._wait(board, ("Ожидает", "нет доступных ходов"))
         
         # Если существу не нужна еда
         if not self.needs_food():
-            self.planned_action = ("Отдыхает", f"здоровье {self.hp}/{self.max_hp}")
-            board.update_entity_state(self)
-            return [self.planned_action]
+            return self._wait(board, ("Отдыхает", f"здоровье {self.hp}/{self.max_hp}"))
         
         # Ищем цель
-        target = self.find_target(board)
+        target = self.find_target(board) if plan is None else plan.target
         if not target:
-            self.planned_action = ("Ищет цель", "но не находит")
-            board.update_entity_state(self)
-            return [self.planned_action]
+            return self._wait(board, ("Ищет цель", "но не находит"))
         
         # Если цель рядом, планируем взаимодействие
         if self._can_interact_with_target(target):
             self.planned_action = self._get_planned_interaction(target)
             board.update_entity_state(self)
-            
-            success, actions = self.interact_with_target(board, target)
-            if success:
-                self._performed_action = actions[0] if actions else None
-                return actions
-            return [("Неудачное взаимодействие", "цель избежала взаимодействия")]
+            return MoveDecision(MoveDecision.INTERACT, target, None)
         
         # Если не можем взаимодействовать, планируем движение к цели
         best_move = self._find_best_move(target.coordinates)
         if best_move:
             self.planned_action = ("Планирует передвижение", f"к {target.__class__.__name__}({target.coordinates.x}, {target.coordinates.y})")
             board.update_entity_state(self)
-            
-            if board.move_entity(self.coordinates, best_move):
-                self._performed_action = ("Переместился", f"на ({best_move.x}, {best_move.y})")
-                return [self._performed_action]
+            return MoveDecision(MoveDecision.MOVE, target, best_move)
+        
+        return self._wait(board, ("Не может двигаться", "путь заблокирован"))
+
+    def _wait(self, board, planned_action: Tuple[str, str]) -> MoveDecision:
+        self.planned_action = planned_action
+        board.update_entity_state(self)
+        return MoveDecision(MoveDecision.WAIT, None, None)
+
+    def perform_interaction(self, board, target) -> List[Tuple]:
+        """Взаимодействие с целью, выбранной в decide_move."""
+        success, actions = self.interact_with_target(board, target)
+        if success:
+            self._performed_action = actions[0] if actions else None
+            return actions
+        return [("Неудачное взаимодействие", "цель избежала взаимодействия")]
+
+    def finish_move(self, board, destination: Coordinates, moved: bool) -> List[Tuple]:
+        """
+        Итог перемещения, выбранного в decide_move.
+
+        Детали успешного перемещения - клетка назначения, а не текст: текст
+        строится format_event из события MOVED, только если журнал читается.
         
+        Args:
+            board: Игровая доска
+            destination: Клетка назначения
+            moved: Выполнено ли перемещение
+        """
+        if moved:
+            self._performed_action = ("Переместился", destination)
+            return [self._performed_action]
         self.planned_action = ("Не может двигаться", "путь заблокирован")
         board.update_entity_state(self)
         return [self.planned_action]
 
+    def make_move(self, board, plan: Optional[MovePlan] = None) -> List[Tuple]:
+        """
+        Базовая логика перемещения существа (выбор и немедленное выполнение действия).
+        
+        Args:
+            board: Игровая доска
+            plan: Актуальный план из фазы планирования; без него ходы и цель рассчитываются заново
+        """
+        decision = self.decide_move(board, plan)
+        if decision.kind == MoveDecision.INTERACT:
+            return self.perform_interaction(board, decision.target)
+        if decision.kind == MoveDecision.MOVE:
+            moved = board.move_entity(self.coordinates, decision.destination)
+            return self.finish_move(board, decision.destination, moved)
+        return [self.planned_action]
+
     def _find_best_move(self, target_coords: Coordinates) -> Optional[Coordinates]:
         """
         Находит лучший ход в направлении цели.
@@ -184,8 +337,17 @@ class Creature(Entity):
         """
         if self.food_value is None:
             return True
-        # Существо ищет пищу, если его текущее HP меньше чем (максимальное HP - питательность пищи)
-        return self.hp < (self.max_hp - self.food_value)
+        return self.hp < self.hunger_threshold()
+
+    def hunger_threshold(self) -> int:
+        """
+        Здоровье, ниже которого существу нужна пища (условие needs_food).
+
+        По этому же порогу хранилище планирует пробуждение сытого существа.
+        По умолчанию существо ищет пищу, если его HP меньше чем
+        (максимальное HP - питательность пищи).
+        """
+        return self.max_hp - self.food_value
 
     def _get_planned_interaction(self, target) -> Tuple[str, str]:
         """
@@ -4,10 +4,33 @@ from ..core.game_state import EntityState
 
 
 class Entity(ABC):
+    # Атрибуты хранятся в слотах: на больших полях миллионы сущностей, и __dict__ у каждой слишком дорог
+    __slots__ = ('coordinates', 'entity_id', '_store', '_row')
+
+    # Код типа сущности для компактных бинарных форматов (снапшоты)
+    type_code = 0
+
     def __init__(self, coordinates: Coordinates):
         self.coordinates = coordinates
         self.entity_id = None  # Будет установлен при размещении на доске
+        # Строка хранилища доски (EntityStore), пока сущность размещена на доске
+        self._store = None
+        self._row = -1
 
     def get_state(self) -> EntityState:
         """Получение текущего состояния сущности."""
         return EntityState(coordinates=self.coordinates)
+
+    def _column_values(self) -> tuple:
+        """Значения (hp, max_hp, speed, food_value) для столбцов хранилища."""
+        return 0, 0, 0, None
+
+    def _attach(self, store, row: int) -> None:
+        """Привязка сущности к строке хранилища доски."""
+        self._store = store
+        self._row = row
+
+    def _detach(self) -> None:
+        """Отвязка от хранилища при удалении с доски."""
+        self._store = None
+        self._row = -1
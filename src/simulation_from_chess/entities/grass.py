@@ -3,6 +3,10 @@ from ..entities.entity import Entity
 
 
 class Grass(Entity):
+    __slots__ = ()
+
+    type_code = 1
+
     def __init__(self, coordinates: Coordinates):
         super().__init__(coordinates)
 
@@ -8,6 +8,10 @@ from ..utils.distance_calculator import DistanceCalculator
 
 
 class Herbivore(Creature):
+    __slots__ = ()
+
+    type_code = 3
+
     def __init__(self, coordinates: Coordinates):
         config = CREATURE_CONFIG['herbivore']
         super().__init__(
@@ -39,9 +43,9 @@ class Herbivore(Creature):
         """Описание планируемого поедания травы."""
         return ("Планирует съесть", f"траву на ({target.coordinates.x}, {target.coordinates.y})")
 
-    def needs_food(self) -> bool:
-        """Проверка, нужна ли еда существу."""
-        return self.hp < self.max_hp
+    def hunger_threshold(self) -> int:
+        """Травоядному нужна еда, если здоровье не максимальное."""
+        return self.max_hp
 
     def find_target(self, board):
         """
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
     from ..core.board import Board
 
 class Predator(Creature):
+    __slots__ = ('attack_damage', 'hunt_success_chance', '_force_hunt_result')
+
+    type_code = 4
+
     def __init__(self, coordinates: Coordinates):
         config = CREATURE_CONFIG['predator']
         super().__init__(
@@ -112,13 +116,7 @@ class Predator(Creature):
             return herbivore_targets[0][0]
         return None
 
-    def needs_food(self) -> bool:
-        """
-        Проверяет, нужно ли хищнику искать пищу.
-        
-        Returns:
-            bool: True если хищнику нужна пища, False в противном случае
-        """
-        # Хищник всегда ищет пищу, если его здоровье не максимальное
-        return self.hp < self.max_hp
+    def hunger_threshold(self) -> int:
+        """Хищник всегда ищет пищу, если его здоровье не максимальное."""
+        return self.max_hp
 
@@ -3,6 +3,10 @@ from ..entities.entity import Entity
 
 
 class Stone(Entity):
+    __slots__ = ()
+
+    type_code = 2
+
     def __init__(self, coordinates: Coordinates):
         super().__init__(coordinates)
 
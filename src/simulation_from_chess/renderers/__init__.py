@@ -1,3 +1,6 @@
 from .board_console_renderer import BoardConsoleRenderer
+from .diff_console_renderer import DiffConsoleRenderer
+from .viewport_renderer import ViewportRenderer
+from .frame_exporter import FrameExporter
 
-__all__ = ['BoardConsoleRenderer']
\ No newline at end of file
+__all__ = ['BoardConsoleRenderer', 'DiffConsoleRenderer', 'ViewportRenderer', 'FrameExporter']
\ No newline at end of file
@@ -0,0 +1,36 @@
+from typing import Dict, Tuple
+
+from .board_console_renderer import BoardConsoleRenderer
+
+
+class CachedCellRenderer(BoardConsoleRenderer):
+    """
+    Основа рендереров, собирающих кадр из готовых строк клеток.
+
+    Клетки имеют фиксированную ширину CELL_WIDTH колонок (символы
+    сущностей - широкие эмодзи), поэтому пустая клетка - обычные пробелы.
+    Строка клетки (цвет фона, символ, сброс цвета) строится один раз для
+    каждого сочетания типа сущности и цвета клетки.
+    """
+
+    CELL_WIDTH = 4
+    EMPTY_CELL = " " * CELL_WIDTH
+    CLEAR_SCREEN = "\u001B[H\u001B[2J"
+
+    def __init__(self):
+        self._cells: Dict[Tuple[int, bool], str] = {}  # (код, темная клетка) -> строка клетки
+
+    @staticmethod
+    def _code(entity) -> int:
+        """Код содержимого клетки: 0 - пусто, иначе код типа сущности + 1."""
+        return 0 if entity is None else type(entity).type_code + 1
+
+    def _cell(self, entity, dark: bool) -> str:
+        """Строка клетки с цветом фона; строки кэшируются по типу сущности и цвету клетки."""
+        key = (self._code(entity), dark)
+        cell = self._cells.get(key)
+        if cell is None:
+            background = self.ANSI_BLACK_SQUARE_BACKGROUND if dark else self.ANSI_WHITE_SQUARE_BACKGROUND
+            symbol = self.EMPTY_CELL if entity is None else f" {self.select_ascii_sprite_for_entity(entity)} "
+            cell = self._cells[key] = f"{background}{symbol}{self.ANSI_RESET}"
+        return cell
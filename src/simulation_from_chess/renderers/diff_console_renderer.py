@@ -0,0 +1,139 @@
+import os
+import shutil
+import sys
+from typing import List, Optional, TextIO
+
+from ..core.coordinates import Coordinates
+from .cached_cell_renderer import CachedCellRenderer
+
+
+class DiffConsoleRenderer(CachedCellRenderer):
+    """
+    Отрисовка поля с перерисовкой только изменившихся клеток.
+
+    Первый кадр (и кадр после смены доски, ее массового изменения или
+    invalidate) очищает экран и выводит поле целиком. Дальше рендерер
+    читает журнал изменений доски и для клеток, содержимое которых
+    отличается от запомненного кадра, выводит позиционирование курсора и
+    новую клетку. Кадр уходит в поток одной записью. После кадра курсор
+    ставится под поле, а остаток экрана очищается, чтобы вывод после
+    поля (логи) не накапливался.
+
+    Изменения выводятся по абсолютным строкам экрана, поэтому поле должно
+    оставаться в верхней строке. Если поле не помещается на экран, каждый
+    кадр выводится целиком. Текст, выведенный под полем после кадра, нужно
+    передать в report_output_below: если вместе с ним поле не помещается на
+    экран, экран прокрутился, и следующий кадр выводится целиком (при другой
+    прокрутке нужно вызвать invalidate).
+    """
+
+    CLEAR_BELOW = "\u001B[J"
+
+    def __init__(self, stream: Optional[TextIO] = None, terminal_size: Optional[os.terminal_size] = None):
+        """
+        Args:
+            stream: Поток вывода (по умолчанию sys.stdout на момент отрисовки)
+            terminal_size: Размер экрана (по умолчанию shutil.get_terminal_size() на момент отрисовки)
+        """
+        super().__init__()
+        self.stream = stream
+        self.terminal_size = terminal_size
+        self._board = None
+        self._journal = None
+        self._bulk_mutation_count = 0
+        self._frame = bytearray()  # Код содержимого клеток последнего кадра (0 - пусто)
+        self._label_width = 0
+
+    def invalidate(self) -> None:
+        """Следующий кадр будет выведен целиком."""
+        self._release_board()
+
+    def _terminal_size(self) -> os.terminal_size:
+        return self.terminal_size if self.terminal_size is not None else shutil.get_terminal_size()
+
+    def report_output_below(self, text: str) -> None:
+        """
+        Учет текста, выведенного под полем после кадра.
+
+        Если поле вместе с текстом (с учетом переноса длинных строк) и строкой
+        курсора не помещается на экран, экран прокрутился, и следующий кадр
+        выводится целиком.
+        """
+        if self._board is None:
+            return
+        columns, lines = self._terminal_size()
+        rows = sum(max(1, -(-len(line) // columns)) for line in text.splitlines())
+        # Курсор под полем стоит в строке height + 3, после текста он на rows строк ниже
+        if self._board.height + 3 + rows > lines:
+            self.invalidate()
+
+    def _release_board(self) -> None:
+        if self._board is not None:
+            self._board.close_change_journal(self._journal)
+        self._board = None
+        self._journal = None
+
+    def render(self, board) -> str:
+        """
+        Отрисовка кадра.
+
+        Returns:
+            str: Выведенные символы (полный кадр или только изменения)
+        """
+        if (board is not self._board or board.bulk_mutation_count != self._bulk_mutation_count
+                or board.height + 3 > self._terminal_size().lines):
+            output = self._render_full(board)
+        else:
+            output = self._render_changes(board)
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(output)
+        stream.flush()
+        return output
+
+    def _cursor_below(self, board) -> str:
+        # Под полем: строки поля, строка номеров столбцов и пустая строка
+        return f"\u001B[{board.height + 3};1H{self.CLEAR_BELOW}"
+
+    def _render_full(self, board) -> str:
+        self._release_board()
+        width, height = board.width, board.height
+        self._label_width = len(str(height))
+        frame = bytearray(width * height)
+        entities = board.entities
+        parts: List[str] = [self.CLEAR_SCREEN]
+        for y in range(height, 0, -1):
+            parts.append(f"{y:{self._label_width}d} ")
+            for x in range(1, width + 1):
+                entity = entities.get(Coordinates(x, y))
+                frame[(y - 1) * width + x - 1] = self._code(entity)
+                parts.append(self._cell(entity, (x + y) % 2 == 0))
+            parts.append("\n")
+        parts.append(" " * (self._label_width + 1))
+        parts.append("".join(f"{x:^{self.CELL_WIDTH}}" for x in range(1, width + 1)))
+        parts.append("\n")
+        parts.append(self._cursor_below(board))
+
+        self._frame = frame
+        self._board = board
+        self._journal = board.open_change_journal()
+        self._bulk_mutation_count = board.bulk_mutation_count
+        return "".join(parts)
+
+    def _render_changes(self, board) -> str:
+        width, height = board.width, board.height
+        frame, entities = self._frame, board.entities
+        column_offset = self._label_width + 2  # Первая колонка клетки x=1 (нумерация с 1)
+        parts: List[str] = []
+        for coordinates in self._journal:
+            x, y = coordinates.x, coordinates.y
+            index = (y - 1) * width + x - 1
+            entity = entities.get(coordinates)
+            code = self._code(entity)
+            if frame[index] == code:
+                continue  # Клетка вернулась к содержимому прошлого кадра
+            frame[index] = code
+            parts.append(f"\u001B[{height - y + 1};{column_offset + (x - 1) * self.CELL_WIDTH}H")
+            parts.append(self._cell(entity, (x + y) % 2 == 0))
+        self._journal.clear()
+        parts.append(self._cursor_below(board))
+        return "".join(parts)
@@ -0,0 +1,224 @@
+import queue
+import struct
+import threading
+import zlib
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from ..entities.entity import Entity
+from ..entities.grass import Grass
+from ..entities.herbivore import Herbivore
+from ..entities.predator import Predator
+from ..entities.stone import Stone
+
+# Коды клеток кадра: 0 и 1 - светлая и темная пустая клетка, сущность - type_code + 2
+_EMPTY_LIGHT, _EMPTY_DARK, _ENTITY_OFFSET = 0, 1, 2
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+class FrameExporter:
+    """
+    Запись кадров поля в файл в фоновом потоке.
+
+    На каждом k-м ходу (every) из основного потока копируются столбцы
+    хранилища доски (коды типов и координаты) - три копирования памяти, -
+    и снимок ставится в ограниченную очередь. Фоновый поток раскладывает
+    коды типов по сетке поверх шахматного фона, переводит сетку в RGB
+    тремя вызовами bytes.translate (по таблице палитры на канал), при
+    необходимости увеличивает кадр в scale раз и дописывает его в файл.
+
+    Форматы: 'ppm' - поток кадров P6 подряд, 'png' - поток PNG подряд
+    (оба читаются, например, ffmpeg -f image2pipe), 'raw' - кадры RGB24
+    без заголовков (ffmpeg -f rawvideo -pix_fmt rgb24 -s ШxВ). Верхняя
+    строка кадра - верхняя строка поля (y = height).
+    """
+
+    FORMAT_PPM = 'ppm'
+    FORMAT_PNG = 'png'
+    FORMAT_RAW = 'raw'
+    # Цвета палитры (RGB): пустые клетки как фон консоли, сущности по типу
+    EMPTY_COLORS = ((235, 235, 235), (118, 118, 118))
+    ENTITY_COLORS: Dict[type, Tuple[int, int, int]] = {
+        Entity: (255, 0, 255),
+        Grass: (70, 170, 60),
+        Stone: (40, 40, 48),
+        Herbivore: (235, 190, 80),
+        Predator: (205, 50, 35),
+    }
+
+    def __init__(self, path: str, frame_format: str = FORMAT_PPM, every: int = 1, scale: int = 1,
+                 queue_size: int = 8, png_level: int = 6):
+        """
+        Args:
+            path: Путь к файлу кадров (перезаписывается)
+            frame_format: 'ppm', 'png' или 'raw'
+            every: Записывать каждый every-й ход
+            scale: Размер клетки в пикселях
+            queue_size: Сколько кадров может ждать записи (при заполнении ход ждет)
+            png_level: Уровень сжатия zlib для PNG
+
+        Raises:
+            ValueError: Если формат неизвестен или every, scale, queue_size меньше 1
+        """
+        if frame_format not in (self.FORMAT_PPM, self.FORMAT_PNG, self.FORMAT_RAW):
+            raise ValueError(f"Неизвестный формат кадров: {frame_format}")
+        for name, value in (('every', every), ('scale', scale), ('queue_size', queue_size)):
+            if value < 1:
+                raise ValueError(f"Параметр {name} должен быть не меньше 1, получено: {value}")
+        self.path = path
+        self.frame_format = frame_format
+        self.every = every
+        self.scale = scale
+        self.png_level = png_level
+        self.frames = 0  # Кадров записано в файл
+        self.frame_size: Optional[Tuple[int, int]] = None  # Размер кадра в пикселях после первого кадра
+        palette = [self.EMPTY_COLORS[0], self.EMPTY_COLORS[1]] + [(0, 0, 0)] * 254
+        for entity_class, color in self.ENTITY_COLORS.items():
+            palette[entity_class.type_code + _ENTITY_OFFSET] = color
+        # Таблицы bytes.translate: код клетки -> яркость канала
+        self._channels = [bytes(color[channel] for color in palette) for channel in range(3)]
+        self._backgrounds: Dict[Tuple[int, int], bytes] = {}
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._file = open(path, 'wb')
+        self._thread = threading.Thread(target=self._run, name='frame-exporter', daemon=True)
+        self._thread.start()
+
+    def capture(self, board, turn: int) -> bool:
+        """
+        Постановка кадра хода turn в очередь записи, если turn кратен every.
+
+        Returns:
+            bool: Поставлен ли кадр
+
+        Raises:
+            ValueError: Если экспорт закрыт
+        """
+        if self._closed:
+            raise ValueError("Экспорт кадров закрыт")
+        if turn % self.every:
+            return False
+        store = board.store
+        self._queue.put((
+            board.width, board.height,
+            store.type_codes.tobytes(), store.xs.tobytes(), store.ys.tobytes()
+        ))
+        return True
+
+    def _background(self, width: int, height: int) -> bytes:
+        """Коды пустых клеток в шахматном порядке, строка за строкой от y = 1 (кэшируется по размеру)."""
+        background = self._backgrounds.get((width, height))
+        if background is None:
+            # Клетка темная, если x + y четно; в строке y первая клетка x = 1
+            rows = [bytes((_EMPTY_DARK if (x + y) % 2 == 0 else _EMPTY_LIGHT) for x in range(1, 3))
+                    for y in (1, 2)]
+            background = b''.join((rows[(y - 1) % 2] * ((width + 1) // 2))[:width] for y in range(1, height + 1))
+            self._backgrounds[(width, height)] = background
+        return background
+
+    def rasterize(self, width: int, height: int, type_codes: bytes, xs: bytes, ys: bytes) -> bytes:
+        """
+        RGB24 кадра по снимку столбцов хранилища.
+
+        Returns:
+            bytes: Пиксели построчно сверху вниз, по 3 байта на пиксель
+        """
+        cells = bytearray(self._background(width, height))
+        codes, columns, rows = array('b'), array('i'), array('i')
+        codes.frombytes(type_codes)
+        columns.frombytes(xs)
+        rows.frombytes(ys)
+        for code, x, y in zip(codes, columns, rows):
+            if code >= 0:
+                cells[(y - 1) * width + x - 1] = code + _ENTITY_OFFSET
+
+        scale = self.scale
+        lines: List[bytes] = []
+        for y in range(height, 0, -1):
+            line = cells[(y - 1) * width:y * width]
+            if scale > 1:
+                scaled = bytearray(width * scale)
+                for offset in range(scale):
+                    scaled[offset::scale] = line
+                line = scaled
+            lines.extend([bytes(line)] * scale)
+        indexed = b''.join(lines)
+
+        rgb = bytearray(len(indexed) * 3)
+        for channel, table in enumerate(self._channels):
+            rgb[channel::3] = indexed.translate(table)
+        return bytes(rgb)
+
+    def _encode(self, width: int, height: int, rgb: bytes) -> bytes:
+        if self.frame_format == self.FORMAT_RAW:
+            return rgb
+        if self.frame_format == self.FORMAT_PPM:
+            return b'P6\n%d %d\n255\n' % (width, height) + rgb
+        stride = width * 3
+        # Каждая строка PNG начинается с байта фильтра (0 - без фильтра)
+        filtered = b''.join(b'\x00' + rgb[start:start + stride] for start in range(0, len(rgb), stride))
+        return b''.join((
+            _PNG_SIGNATURE,
+            _png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)),
+            _png_chunk(b'IDAT', zlib.compress(filtered, self.png_level)),
+            _png_chunk(b'IEND', b''),
+        ))
+
+    def _run(self) -> None:
+        """Цикл фонового потока: растеризация, кодирование и запись кадров."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if self._error is None:
+                    width, height = item[0], item[1]
+                    size = (width * self.scale, height * self.scale)
+                    if self.frame_size is None:
+                        self.frame_size = size
+                    elif size != self.frame_size and self.frame_format != self.FORMAT_PNG:
+                        raise ValueError(f"Размер поля изменился: кадр {size[0]}x{size[1]} вместо "
+                                         f"{self.frame_size[0]}x{self.frame_size[1]}")
+                    self._file.write(self._encode(*size, self.rasterize(*item)))
+                    self.frames += 1
+            except BaseException as error:  # Ошибка передается в flush/close основного потока
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self) -> None:
+        """
+        Ожидание записи всех поставленных кадров.
+
+        Raises:
+            Exception: Ошибка растеризации или записи фонового потока
+        """
+        self._queue.join()
+        self._file.flush()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Запись оставшихся кадров, остановка фонового потока и закрытие файла."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        self._raise_error()
+
+    def __enter__(self) -> 'FrameExporter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,211 @@
+import sys
+from array import array
+from typing import Dict, List, Optional, TextIO, Tuple
+
+from ..core.coordinates import Coordinates
+from ..entities.grass import Grass
+from ..entities.herbivore import Herbivore
+from ..entities.predator import Predator
+from ..entities.stone import Stone
+from .cached_cell_renderer import CachedCellRenderer
+
+
+class ViewportRenderer(CachedCellRenderer):
+    """
+    Отрисовка окна поля вокруг выбранной точки или существа и мини-карты.
+
+    Окно - прямоугольник width x height клеток с центром в точке look_at
+    или на существе follow (пока оно на доске; после его исчезновения окно
+    остается на последней позиции), прижатый к краям поля. Стоимость кадра
+    окна зависит только от его размера.
+
+    Мини-карта делит поле на minimap_width x minimap_height блоков; символ
+    блока - преобладающий тип сущностей ('dominant') или плотность
+    заполнения ('density'). Символы строятся по счетчикам сущностей
+    каждого типа в блоках, которые один раз заполняются по списку
+    сущностей, а затем обновляются по журналу изменений доски, поэтому
+    стоимость не зависит от площади поля. Блоки, попадающие в окно,
+    выделяются инверсией цвета.
+    """
+
+    MODE_DOMINANT = 'dominant'
+    MODE_DENSITY = 'density'
+    ANSI_INVERSE = "\u001B[7m"
+    # Символы мини-карты по преобладающему типу: при равенстве выбирается тип раньше в списке
+    MINIMAP_SYMBOLS: List[Tuple[type, str]] = [(Predator, 'P'), (Herbivore, 'h'), (Grass, '"'), (Stone, '#')]
+    MINIMAP_EMPTY = '.'
+    DENSITY_SYMBOLS = ' .:-=+*#%@'
+    _TYPE_SLOTS = max(entity_class.type_code for entity_class, _ in MINIMAP_SYMBOLS) + 1
+
+    def __init__(self, width: int = 20, height: int = 20, minimap_width: int = 40, minimap_height: int = 20,
+                 minimap_mode: str = MODE_DOMINANT, stream: Optional[TextIO] = None):
+        """
+        Args:
+            width: Ширина окна в клетках
+            height: Высота окна в клетках
+            minimap_width: Ширина мини-карты в символах (0 - без мини-карты)
+            minimap_height: Высота мини-карты в символах
+            minimap_mode: 'dominant' или 'density'
+            stream: Поток вывода (по умолчанию sys.stdout на момент отрисовки)
+
+        Raises:
+            ValueError: Если размеры окна меньше 1, размеры мини-карты отрицательны
+                или режим мини-карты неизвестен
+        """
+        if width < 1 or height < 1:
+            raise ValueError(f"Размеры окна должны быть положительными, получено: {width}x{height}")
+        if minimap_width < 0 or minimap_height < 0:
+            raise ValueError(f"Размеры мини-карты не могут быть отрицательными, получено: {minimap_width}x{minimap_height}")
+        if minimap_mode not in (self.MODE_DOMINANT, self.MODE_DENSITY):
+            raise ValueError(f"Неизвестный режим мини-карты: {minimap_mode}")
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.minimap_width = minimap_width
+        self.minimap_height = minimap_height
+        self.minimap_mode = minimap_mode
+        self.stream = stream
+        self.center: Optional[Coordinates] = None  # None - центр поля
+        self.followed = None
+        # Счетчики мини-карты и отслеживаемая доска
+        self._board = None
+        self._journal = None
+        self._bulk_mutation_count = 0
+        self._occupied: Dict[Coordinates, int] = {}  # Занятые клетки -> код типа (для обновления по журналу)
+        self._counts = array('I')  # Блок * _TYPE_SLOTS + код типа -> количество сущностей
+        self._block_width = 1
+        self._block_height = 1
+        self._columns = 0
+        self._rows = 0
+
+    def look_at(self, coordinates: Coordinates) -> None:
+        """Центр окна в точке coordinates (слежение за существом прекращается)."""
+        self.followed = None
+        self.center = coordinates
+
+    def follow(self, entity) -> None:
+        """Центр окна на существе entity, пока оно на доске."""
+        self.followed = entity
+        self.center = entity.coordinates
+
+    def window(self, board) -> Tuple[int, int, int, int]:
+        """
+        Границы окна на поле.
+
+        Returns:
+            Tuple[int, int, int, int]: Левый x, нижний y, правый x, верхний y (включительно)
+        """
+        followed = self.followed
+        if followed is not None and board.get_entity(followed.coordinates) is followed:
+            self.center = followed.coordinates
+        center = self.center or Coordinates((board.width + 1) // 2, (board.height + 1) // 2)
+        width, height = min(self.width, board.width), min(self.height, board.height)
+        left = min(max(center.x - width // 2, 1), board.width - width + 1)
+        bottom = min(max(center.y - height // 2, 1), board.height - height + 1)
+        return left, bottom, left + width - 1, bottom + height - 1
+
+    def render(self, board) -> str:
+        """
+        Отрисовка окна и мини-карты одной записью в поток.
+
+        Returns:
+            str: Выведенные символы
+        """
+        left, bottom, right, top = self.window(board)
+        label_width = len(str(top))
+        entities = board.entities
+        parts: List[str] = [self.CLEAR_SCREEN]
+        for y in range(top, bottom - 1, -1):
+            parts.append(f"{y:{label_width}d} ")
+            for x in range(left, right + 1):
+                parts.append(self._cell(entities.get(Coordinates(x, y)), (x + y) % 2 == 0))
+            parts.append("\n")
+        parts.append(" " * (label_width + 1))
+        parts.append("".join(f"{x:^{self.CELL_WIDTH}}" for x in range(left, right + 1)))
+        parts.append("\n")
+        if self.minimap_width and self.minimap_height:
+            self._sync(board)
+            parts.append(f"\nМини-карта {board.width}x{board.height} (блок {self._block_width}x{self._block_height}):\n")
+            parts.extend(self._minimap_lines(board, (left, bottom, right, top)))
+
+        output = "".join(parts)
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(output)
+        stream.flush()
+        return output
+
+    def _block(self, coordinates: Coordinates) -> int:
+        return ((coordinates.y - 1) // self._block_height) * self._columns + (coordinates.x - 1) // self._block_width
+
+    def _sync(self, board) -> None:
+        """
+        Обновление счетчиков блоков по журналу изменений доски.
+
+        Первый вызов для доски (или после ее массового изменения) заполняет
+        счетчики по списку сущностей.
+        """
+        slots = self._TYPE_SLOTS
+        counts, occupied = self._counts, self._occupied
+        if board is not self._board or board.bulk_mutation_count != self._bulk_mutation_count:
+            if self._board is not None:
+                self._board.close_change_journal(self._journal)
+            self._block_width = -(-board.width // min(self.minimap_width, board.width))
+            self._block_height = -(-board.height // min(self.minimap_height, board.height))
+            # Блоков может понадобиться меньше запрошенного, если размер не делится нацело
+            self._columns = -(-board.width // self._block_width)
+            self._rows = -(-board.height // self._block_height)
+            counts = self._counts = array('I', bytes(4 * self._columns * self._rows * slots))
+            occupied = self._occupied = {}
+            for coordinates, entity in board.entities.items():
+                code = type(entity).type_code
+                occupied[coordinates] = code
+                counts[self._block(coordinates) * slots + code] += 1
+            self._board = board
+            self._journal = board.open_change_journal()
+            self._bulk_mutation_count = board.bulk_mutation_count
+            return
+
+        entities = board.entities
+        for coordinates in self._journal:
+            block = self._block(coordinates) * slots
+            old = occupied.pop(coordinates, None)
+            if old is not None:
+                counts[block + old] -= 1
+            entity = entities.get(coordinates)
+            if entity is not None:
+                code = type(entity).type_code
+                occupied[coordinates] = code
+                counts[block + code] += 1
+        self._journal.clear()
+
+    def _minimap_lines(self, board, window: Tuple[int, int, int, int]) -> List[str]:
+        """Строки мини-карты сверху вниз; блоки окна выделены инверсией."""
+        slots, counts = self._TYPE_SLOTS, self._counts
+        block_width, block_height = self._block_width, self._block_height
+        left, bottom, right, top = window
+        window_columns = range((left - 1) // block_width, (right - 1) // block_width + 1)
+        window_rows = range((bottom - 1) // block_height, (top - 1) // block_height + 1)
+        symbols = [(entity_class.type_code, symbol) for entity_class, symbol in self.MINIMAP_SYMBOLS]
+        density = self.DENSITY_SYMBOLS
+        lines = []
+        for row in range(self._rows - 1, -1, -1):
+            # Последние блоки строки и столбца могут быть неполными
+            cells_high = min(block_height, board.height - row * block_height)
+            line = []
+            for column in range(self._columns):
+                base = (row * self._columns + column) * slots
+                if self.minimap_mode == self.MODE_DENSITY:
+                    cells = cells_high * min(block_width, board.width - column * block_width)
+                    total = sum(counts[base:base + slots])
+                    symbol = density[min(len(density) - 1, -(-total * (len(density) - 1) // cells))]
+                else:
+                    best, symbol = 0, self.MINIMAP_EMPTY
+                    for code, candidate in symbols:
+                        if counts[base + code] > best:
+                            best, symbol = counts[base + code], candidate
+                if row in window_rows and column in window_columns:
+                    symbol = f"{self.ANSI_INVERSE}{symbol}{self.ANSI_RESET}"
+                line.append(symbol)
+            line.append("\n")
+            lines.append("".join(line))
+        return lines
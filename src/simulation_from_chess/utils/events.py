@@ -0,0 +1,40 @@
+from enum import IntEnum
+from typing import Any, Tuple
+
+
+class EventCode(IntEnum):
+    """Коды событий журнала. В комментарии - содержимое полезной нагрузки события."""
+    ACTION = 0  # action_type, details: готовые строки действия
+    SYSTEM = 1  # action_type, details: системное сообщение (сущность None)
+    MOVED = 2  # old_x, old_y, new_x, new_y
+    KILLED = 3  # action_type, details, killer: смерть от другого существа
+    STARVED = 4  # x, y
+    DIED = 5  # x, y
+    SPAWNED = 6  # x, y
+
+
+# Событие: (код, сущность или None, полезная нагрузка)
+Event = Tuple[EventCode, Any, Tuple]
+
+
+def format_event(code: EventCode, payload: Tuple) -> Tuple[str, str]:
+    """
+    Текст события в виде (тип действия, детали).
+
+    Args:
+        code: Код события
+        payload: Полезная нагрузка события
+
+    Returns:
+        Tuple[str, str]: Тип действия и детали для записи в журнал
+    """
+    if code == EventCode.MOVED:
+        old_x, old_y, new_x, new_y = payload
+        return "Переместился", f"с ({old_x}, {old_y}) на ({new_x}, {new_y})"
+    if code == EventCode.STARVED:
+        return "Погиб", f"от голода на координатах ({payload[0]}, {payload[1]})"
+    if code == EventCode.DIED:
+        return "Погиб", f"на координатах ({payload[0]}, {payload[1]})"
+    if code == EventCode.SPAWNED:
+        return "Появилась", f"на координатах ({payload[0]}, {payload[1]})"
+    return payload[0], payload[1]
@@ -0,0 +1,268 @@
+import json
+import queue
+import struct
+import threading
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from .events import Event, EventCode
+
+# Заголовок двоичного журнала: сигнатура и версия формата
+BINARY_MAGIC = b'SLOG'
+BINARY_VERSION = 1
+_HEADER = struct.Struct('<4sH')
+# Запись события: ход, код события, идентификатор сущности (-1 - нет),
+# код типа сущности (0xFF - нет), количество полей нагрузки
+_RECORD = struct.Struct('<IBiBB')
+_INT = struct.Struct('<q')
+_LENGTH = struct.Struct('<H')
+_ENTITY = struct.Struct('<i')
+_NO_TYPE = 0xFF
+
+
+def _entity_id(entity) -> int:
+    entity_id = getattr(entity, 'entity_id', None)
+    return -1 if entity_id is None else entity_id
+
+
+def _encode_field(value: Any) -> bytes:
+    """Поле нагрузки двоичного журнала: тег и значение (сущности записываются идентификатором)."""
+    if isinstance(value, int):
+        return b'i' + _INT.pack(value)
+    if isinstance(value, str):
+        data = value.encode('utf-8')
+        return b's' + _LENGTH.pack(len(data)) + data
+    return b'e' + _ENTITY.pack(_entity_id(value))
+
+
+def _json_field(value: Any) -> Any:
+    return value if isinstance(value, (int, str)) else _entity_id(value)
+
+
+class LogSink:
+    """
+    Запись событий журнала в файл в фоновом потоке.
+
+    Логгер передает события хода одним пакетом (submit); пакеты ставятся в
+    ограниченную очередь, а фоновый поток сериализует их и пишет в файл
+    крупными блоками: все пакеты, накопившиеся в очереди, но не больше
+    batch_bytes за одну запись. Ход не ждет диска, пока очередь не
+    заполнена; при заполненной очереди политика 'block' останавливает ход
+    до освобождения места (обратное давление), а 'drop' отбрасывает пакет
+    и учитывает его события в dropped.
+
+    Форматы: 'jsonl' - по объекту на строку с полями turn, event, entity,
+    type и payload; 'binary' - заголовок BINARY_MAGIC и упакованные записи,
+    читаемые read_binary_log.
+    """
+
+    FORMAT_JSONL = 'jsonl'
+    FORMAT_BINARY = 'binary'
+    POLICY_BLOCK = 'block'
+    POLICY_DROP = 'drop'
+
+    def __init__(self, path: str, log_format: str = FORMAT_JSONL, policy: str = POLICY_BLOCK,
+                 queue_size: int = 64, batch_bytes: int = 1 << 20):
+        """
+        Args:
+            path: Путь к файлу журнала (перезаписывается)
+            log_format: 'jsonl' или 'binary'
+            policy: Поведение при заполненной очереди: 'block' или 'drop'
+            queue_size: Сколько пакетов ходов может ждать записи
+            batch_bytes: Размер блока, после которого данные записываются в файл
+
+        Raises:
+            ValueError: Если формат или политика неизвестны, или размеры меньше 1
+        """
+        if log_format not in (self.FORMAT_JSONL, self.FORMAT_BINARY):
+            raise ValueError(f"Неизвестный формат журнала: {log_format}")
+        if policy not in (self.POLICY_BLOCK, self.POLICY_DROP):
+            raise ValueError(f"Неизвестная политика переполнения очереди: {policy}")
+        if queue_size < 1:
+            raise ValueError(f"Размер очереди должен быть не меньше 1, получено: {queue_size}")
+        if batch_bytes < 1:
+            raise ValueError(f"Размер блока должен быть не меньше 1, получено: {batch_bytes}")
+        self.path = path
+        self.log_format = log_format
+        self.policy = policy
+        self.batch_bytes = batch_bytes
+        self.dropped = 0  # Событий отброшено из-за переполнения очереди
+        self.written = 0  # Событий записано в файл
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._file = open(path, 'wb')
+        if log_format == self.FORMAT_BINARY:
+            self._file.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION))
+        self._encode = self._encode_binary if log_format == self.FORMAT_BINARY else self._encode_jsonl
+        self._thread = threading.Thread(target=self._run, name='log-sink', daemon=True)
+        self._thread.start()
+
+    def submit(self, turn: int, events: Sequence[Event]) -> None:
+        """
+        Постановка событий хода в очередь записи.
+
+        Сущности событий сериализуются в фоновом потоке; используются только
+        неизменяемые поля (идентификатор и тип), поэтому они могут
+        продолжать меняться в следующих ходах.
+
+        Raises:
+            ValueError: Если журнал закрыт
+        """
+        if self._closed:
+            raise ValueError("Журнал закрыт")
+        if not events:
+            return
+        if self.policy == self.POLICY_BLOCK:
+            self._queue.put((turn, events))
+            return
+        try:
+            self._queue.put_nowait((turn, events))
+        except queue.Full:
+            self.dropped += len(events)
+
+    def _run(self) -> None:
+        """Цикл фонового потока: сбор пакетов из очереди в блоки и запись блоков в файл."""
+        get, task_done = self._queue.get, self._queue.task_done
+        while True:
+            item = get()
+            items = [item]
+            chunks: List[bytes] = []
+            size = 0
+            stop = False
+            while True:
+                if item is None:
+                    stop = True
+                elif self._error is None:
+                    try:
+                        chunk = self._encode(*item)
+                    except BaseException as error:  # Ошибка передается в flush/close основного потока
+                        self._error = error
+                    else:
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        self.written += len(item[1])
+                if stop or size >= self.batch_bytes:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                items.append(item)
+
+            if chunks and self._error is None:
+                try:
+                    self._file.write(b''.join(chunks))
+                    self._file.flush()
+                except BaseException as error:
+                    self._error = error
+            for _ in items:
+                task_done()
+            if stop:
+                return
+
+    @staticmethod
+    def _encode_jsonl(turn: int, events: Sequence[Event]) -> bytes:
+        dumps = json.dumps
+        lines = []
+        for code, entity, payload in events:
+            lines.append(dumps({
+                'turn': turn,
+                'event': code.name,
+                'entity': None if entity is None else _entity_id(entity),
+                'type': None if entity is None else type(entity).__name__,
+                'payload': [_json_field(value) for value in payload],
+            }, ensure_ascii=False))
+        lines.append('')
+        return '\n'.join(lines).encode('utf-8')
+
+    @staticmethod
+    def _encode_binary(turn: int, events: Sequence[Event]) -> bytes:
+        pack = _RECORD.pack
+        parts = []
+        for code, entity, payload in events:
+            if entity is None:
+                parts.append(pack(turn, code, -1, _NO_TYPE, len(payload)))
+            else:
+                parts.append(pack(turn, code, _entity_id(entity), type(entity).type_code, len(payload)))
+            parts.extend(_encode_field(value) for value in payload)
+        return b''.join(parts)
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self) -> None:
+        """
+        Ожидание записи всех поставленных в очередь событий.
+
+        Raises:
+            Exception: Ошибка сериализации или записи фонового потока
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Запись оставшихся событий, остановка фонового потока и закрытие файла."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)  # Признак остановки ставится независимо от политики
+        self._thread.join()
+        self._file.close()
+        self._raise_error()
+
+    def __enter__(self) -> 'LogSink':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def read_binary_log(path: str) -> Iterator[Tuple[int, EventCode, int, Optional[int], Tuple]]:
+    """
+    Чтение двоичного журнала.
+
+    Returns:
+        Iterator: Кортежи (ход, код события, идентификатор сущности или -1,
+            код типа сущности или None, нагрузка); сущности в нагрузке
+            заменены идентификаторами
+
+    Raises:
+        ValueError: Если файл не является двоичным журналом или обрезан
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Файл {path} не является двоичным журналом")
+    magic, version = _HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"Файл {path} не является двоичным журналом версии {BINARY_VERSION}")
+
+    offset = _HEADER.size
+    try:
+        while offset < len(data):
+            turn, code, entity_id, type_code, count = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            payload = []
+            for _ in range(count):
+                tag = data[offset:offset + 1]
+                offset += 1
+                if tag == b'i':
+                    payload.append(_INT.unpack_from(data, offset)[0])
+                    offset += _INT.size
+                elif tag == b's':
+                    (length,) = _LENGTH.unpack_from(data, offset)
+                    offset += _LENGTH.size
+                    if offset + length > len(data):
+                        raise struct.error("обрезанная строка")
+                    payload.append(data[offset:offset + length].decode('utf-8'))
+                    offset += length
+                elif tag == b'e':
+                    payload.append(_ENTITY.unpack_from(data, offset)[0])
+                    offset += _ENTITY.size
+                else:
+                    raise ValueError(f"Неизвестный тег поля {tag!r} в журнале {path}")
+            yield turn, EventCode(code), entity_id, None if type_code == _NO_TYPE else type_code, tuple(payload)
+    except struct.error as error:
+        raise ValueError(f"Журнал {path} обрезан") from error
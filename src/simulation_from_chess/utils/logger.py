@@ -1,19 +1,103 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set
 from tabulate import tabulate
 from ..entities.creature import Creature
+from .events import Event, EventCode, format_event
 
 class Logger:
     def __init__(self):
         """Инициализация логгера."""
-        self.creatures_state = {}  # Словарь для хранения состояния и действий существ
-        self.system_logs = []      # Список для системных сообщений
+        self.enabled = True  # При False события не записываются (вызывающий код проверяет флаг до форматирования)
+        self.keep_text = True  # При False ведутся только приемники событий, без текстового журнала
+        # Строки таблицы существ: сущность -> последнее действие (здоровье и координаты читаются при выводе)
+        self._rows: Dict[Any, str] = {}
+        self._system_logs = []      # Список для системных сообщений
+        # Отслеживаемая доска: журнал ее изменений и клетки существ на момент последней синхронизации
+        self._board = None
+        self._journal: Optional[Set] = None
+        self._bulk_mutation_count = 0
+        self._cells: Dict[Any, Creature] = {}
+        self._unsynced: List[Any] = []  # Строки, созданные событиями после синхронизации
+        self._events: List[Event] = []  # События, еще не превращенные в текст
+        self._sinks = []  # Приемники событий (LogSink), получают события хода пакетом
+        self._outbox: List[Event] = []  # События текущего хода для приемников
+
+    @property
+    def creatures_state(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Состояние и последнее действие существ.
+
+        Словарь строится при чтении (накопленные события форматируются тогда
+        же); его изменение не влияет на логгер.
+        """
+        self._apply_events()
+        return {
+            str(entity): {
+                'type': entity.__class__.__name__,
+                'hp': getattr(entity, 'hp', 'N/A'),
+                'coordinates': getattr(entity, 'coordinates', None),
+                'action': action
+            }
+            for entity, action in self._rows.items()
+        }
+
+    @property
+    def system_logs(self) -> List[str]:
+        """Системные сообщения текущего хода."""
+        self._apply_events()
+        return self._system_logs
 
     def clear_logs(self) -> None:
         """Очистка логов текущего хода."""
-        self.system_logs.clear()
+        self._apply_events()
+        self._system_logs.clear()
         # Очищаем только действия, сохраняя базовую информацию о существах
-        for state in self.creatures_state.values():
-            state['action'] = ''
+        rows = self._rows
+        for entity in rows:
+            rows[entity] = ''
+
+    def emit(self, code: EventCode, entity, *payload) -> None:
+        """
+        Запись структурированного события без форматирования.
+
+        Текст события строится только при чтении журнала (creatures_state,
+        system_logs, print_logs). Горячий код проверяет logger.enabled до
+        вызова, чтобы при отключенном журнале не собирать полезную нагрузку.
+
+        Args:
+            code: Код события
+            entity: Сущность события (None - системное сообщение)
+            *payload: Полезная нагрузка (см. EventCode)
+        """
+        if self.enabled:
+            self._record((code, entity, payload))
+
+    def _record(self, event: Event) -> None:
+        if self.keep_text:
+            self._events.append(event)
+        if self._sinks:
+            self._outbox.append(event)
+
+    def add_sink(self, sink) -> None:
+        """
+        Подключение приемника событий.
+
+        Args:
+            sink: Объект с методом submit(turn, events), например LogSink
+        """
+        self._sinks.append(sink)
+
+    def end_turn(self, turn: int) -> None:
+        """
+        Передача событий хода приемникам одним пакетом.
+
+        Args:
+            turn: Номер завершенного хода
+        """
+        if not self._outbox:
+            return
+        events, self._outbox = self._outbox, []
+        for sink in self._sinks:
+            sink.submit(turn, events)
 
     def log_action(self, entity, action_type: str, details: str, killer=None) -> None:
         """
@@ -25,83 +109,148 @@ class Logger:
             details: Детали действия
             killer: Сущность, вызвавшая смерть (опционально)
         """
-        if entity is None:  # Системное сообщение
-            if isinstance(details, str) and "Размещен" in details and "creature" not in details.lower():
-                return  # Пропускаем логирование размещения не-существ
-            self.system_logs.append(f"{action_type}: {details}")
+        if not self.enabled:
             return
+        if entity is None:  # Системное сообщение
+            self._record((EventCode.SYSTEM, None, (action_type, details)))
+        elif killer:
+            self._record((EventCode.KILLED, entity, (action_type, details, killer)))
+        else:
+            self._record((EventCode.ACTION, entity, (action_type, details)))
 
-        entity_key = str(entity)
-        if entity_key not in self.creatures_state:
-            self.creatures_state[entity_key] = {
-                'type': entity.__class__.__name__,
-                'hp': getattr(entity, 'hp', 'N/A'),
-                'coordinates': getattr(entity, 'coordinates', None),
-                'action': ''
-            }
-
-        # Обновляем текущее состояние существа
-        self.creatures_state[entity_key].update({
-            'hp': getattr(entity, 'hp', 'N/A'),
-            'coordinates': getattr(entity, 'coordinates', None)
-        })
+    def _apply_events(self) -> None:
+        """Форматирование накопленных событий в системные сообщения и действия существ."""
+        if not self._events:
+            return
+        events, self._events = self._events, []
+        for code, entity, payload in events:
+            if code == EventCode.SYSTEM:
+                action_type, details = payload
+                if isinstance(details, str) and "Размещен" in details and "creature" not in details.lower():
+                    continue  # Пропускаем логирование размещения не-существ
+                self._system_logs.append(f"{action_type}: {details}")
+                continue
 
-        if killer:
-            action_text = f"{action_type} {details} (убит существом {killer})"
-        else:
-            if action_type == "Планирует":
-                if "Планирует движение" in details:
-                    action_text = details
-                elif "Не может двигаться" in details:
-                    action_text = "Не может двигаться: путь заблокирован"
-                elif "Отдыхает" in details:
-                    action_text = "Отдыхает"
-                elif "Цель не найдена" in details:
-                    action_text = "Цель не найдена"
-                else:
-                    action_text = f"{action_type}: {details}"
+            if entity not in self._rows:
+                self._unsynced.append(entity)
+            if code == EventCode.KILLED:
+                action_type, details, killer = payload
+                self._rows[entity] = f"{action_type} {details} (убит существом {killer})"
             else:
-                action_text = f"{action_type} {details}"
-        
-        self.creatures_state[entity_key]['action'] = action_text
+                self._rows[entity] = self._action_text(*format_event(code, payload))
+
+    @staticmethod
+    def _action_text(action_type: str, details: str) -> str:
+        if action_type == "Планирует":
+            if "Планирует движение" in details:
+                return details
+            elif "Не может двигаться" in details:
+                return "Не может двигаться: путь заблокирован"
+            elif "Отдыхает" in details:
+                return "Отдыхает"
+            elif "Цель не найдена" in details:
+                return "Цель не найдена"
+            return f"{action_type}: {details}"
+        return f"{action_type} {details}"
 
     def log_creatures_state(self, entities: dict) -> None:
         """
-        Обновление состояния существ.
+        Полное обновление состояния существ по словарю сущностей.
+
+        Отслеживание доски (sync_board) прекращается.
         
         Args:
             entities: Словарь сущностей на доске
         """
-        # Создаем новый словарь состояний для всех существ на доске
-        new_creatures_state = {}
-        
-        # Обновляем или добавляем новые состояния только для существ (Creature)
-        for entity in entities.values():
+        if not self.enabled or not self.keep_text:
+            return
+        self._untrack_board()
+        self._rebuild(entities)
+
+    def sync_board(self, board) -> None:
+        """
+        Обновление состояния существ доски.
+
+        Первый вызов для доски (и вызов после ее массового изменения)
+        перестраивает таблицу целиком и открывает журнал изменений доски.
+        Следующие вызовы обходят только клетки из журнала: добавляют
+        появившихся существ и удаляют строки исчезнувших (O(1) на каждое),
+        не трогая остальные строки.
+
+        Args:
+            board: Игровая доска
+        """
+        if not self.enabled or not self.keep_text:
+            return
+        if board is not self._board or board.bulk_mutation_count != self._bulk_mutation_count:
+            self._untrack_board()
+            self._rebuild(board.entities)
+            self._board = board
+            self._journal = board.open_change_journal()
+            self._bulk_mutation_count = board.bulk_mutation_count
+            self._cells = {
+                coordinates: entity for coordinates, entity in board.entities.items()
+                if isinstance(entity, Creature)
+            }
+            return
+
+        self._apply_events()
+        entities, rows, cells = board.entities, self._rows, self._cells
+        changed = self._journal
+        previous = []
+        for coordinates in changed:
+            entity = cells.pop(coordinates, None)
+            if entity is not None:
+                previous.append(entity)
+        for coordinates in changed:
+            entity = entities.get(coordinates)
             if isinstance(entity, Creature):
-                entity_key = str(entity)
-                # Сохраняем предыдущее действие, если оно было
-                previous_action = self.creatures_state.get(entity_key, {}).get('action', '')
-                
-                new_creatures_state[entity_key] = {
-                    'type': entity.__class__.__name__,
-                    'hp': entity.hp,
-                    'coordinates': entity.coordinates,
-                    'action': previous_action
-                }
-        
-        # Заменяем старый словарь состояний новым
-        self.creatures_state = new_creatures_state
+                cells[coordinates] = entity
+                if entity not in rows:
+                    rows[entity] = ''
+        changed.clear()
+        for entity in previous:
+            if entities.get(entity.coordinates) is not entity:
+                rows.pop(entity, None)
+        # Строки событий для сущностей не на доске (трава, убитые) живут до синхронизации
+        for entity in self._unsynced:
+            if not isinstance(entity, Creature) or entities.get(entity.coordinates) is not entity:
+                rows.pop(entity, None)
+        self._unsynced.clear()
+
+    def _untrack_board(self) -> None:
+        if self._board is not None:
+            self._board.close_change_journal(self._journal)
+        self._board = None
+        self._journal = None
+        self._cells = {}
 
-    def print_logs(self) -> None:
-        """Вывод всех логов в табличном формате."""
+    def _rebuild(self, entities: dict) -> None:
+        """Строки для всех существ словаря; действия сохраняются для уже известных существ."""
+        self._apply_events()
+        rows = self._rows
+        self._rows = {
+            entity: rows.get(entity, '')
+            for entity in entities.values() if isinstance(entity, Creature)
+        }
+        self._unsynced.clear()
+
+    def print_logs(self) -> str:
+        """
+        Вывод всех логов в табличном формате.
+
+        Returns:
+            str: Выведенный текст (рендерер учитывает его высоту под полем)
+        """
+        lines = []
         if self.system_logs:
-            print("\nСистемные сообщения:")
+            lines.append("\nСистемные сообщения:")
             for log in self.system_logs:
-                print(f"  {log}")
+                lines.append(f"  {log}")
             self.system_logs.clear()
 
         if self.creatures_state:
-            print("\nСостояние существ:")
+            lines.append("\nСостояние существ:")
             creatures_table = [
                 [
                     name,
@@ -112,8 +261,13 @@ class Logger:
                 ]
                 for name, state in self.creatures_state.items()
             ]
-            print(tabulate(
+            lines.append(tabulate(
                 creatures_table,
                 headers=['Существо', 'Тип', 'Здоровье', 'Координаты', 'Действие'],
                 tablefmt='grid'
-            ))
\ No newline at end of file
+            ))
+
+        output = "".join(f"{line}\n" for line in lines)
+        if output:
+            print(output, end="")
+        return output
\ No newline at end of file
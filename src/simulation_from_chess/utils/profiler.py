@@ -0,0 +1,183 @@
+import math
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class LatencyHistogram:
+    """
+    Потоковая гистограмма с логарифмическими корзинами.
+
+    Значения хранятся в корзинах с относительной погрешностью не больше 1/16,
+    поэтому память не зависит от числа измерений, а перцентили вычисляются
+    по накопленным счетчикам.
+    """
+    SUB_BUCKET_BITS = 5
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """
+        Добавление измерения.
+
+        Args:
+            value: Неотрицательное целое значение (например, наносекунды)
+        """
+        exponent = max(value.bit_length() - self.SUB_BUCKET_BITS, 0)
+        key = (exponent << self.SUB_BUCKET_BITS) + (value >> exponent)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        """
+        Оценка перцентиля сверху по границе корзины.
+
+        Args:
+            percent: Перцентиль от 0 до 100
+
+        Returns:
+            int: Значение перцентиля или 0, если измерений нет
+        """
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        mask = (1 << self.SUB_BUCKET_BITS) - 1
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                exponent = key >> self.SUB_BUCKET_BITS
+                mantissa = key & mask if exponent else key
+                return min(((mantissa + 1) << exponent) - 1, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, int]:
+        """Сводка по гистограмме: количество, сумма, p50, p95, p99, максимум."""
+        return {
+            'count': self.count,
+            'total': self.total,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+class TurnProfiler:
+    """
+    Профилировщик хода симуляции.
+
+    Собирает гистограммы длительности (в наносекундах) по стадиям хода:
+    каждому действию из turn_actions, рендереру и логгеру. Дополнительно
+    считает изменения доски и вызовы поиска пути за ход.
+    """
+    MUTATIONS_STAGE = 'board_mutations'
+    PATHFINDER_STAGE = 'pathfinder_calls'
+
+    def __init__(self, summary_interval: Optional[int] = None):
+        """
+        Args:
+            summary_interval: Печатать сводку каждые N ходов (None - не печатать)
+        """
+        self.summary_interval = summary_interval
+        self.timings: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, LatencyHistogram] = {}
+        self.turns = 0
+        self._board = None
+        self._last_mutations = 0
+        self._last_pathfinder_calls = 0
+
+    @contextmanager
+    def measure(self, stage: str):
+        """Замер длительности блока кода для указанной стадии."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter_ns() - start)
+
+    def record(self, stage: str, elapsed_ns: int) -> None:
+        """Добавление замера длительности стадии."""
+        histogram = self.timings.get(stage)
+        if histogram is None:
+            histogram = self.timings[stage] = LatencyHistogram()
+        histogram.record(elapsed_ns)
+
+    def end_turn(self, board) -> None:
+        """
+        Завершение хода: фиксация счетчиков доски и периодическая сводка.
+
+        Args:
+            board: Игровая доска, на которой выполнялся ход
+        """
+        if board is not self._board:
+            # Доска заменена (например, загружен снапшот) - начинаем отсчет заново
+            self._board = board
+            self._last_mutations = 0
+            self._last_pathfinder_calls = 0
+
+        mutations = board.mutation_count
+        pathfinder_calls = board.path_finder.call_count
+        self._record_counter(self.MUTATIONS_STAGE, mutations - self._last_mutations)
+        self._record_counter(self.PATHFINDER_STAGE, pathfinder_calls - self._last_pathfinder_calls)
+        self._last_mutations = mutations
+        self._last_pathfinder_calls = pathfinder_calls
+
+        self.turns += 1
+        if self.summary_interval and self.turns % self.summary_interval == 0:
+            print(self.format_summary())
+
+    def _record_counter(self, name: str, value: int) -> None:
+        histogram = self.counters.get(name)
+        if histogram is None:
+            histogram = self.counters[name] = LatencyHistogram()
+        histogram.record(value)
+
+    def get_stats(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        Получение накопленной статистики.
+
+        Returns:
+            Dict: {'timings': {стадия: сводка в нс}, 'counters': {счетчик: сводка за ход}}
+        """
+        return {
+            'timings': {stage: h.summary() for stage, h in self.timings.items()},
+            'counters': {name: h.summary() for name, h in self.counters.items()},
+        }
+
+    def reset(self) -> None:
+        """Сброс накопленной статистики."""
+        self.timings.clear()
+        self.counters.clear()
+        self.turns = 0
+
+    def format_summary(self) -> str:
+        """Текстовая сводка по стадиям хода."""
+        lines = [f"\n=== Профиль за {self.turns} ходов (мкс) ==="]
+        lines.append(f"{'Стадия':<24}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'всего':>12}")
+        for stage, histogram in self.timings.items():
+            lines.append(
+                f"{stage:<24}"
+                f"{histogram.percentile(50) / 1000:>10.1f}"
+                f"{histogram.percentile(95) / 1000:>10.1f}"
+                f"{histogram.percentile(99) / 1000:>10.1f}"
+                f"{histogram.max / 1000:>10.1f}"
+                f"{histogram.total / 1000:>12.1f}"
+            )
+        for name, histogram in self.counters.items():
+            lines.append(
+                f"{name:<24}"
+                f"{histogram.percentile(50):>10}"
+                f"{histogram.percentile(95):>10}"
+                f"{histogram.percentile(99):>10}"
+                f"{histogram.max:>10}"
+                f"{histogram.total:>12}"
+            )
+        return "\n".join(lines)